@@ -0,0 +1,80 @@
+"""
+benchmarks/client_construction.py
+
+This file measures how many Client instances can be built per second.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root, on each revision to compare):
+    python -m benchmarks.client_construction [--count N] [--repeat R]
+
+stdout is redirected to os.devnull while measuring, so the terminal speed
+does not skew results, but any write on the construction path still counts.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import timeit
+
+
+def measure(count: int, repeat: int) -> float:
+    """
+    Measures the construction rate of Client.
+    :param count: The number of clients built in each run.
+    :type count: int
+    :param repeat: The number of runs.
+    :type repeat: int
+    :return: The best rate, in clients per second.
+    :rtype: float
+    """
+    from org.acmsl.licdata import Client
+
+    def build():
+        for index in range(count):
+            Client(
+                email=f"client{index}@example.com",
+                address="Address",
+                contact="Contact",
+                phone="555-0100",
+                eventHistory=[],
+            )
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        best = min(timeit.repeat(build, number=1, repeat=repeat))
+
+    return count / best
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args(args)
+
+    rate = measure(options.count, options.repeat)
+
+    sys.stdout.write(f"Client construction: {rate:,.0f} instances/s\n")
+
+
+if __name__ == "__main__":
+    main()
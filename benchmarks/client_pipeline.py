@@ -0,0 +1,437 @@
+"""
+benchmarks/client_pipeline.py
+
+This file measures the throughput of the Client event-handling pipeline.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.client_pipeline [--events N] [--clients C]
+        [--mix create=5,update=30,find=60,delete=4,list=1] [--skew S]
+        [--seed SEED] [--allocation-sample A] [--label LABEL] [--json PATH]
+
+It drives a synthetic stream of events through the Client listeners,
+against an InMemoryClientRepo preloaded with C clients. Each event targets
+a live client chosen with a Zipf distribution of exponent S (0 is uniform),
+so that a few hot clients receive most of the events. Deleted clients are
+not targeted anymore, and the clients created afterwards take over their
+ranks, or get new, colder ones.
+
+It reports the events per second, the p50 and p99 latency of each kind of
+event, and the bytes allocated per event (the peak while handling it, and
+what remains allocated afterwards), measured on a separate sample of A
+events since tracing allocations slows everything down. With --json, the
+results are also written to PATH ("-" for the standard output), to compare
+them across releases.
+"""
+
+import argparse
+import asyncio
+import bisect
+import datetime
+import heapq
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+KINDS = ("create", "update", "find", "delete", "list")
+
+
+def parse_mix(text: str) -> dict:
+    """
+    Parses the ratios of each kind of event.
+    :param text: The ratios, i.e. "create=5,update=30,find=60,delete=4,list=1".
+    :type text: str
+    :return: The weight of each kind.
+    :rtype: Dict[str, float]
+    """
+    result = dict.fromkeys(KINDS, 0.0)
+    for item in text.split(","):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in result:
+            raise argparse.ArgumentTypeError(f"Unknown kind of event: {kind}")
+        result[kind] = float(weight)
+    if sum(result.values()) <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid mix: {text}")
+    return result
+
+
+def percentile(sortedValues: list, fraction: float) -> float:
+    """
+    Retrieves a percentile, by the nearest-rank method.
+    :param sortedValues: The values, sorted.
+    :type sortedValues: List[float]
+    :param fraction: The percentile, between 0 and 1.
+    :type fraction: float
+    :return: Such percentile, or 0 if there are no values.
+    :rtype: float
+    """
+    if not sortedValues:
+        return 0.0
+    return sortedValues[min(len(sortedValues) - 1, int(fraction * len(sortedValues)))]
+
+
+class EventStream:
+    """
+    Generates synthetic Client events, following the live clients.
+
+    Class name: EventStream
+
+    Responsibilities:
+        - Picks the kind of each event according to the mix.
+        - Picks the target among the live clients, with a Zipf distribution
+          over their ranks.
+        - Learns the ids of the clients created, and forgets the deleted ones.
+
+    Collaborators:
+        - org.acmsl.licdata.events.clients: The generated events.
+    """
+
+    def __init__(self, clientIds: list, mix: dict, skew: float, seed: int):
+        """
+        Creates a new EventStream instance.
+        :param clientIds: The ids of the preloaded clients, hottest first.
+        :type clientIds: List[str]
+        :param mix: The weight of each kind of event.
+        :type mix: Dict[str, float]
+        :param skew: The exponent of the Zipf distribution.
+        :type skew: float
+        :param seed: The seed of the random generator.
+        :type seed: int
+        """
+        # the client id of each rank, or None once deleted
+        self._ranks = list(clientIds)
+        self._vacant_ranks = []
+        self._live = len(clientIds)
+        self._skew = skew
+        self._random = random.Random(seed)
+        self._kinds = list(mix)
+        self._kind_weights = list(itertools.accumulate(mix.values()))
+        self._rank_weights = list(
+            itertools.accumulate(
+                1.0 / (rank**skew) for rank in range(1, len(clientIds) + 1)
+            )
+        )
+        self._new_emails = itertools.count(len(clientIds))
+
+    def _target(self) -> int:
+        """
+        Picks the rank of the target client, among the live ones.
+        :return: Such rank, or None if there are no live clients.
+        :rtype: Optional[int]
+        """
+        if self._live == 0:
+            return None
+        while True:
+            point = self._random.random() * self._rank_weights[-1]
+            rank = bisect.bisect(self._rank_weights, point)
+            if self._ranks[rank] is not None:
+                return rank
+
+    def _new_rank(self) -> int:
+        """
+        Picks the rank of a client about to be created: the hottest vacant
+        one, or a new one colder than all others.
+        :return: Such rank.
+        :rtype: int
+        """
+        if self._vacant_ranks:
+            return heapq.heappop(self._vacant_ranks)
+        self._ranks.append(None)
+        self._rank_weights.append(
+            self._rank_weights[-1] + 1.0 / (len(self._ranks) ** self._skew)
+            if self._rank_weights
+            else 1.0
+        )
+        return len(self._ranks) - 1
+
+    def next(self) -> tuple:
+        """
+        Generates the next event.
+        :return: The kind of event, the rank of its target, and the event.
+        :rtype: Tuple[str, int, pythoneda.shared.Event]
+        """
+        from org.acmsl.licdata.events.clients import (
+            DeleteClientRequested,
+            FindClientByIdRequested,
+            ListClientsRequested,
+            NewClientRequested,
+            UpdateClientRequested,
+        )
+
+        kind = self._random.choices(self._kinds, cum_weights=self._kind_weights)[0]
+        rank = None
+        if kind in ("update", "find", "delete"):
+            rank = self._target()
+            if rank is None:
+                kind = "create"
+        if kind == "create":
+            rank = self._new_rank()
+            index = next(self._new_emails)
+            event = NewClientRequested(
+                email=f"client-{index}@example.com",
+                address="Address",
+                contact="Contact",
+                phone="555",
+            )
+        elif kind == "update":
+            event = UpdateClientRequested(
+                entityId=self._ranks[rank],
+                address=f"Address {self._random.random()}",
+                contact="Contact",
+                phone="555",
+            )
+        elif kind == "find":
+            event = FindClientByIdRequested(entityId=self._ranks[rank])
+        elif kind == "delete":
+            event = DeleteClientRequested(entityId=self._ranks[rank])
+            self._ranks[rank] = None
+            self._live -= 1
+            heapq.heappush(self._vacant_ranks, rank)
+        else:
+            event = ListClientsRequested()
+        return kind, rank, event
+
+    def observe(self, kind: str, rank: int, outcome: list):
+        """
+        Learns the id of a created client, once its event has been handled.
+        :param kind: The kind of event.
+        :type kind: str
+        :param rank: The rank of its target.
+        :type rank: int
+        :param outcome: The events the listener produced.
+        :type outcome: List[pythoneda.shared.Event]
+        """
+        if kind != "create":
+            return
+        for event in outcome:
+            entity_id = getattr(event, "entity_id", None)
+            if entity_id is not None:
+                self._ranks[rank] = entity_id
+                self._live += 1
+                return
+        heapq.heappush(self._vacant_ranks, rank)
+
+
+def listeners() -> dict:
+    """
+    Retrieves the listener of each kind of event.
+    :return: Such listeners.
+    :rtype: Dict[str, Callable]
+    """
+    from org.acmsl.licdata import Client
+
+    return {
+        "create": Client.listen_NewClientRequested,
+        "update": Client.listen_UpdateClientRequested,
+        "find": Client.listen_FindClientByIdRequested,
+        "delete": Client.listen_DeleteClientRequested,
+        "list": Client.listen_ListClientsRequested,
+    }
+
+
+async def preload(count: int) -> list:
+    """
+    Creates the initial clients.
+    :param count: The number of clients.
+    :type count: int
+    :return: Their ids.
+    :rtype: List[str]
+    """
+    from org.acmsl.licdata import Client
+    from org.acmsl.licdata.events.clients import NewClientRequested
+
+    created = await Client.listen_NewClientRequested_in_batch(
+        [
+            NewClientRequested(email=f"client-{index}@example.com", address="Address")
+            for index in range(count)
+        ]
+    )
+    return [event.entity_id for event in created]
+
+
+async def measure_latencies(stream: EventStream, count: int) -> tuple:
+    """
+    Handles events of given stream, one after another, timing each of them.
+    :param stream: The stream of events.
+    :type stream: EventStream
+    :param count: The number of events.
+    :type count: int
+    :return: The seconds spent handling them, and the latencies (in seconds)
+    of each kind.
+    :rtype: Tuple[float, Dict[str, List[float]]]
+    """
+    handlers = listeners()
+    latencies = {kind: [] for kind in KINDS}
+    clock = time.perf_counter
+    elapsed = 0.0
+    for _ in range(count):
+        kind, rank, event = stream.next()
+        before = clock()
+        outcome = await handlers[kind](event)
+        latency = clock() - before
+        elapsed += latency
+        latencies[kind].append(latency)
+        stream.observe(kind, rank, outcome)
+    return elapsed, latencies
+
+
+async def measure_allocations(stream: EventStream, count: int) -> dict:
+    """
+    Handles events of given stream, one after another, tracing their
+    allocations.
+    :param stream: The stream of events.
+    :type stream: EventStream
+    :param count: The number of events.
+    :type count: int
+    :return: The peak and retained bytes of each event, by kind.
+    :rtype: Dict[str, List[Tuple[int, int]]]
+    """
+    handlers = listeners()
+    result = {kind: [] for kind in KINDS}
+    tracemalloc.start()
+    try:
+        for _ in range(count):
+            kind, rank, event = stream.next()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            outcome = await handlers[kind](event)
+            after, peak = tracemalloc.get_traced_memory()
+            result[kind].append((peak - before, after - before))
+            stream.observe(kind, rank, outcome)
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def summarize(latencies: list, allocations: list) -> dict:
+    """
+    Summarizes the measurements of a kind of event.
+    :param latencies: The latencies, in seconds.
+    :type latencies: List[float]
+    :param allocations: The peak and retained bytes of each traced event.
+    :type allocations: List[Tuple[int, int]]
+    :return: The count, throughput, percentiles and allocations.
+    :rtype: Dict[str, float]
+    """
+    latencies = sorted(latencies)
+    total = sum(latencies)
+    traced = len(allocations) or 1
+    return {
+        "events": len(latencies),
+        "events_per_second": len(latencies) / total if total > 0 else 0.0,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "peak_bytes_per_event": sum(peak for peak, _ in allocations) / traced,
+        "retained_bytes_per_event": sum(kept for _, kept in allocations) / traced,
+    }
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument(
+        "--mix", type=parse_mix, default="create=5,update=30,find=60,delete=4,list=1"
+    )
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--allocation-sample", type=int, default=2000)
+    parser.add_argument("--label", default=None)
+    parser.add_argument("--json", default=None)
+    options = parser.parse_args(args)
+    if options.clients < 1:
+        parser.error("--clients must be at least 1")
+
+    from org.acmsl.licdata import ClientRepo, InMemoryClientRepo
+
+    handle = ClientRepo.handle()
+    handle.bind(InMemoryClientRepo())
+    loop = asyncio.new_event_loop()
+    try:
+        client_ids = loop.run_until_complete(preload(options.clients))
+        stream = EventStream(client_ids, options.mix, options.skew, options.seed)
+        elapsed, latencies = loop.run_until_complete(
+            measure_latencies(stream, options.events)
+        )
+        allocations = loop.run_until_complete(
+            measure_allocations(stream, options.allocation_sample)
+        )
+    finally:
+        loop.close()
+        handle.bind(None)
+
+    overall = summarize(
+        [latency for values in latencies.values() for latency in values],
+        [item for values in allocations.values() for item in values],
+    )
+    overall["events_per_second"] = options.events / elapsed if elapsed > 0 else 0.0
+    by_kind = {
+        kind: summarize(latencies[kind], allocations[kind])
+        for kind in KINDS
+        if latencies[kind]
+    }
+
+    sys.stdout.write(
+        f"{'kind':8} {'events':>8} {'events/s':>12} {'p50 us':>10} {'p99 us':>10} "
+        f"{'peak B':>10} {'kept B':>10}\n"
+    )
+    for kind, summary in list(by_kind.items()) + [("all", overall)]:
+        sys.stdout.write(
+            f"{kind:8} {summary['events']:8} {summary['events_per_second']:12,.0f} "
+            f"{summary['p50_us']:10.1f} {summary['p99_us']:10.1f} "
+            f"{summary['peak_bytes_per_event']:10.0f} "
+            f"{summary['retained_bytes_per_event']:10.0f}\n"
+        )
+
+    if options.json is not None:
+        results = {
+            "benchmark": "client_pipeline",
+            "label": options.label,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {
+                "events": options.events,
+                "clients": options.clients,
+                "mix": options.mix,
+                "skew": options.skew,
+                "seed": options.seed,
+                "allocation_sample": options.allocation_sample,
+            },
+            "overall": overall,
+            "by_kind": by_kind,
+        }
+        if options.json == "-":
+            json.dump(results, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            with open(options.json, "w", encoding="utf-8") as output:
+                json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
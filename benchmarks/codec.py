@@ -0,0 +1,273 @@
+"""
+benchmarks/codec.py
+
+This file compares the binary codec with JSON serialization.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.codec [--count N] [--repeat R]
+
+For entities and Client events, it reports the payload size and the
+round trips (serialize and deserialize) per second of BinaryCodec and of
+JSON documents with the same fields by name, which is how pythoneda
+marshals them for the event bus. Events the default codec leaves to JSON
+only get the JSON figures.
+
+The events are the ones the Client listeners emit. It first checks they
+survive a round trip through both forms, including their ids and previous
+event ids.
+"""
+
+import argparse
+import asyncio
+import datetime
+import inspect
+import json
+import re
+import sys
+import timeit
+
+
+def samples():
+    """
+    Retrieves sample payloads: entities, and the events the Client listeners
+    emit.
+    :return: Tuples of name and instance.
+    :rtype: List[Tuple[str, Any]]
+    """
+    from org.acmsl.licdata import Client, License, User
+
+    client = Client("client@example.com", "Main Street 1", "Jane Doe", "555 0100")
+    return [
+        ("Client", client),
+        ("License", License(client.id, "product-id", 365, datetime.date.today())),
+        ("User", User("user@example.com", "secret")),
+    ] + handler_events()
+
+
+def handler_events():
+    """
+    Retrieves the events the Client listeners emit, against a repository in memory.
+    :return: Tuples of name and event.
+    :rtype: List[Tuple[str, pythoneda.shared.Event]]
+    """
+    from org.acmsl.licdata import Client, ClientRepo, InMemoryClientRepo
+    from org.acmsl.licdata.events.clients import (
+        DeleteClientRequested,
+        FindClientByIdRequested,
+        ListClientsRequested,
+        NewClientRequested,
+        UpdateClientRequested,
+    )
+
+    def request(eventClass, **kwargs):
+        return eventClass(
+            email="client@example.com",
+            address="Main Street 1",
+            contact="Jane Doe",
+            phone="555 0100",
+            **kwargs,
+        )
+
+    ClientRepo.handle().bind(InMemoryClientRepo())
+    loop = asyncio.new_event_loop()
+    try:
+        run = loop.run_until_complete
+        [created] = run(Client.listen_NewClientRequested(request(NewClientRequested)))
+        [exists] = run(Client.listen_NewClientRequested(request(NewClientRequested)))
+        [updated] = run(
+            Client.listen_UpdateClientRequested(
+                request(UpdateClientRequested, entityId=created.entity_id)
+            )
+        )
+        [found] = run(Client.listen_ListClientsRequested(ListClientsRequested()))
+        [deleted] = run(
+            Client.listen_DeleteClientRequested(
+                DeleteClientRequested(entityId=created.entity_id)
+            )
+        )
+        [missing] = run(
+            Client.listen_FindClientByIdRequested(
+                FindClientByIdRequested(entityId=created.entity_id)
+            )
+        )
+    finally:
+        loop.close()
+        ClientRepo.handle().bind(None)
+    return [
+        (event.__class__.__name__, event)
+        for event in (created, exists, updated, found, deleted, missing)
+    ]
+
+
+def check_round_trip(serializer, name: str, event):
+    """
+    Checks given event survives a round trip through given serializer.
+    :param serializer: The serializer, i.e. BinaryCodec or JsonFormat.
+    :type serializer: Any
+    :param name: The name of the event.
+    :type name: str
+    :param event: The event.
+    :type event: pythoneda.shared.Event
+    """
+    decoded = serializer.decode(serializer.encode(event))
+    if decoded.id != event.id or list(decoded.previous_event_ids) != list(
+        event.previous_event_ids
+    ):
+        raise AssertionError(
+            f"{name} does not survive a round trip through "
+            f"{serializer.__class__.__name__}"
+        )
+
+
+class JsonFormat:
+    """
+    Serializes instances as JSON documents, with their fields by name.
+
+    Class name: JsonFormat
+
+    Responsibilities:
+        - Provides the baseline the binary codec is compared with.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, recordClass: type):
+        """
+        Creates a new JsonFormat instance.
+        :param recordClass: The class of the instances.
+        :type recordClass: type
+        """
+        self._record_class = recordClass
+        parameters = inspect.signature(recordClass.__init__).parameters
+        # the id goes apart, and back through reconstructedId if accepted
+        self._reconstructs_id = "reconstructedId" in parameters
+        self._fields = [
+            (name, re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower())
+            for name in parameters
+            if name != "self" and not name.startswith("reconstructed")
+        ]
+
+    def encode(self, value) -> bytes:
+        """
+        Serializes given instance.
+        :param value: The instance.
+        :type value: Any
+        :return: The document.
+        :rtype: bytes
+        """
+        document = {name: getattr(value, attribute) for name, attribute in self._fields}
+        document["id"] = value.id
+        return json.dumps(document, default=self._default).encode("utf-8")
+
+    def decode(self, data: bytes):
+        """
+        Deserializes given document.
+        :param data: The document.
+        :type data: bytes
+        :return: The instance.
+        :rtype: Any
+        """
+        document = json.loads(data)
+        identity = document.pop("id")
+        if self._reconstructs_id:
+            return self._record_class(reconstructedId=identity, **document)
+        result = self._record_class(**document)
+        result.restore_id(identity)
+        return result
+
+    @staticmethod
+    def _default(value):
+        """
+        Serializes values JSON does not support.
+        :param value: The value.
+        :type value: Any
+        :return: Its JSON counterpart.
+        :rtype: Any
+        """
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            return value.isoformat()
+        from org.acmsl.licdata import CausationChain, FieldTable
+
+        if isinstance(value, CausationChain):
+            return value.to_list()
+        if hasattr(value, "name"):
+            return {"id": value.id, "name": value.name}
+        result = FieldTable.of(value.__class__).to_dict(value)
+        result["id"] = value.id
+        return result
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args(args)
+
+    from org.acmsl.licdata import BinaryCodec
+
+    codec = BinaryCodec.default()
+
+    for name, event in handler_events():
+        check_round_trip(JsonFormat(event.__class__), name, event)
+        if codec.supports(event.__class__):
+            check_round_trip(codec, name, event)
+
+    sys.stdout.write(
+        f"{'':24} {'binary B':>9} {'json B':>9} {'binary rt/s':>12} {'json rt/s':>12}\n"
+    )
+    for name, value in samples():
+        baseline = JsonFormat(value.__class__)
+        document = baseline.encode(value)
+        if not codec.supports(value.__class__):
+            # left to JSON; see BinaryCodec.default()
+            rate = options.count / min(
+                timeit.repeat(
+                    lambda: baseline.decode(baseline.encode(value)),
+                    number=options.count,
+                    repeat=options.repeat,
+                )
+            )
+            sys.stdout.write(
+                f"{name:24} {'-':>9} {len(document):9} {'-':>12} {rate:12,.0f}\n"
+            )
+            continue
+        binary = codec.encode(value)
+        rates = []
+        for serializer in (codec, baseline):
+            best = min(
+                timeit.repeat(
+                    lambda: serializer.decode(serializer.encode(value)),
+                    number=options.count,
+                    repeat=options.repeat,
+                )
+            )
+            rates.append(options.count / best)
+        sys.stdout.write(
+            f"{name:24} {len(binary):9} {len(document):9} "
+            f"{rates[0]:12,.0f} {rates[1]:12,.0f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
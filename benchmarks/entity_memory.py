@@ -0,0 +1,117 @@
+"""
+benchmarks/entity_memory.py
+
+This file measures the memory used by each licdata entity.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root, on each revision to compare):
+    python -m benchmarks.entity_memory [--count N]
+
+It reports the bytes allocated per instance, as traced by tracemalloc,
+of each entity and of its compact form (CompactEntity). They include the
+instance itself, its id, its dictionary and its event history, but not
+the values of its fields, which are shared among instances.
+"""
+
+import argparse
+import datetime
+import gc
+import sys
+import tracemalloc
+import uuid
+
+
+def samples():
+    """
+    Retrieves a factory of sample instances for each entity.
+    :return: Tuples of entity name and factory.
+    :rtype: List[Tuple[str, Callable[[], pythoneda.shared.Entity]]]
+    """
+    from org.acmsl.licdata import (
+        Client,
+        Incident,
+        License,
+        Order,
+        Pc,
+        Prelicense,
+        Product,
+        ProductType,
+        User,
+    )
+
+    today = datetime.date.today()
+
+    return [
+        ("Client", lambda: Client("client@example.com", "Address", "Name", "555")),
+        ("Incident", lambda: Incident("license-id", "pc-id")),
+        ("License", lambda: License("client-id", "product-id", 365, today)),
+        ("Order", lambda: Order("client-id", "product-id", 365, today)),
+        ("Pc", lambda: Pc("installation-code")),
+        ("Prelicense", lambda: Prelicense("order-id", 10, 365)),
+        ("Product", lambda: Product("product-type-id", "1.0")),
+        ("ProductType", lambda: ProductType("name", "1.0")),
+        ("User", lambda: User("user@example.com", "secret")),
+    ]
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    """
+    Measures the memory allocated per instance.
+    :param factory: Builds an instance.
+    :type factory: Callable[[], pythoneda.shared.Entity]
+    :param count: The number of instances to build.
+    :type count: int
+    :return: The allocated bytes per instance.
+    :rtype: float
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = sys.getsizeof(instances)
+    del instances
+    return (after - before - list_overhead) / count
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--count", type=int, default=100000)
+    options = parser.parse_args(args)
+
+    from org.acmsl.licdata import CompactEntity, FieldTable
+
+    sys.stdout.write(f"{'':12} {'entity B':>9} {'compact B':>10}\n")
+    for name, factory in samples():
+        sample = factory()
+        compact_class = CompactEntity.of(sample.__class__)
+        values = FieldTable.of(sample.__class__).values_of(sample)
+        size = bytes_per_instance(factory, options.count)
+        compact_size = bytes_per_instance(
+            lambda: compact_class((str(uuid.uuid4()),) + values), options.count
+        )
+        sys.stdout.write(f"{name:12} {size:9.1f} {compact_size:10.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
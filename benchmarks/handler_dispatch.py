@@ -0,0 +1,82 @@
+"""
+benchmarks/handler_dispatch.py
+
+This file measures the overhead of dispatching an event to a Client listener.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.handler_dispatch [--count N] [--repeat R]
+
+It compares resolving the repository through the Ports registry on every
+event with the cached RepoHandle, and times a whole FindClientByIdRequested
+dispatch against a repository answering from memory.
+"""
+
+import argparse
+import asyncio
+import sys
+import timeit
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args(args)
+
+    from org.acmsl.licdata import Client, ClientRepo
+    from org.acmsl.licdata.events.clients import FindClientByIdRequested
+    from pythoneda.shared import Ports
+
+    client = Client(email="client@example.com")
+
+    class FixedClientRepo(ClientRepo):
+        def find_by_id(self, id):
+            return client
+
+    ClientRepo.handle().bind(FixedClientRepo())
+
+    def resolve_from_registry():
+        from org.acmsl.licdata.client_repo import ClientRepo
+
+        return Ports.instance().resolve_first(ClientRepo)
+
+    event = FindClientByIdRequested(entityId=client.id)
+    loop = asyncio.new_event_loop()
+
+    def dispatch():
+        return loop.run_until_complete(Client.listen_FindClientByIdRequested(event))
+
+    for label, function, count in [
+        ("Ports.resolve_first", resolve_from_registry, options.count),
+        ("Client.repo", Client.repo, options.count),
+        ("listen_FindClientByIdRequested", dispatch, options.count // 10),
+    ]:
+        best = min(timeit.repeat(function, number=count, repeat=options.repeat))
+        sys.stdout.write(f"{label}: {best / count * 1e6:.3f} us/call\n")
+
+    loop.close()
+    ClientRepo.handle().bind(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+benchmarks/import_time.py
+
+This file measures the time needed to import names from org.acmsl.licdata.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.import_time [--name License] [--top 10] [--max-ms MS]
+
+Each run imports the name in a fresh interpreter with -X importtime, and
+reports the cumulative import time of the slowest modules. With --max-ms,
+it exits with status 1 when the total exceeds the threshold, so it can
+guard against regressions in CI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+def import_times(name: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Imports given name in a fresh interpreter, with -X importtime.
+    :param name: The name to import from org.acmsl.licdata.
+    :type name: str
+    :return: The total time, and the cumulative time of each module, in microseconds.
+    :rtype: Tuple[int, Dict[str, int]]
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"from org.acmsl.licdata import {name}",
+        ],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+        check=True,
+    )
+    modules = {}
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:") :].split("|")
+        modules[module.strip()] = int(cumulative)
+        total += int(own)
+    return total, modules
+
+
+def main(args: List[str] = None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--name", default="License")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    options = parser.parse_args(args)
+
+    runs = [import_times(options.name) for _ in range(options.repeat)]
+    total_ms = statistics.median(total for total, _ in runs) / 1000
+    _, modules = min(runs, key=lambda run: run[0])
+
+    sys.stdout.write(
+        f"from org.acmsl.licdata import {options.name}: {total_ms:.1f} ms\n"
+    )
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)
+    for module, cumulative in slowest[: options.top]:
+        sys.stdout.write(f"  {cumulative / 1000:8.1f} ms  {module}\n")
+
+    if options.max_ms is not None and total_ms > options.max_ms:
+        sys.stderr.write(f"Import time above {options.max_ms} ms\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
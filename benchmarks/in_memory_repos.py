@@ -0,0 +1,183 @@
+"""
+benchmarks/in_memory_repos.py
+
+This file measures the throughput of the in-memory repositories.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.in_memory_repos [--count N]
+
+For each repository, it reports the operations per second of inserting,
+finding by id, finding by primary key, updating, listing and deleting
+N entities. These are the baseline of the domain logic, with no storage
+latency involved.
+"""
+
+import argparse
+import datetime
+import sys
+import time
+
+
+def samples():
+    """
+    Retrieves, for each repository, a factory of entities with distinct
+    primary keys, and the primary key of each entity.
+    :return: Tuples of repository class, entity factory and primary key getter.
+    :rtype: List[Tuple[type, Callable[[int], pythoneda.shared.Entity], Callable]]
+    """
+    from org.acmsl.licdata import (
+        Client,
+        Incident,
+        InMemoryClientRepo,
+        InMemoryIncidentRepo,
+        InMemoryLicenseRepo,
+        InMemoryOrderRepo,
+        InMemoryPcRepo,
+        InMemoryPrelicenseRepo,
+        InMemoryProductRepo,
+        InMemoryProductTypeRepo,
+        InMemoryUserRepo,
+        License,
+        Order,
+        Pc,
+        Prelicense,
+        Product,
+        ProductType,
+        User,
+    )
+
+    today = datetime.date.today()
+
+    return [
+        (
+            InMemoryClientRepo,
+            lambda index: Client(f"client-{index}@example.com", "Address"),
+            lambda client: {"email": client.email},
+        ),
+        (
+            InMemoryIncidentRepo,
+            lambda index: Incident(f"license-{index}", f"pc-{index}"),
+            lambda incident: {
+                "license_id": incident.license_id,
+                "pc_id": incident.pc_id,
+            },
+        ),
+        (
+            InMemoryLicenseRepo,
+            lambda index: License(f"client-{index}", "product-id", 365, today),
+            lambda license: {
+                "client_id": license.client_id,
+                "product_id": license.product_id,
+            },
+        ),
+        (
+            InMemoryOrderRepo,
+            lambda index: Order(f"client-{index}", "product-id", 365, today),
+            lambda order: {
+                "client_id": order.client_id,
+                "product_id": order.product_id,
+            },
+        ),
+        (
+            InMemoryPcRepo,
+            lambda index: Pc(f"installation-{index}"),
+            lambda pc: {"installation_code": pc.installation_code},
+        ),
+        (
+            InMemoryPrelicenseRepo,
+            lambda index: Prelicense(f"order-{index}", 10, 365),
+            lambda prelicense: {"order_id": prelicense.order_id},
+        ),
+        (
+            InMemoryProductRepo,
+            lambda index: Product("product-type-id", f"1.{index}"),
+            lambda product: {
+                "product_type_id": product.product_type_id,
+                "product_version": product.product_version,
+            },
+        ),
+        (
+            InMemoryProductTypeRepo,
+            lambda index: ProductType("name", f"1.{index}"),
+            lambda productType: {
+                "name": productType.name,
+                "version": productType.version,
+            },
+        ),
+        (
+            InMemoryUserRepo,
+            lambda index: User(f"user-{index}@example.com", "secret"),
+            lambda user: {"email": user.email},
+        ),
+    ]
+
+
+def throughput(operation, items) -> float:
+    """
+    Measures the throughput of an operation.
+    :param operation: The operation.
+    :type operation: Callable[[Any], Any]
+    :param items: The argument of each call.
+    :type items: List[Any]
+    :return: The calls per second.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for item in items:
+        operation(item)
+    elapsed = time.perf_counter() - start
+    return len(items) / elapsed if elapsed > 0 else float("inf")
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--count", type=int, default=100000)
+    options = parser.parse_args(args)
+
+    sys.stdout.write(
+        f"{'ops/s':24} {'insert':>10} {'by id':>10} {'by pk':>10} "
+        f"{'update':>10} {'list':>10} {'delete':>10}\n"
+    )
+    for repo_class, factory, pk_of in samples():
+        repo = repo_class()
+        entities = [factory(index) for index in range(options.count)]
+        ids = [entity.id for entity in entities]
+        pks = [pk_of(entity) for entity in entities]
+        results = [
+            throughput(repo.insert, entities),
+            throughput(repo.find_by_id, ids),
+            throughput(repo.find_by_pk, pks),
+            throughput(repo.update, entities),
+            # each listing retrieves all entities, so it's reported in entities/s
+            throughput(lambda _: repo.list(), range(10)) * options.count,
+            throughput(repo.delete, entities),
+        ]
+        sys.stdout.write(
+            f"{repo_class.__name__:24} "
+            + " ".join(f"{result:10,.0f}" for result in results)
+            + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
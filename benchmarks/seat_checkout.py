@@ -0,0 +1,83 @@
+"""
+benchmarks/seat_checkout.py
+
+This file simulates concurrent activations of floating licenses.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage (from the repository root):
+    python -m benchmarks.seat_checkout [--prelicenses P] [--seats S]
+        [--activations A] [--workers W]
+
+Each worker thread checks out and releases seats of random prelicenses.
+It reports the throughput, and checks no prelicense ever had more seats
+in use than it owns.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
+import time
+
+
+def main(args=None):
+    """
+    Runs the benchmark.
+    :param args: The command-line arguments.
+    :type args: Optional[List[str]]
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--prelicenses", type=int, default=10)
+    parser.add_argument("--seats", type=int, default=50)
+    parser.add_argument("--activations", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=32)
+    options = parser.parse_args(args)
+
+    from org.acmsl.licdata import Prelicense, SeatAllocator
+
+    prelicenses = [
+        Prelicense(f"order-{index}", options.seats, 365)
+        for index in range(options.prelicenses)
+    ]
+    allocator = SeatAllocator(leaseDuration=60.0)
+
+    def activate(index: int) -> bool:
+        prelicense = random.choice(prelicenses)
+        lease = allocator.checkout(prelicense, f"pc-{index}")
+        if lease is None:
+            return False
+        in_use = allocator.in_use(prelicense.order_id)
+        if in_use > prelicense.seats:
+            raise AssertionError(f"{prelicense.order_id}: {in_use} seats in use")
+        allocator.release(lease)
+        return True
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=options.workers) as executor:
+        granted = sum(executor.map(activate, range(options.activations)))
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(
+        f"{options.activations} activations over {options.prelicenses} "
+        f"prelicenses with {options.workers} workers: "
+        f"{options.activations / elapsed:,.0f} activations/s, "
+        f"{granted} granted\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,24 +21,101 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
-from .client import Client
-from .client_repo import ClientRepo
-from .incident import Incident
-from .incident_repo import IncidentRepo
-from .license import License
-from .license_repo import LicenseRepo
-from .order import Order
-from .order_repo import OrderRepo
-from .pc import Pc
-from .pc_repo import PcRepo
-from .prelicense import Prelicense
-from .prelicense_repo import PrelicenseRepo
-from .product import Product
-from .product_repo import ProductRepo
-from .product_type import ProductType
-from .product_type_repo import ProductTypeRepo
-from .user import User
-from .user_repo import UserRepo
+import importlib
+
+# The public names, and the modules defining them. Each module is imported
+# on first access to any of its names (PEP 562), so that using one entity
+# does not load the others nor their events.
+_LAZY_ATTRIBUTES = {
+    "AsyncRepo": ".async_repo",
+    "BaseRepo": ".base_repo",
+    "BinaryCodec": ".binary_codec",
+    "CachedClientRepo": ".cached_client_repo",
+    "CachedRepo": ".cached_repo",
+    "CausationChain": ".causation_chain",
+    "Client": ".client",
+    "ClientRepo": ".client_repo",
+    "ColumnarExport": ".columnar_export",
+    "CompactEntity": ".compact_entity",
+    "DanglingReference": ".dangling_reference",
+    "EntityCache": ".entity_cache",
+    "EntitySnapshot": ".entity_snapshot",
+    "EventHistory": ".event_history",
+    "ExpiryIndex": ".expiry_index",
+    "Field": ".field",
+    "FieldTable": ".field_table",
+    "with_field_table": ".field_table",
+    "InMemoryClientRepo": ".in_memory_client_repo",
+    "InMemoryIncidentRepo": ".in_memory_incident_repo",
+    "InMemoryLicenseRepo": ".in_memory_license_repo",
+    "InMemoryOrderRepo": ".in_memory_order_repo",
+    "InMemoryPcRepo": ".in_memory_pc_repo",
+    "InMemoryPrelicenseRepo": ".in_memory_prelicense_repo",
+    "InMemoryProductRepo": ".in_memory_product_repo",
+    "InMemoryProductTypeRepo": ".in_memory_product_type_repo",
+    "InMemoryRepo": ".in_memory_repo",
+    "InMemoryUserRepo": ".in_memory_user_repo",
+    "Incident": ".incident",
+    "IncidentRepo": ".incident_repo",
+    "InlineRepo": ".inline_repo",
+    "IntegrityChecker": ".integrity_checker",
+    "IntegrityIndex": ".integrity_index",
+    "License": ".license",
+    "LicenseExpiry": ".license_expiry",
+    "LicenseRepo": ".license_repo",
+    "LicenseValidationIndex": ".license_validation_index",
+    "LicenseVerdict": ".license_verdict",
+    "Order": ".order",
+    "OrderRepo": ".order_repo",
+    "OrderedDispatcher": ".ordered_dispatcher",
+    "Pc": ".pc",
+    "PcRepo": ".pc_repo",
+    "Prelicense": ".prelicense",
+    "PrelicenseRepo": ".prelicense_repo",
+    "Product": ".product",
+    "ProductRepo": ".product_repo",
+    "ProductType": ".product_type",
+    "ProductTypeRepo": ".product_type_repo",
+    "Reference": ".reference",
+    "ReplayError": ".replay_error",
+    "RepoHandle": ".repo_handle",
+    "SeatAllocator": ".seat_allocator",
+    "SeatLease": ".seat_lease",
+    "SecondaryIndexes": ".secondary_indexes",
+    "secondary_index": ".secondary_indexes",
+    "SnapshotRepo": ".snapshot_repo",
+    "Snapshotter": ".snapshotter",
+    "ThreadPoolRepo": ".thread_pool_repo",
+    "User": ".user",
+    "UserRepo": ".user_repo",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module defining given public name, on first access.
+    :param name: The name.
+    :type name: str
+    :return: The value of such name.
+    :rtype: Any
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    """
+    Lists the attributes of the package, including those not imported yet.
+    :return: Such names.
+    :rtype: List[str]
+    """
+    return sorted(set(globals()) | set(__all__))
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
@@ -0,0 +1,195 @@
+"""
+org/acmsl/licdata/async_repo.py
+
+This file defines the AsyncRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import abc
+from pythoneda.shared import Entity
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class AsyncRepo(abc.ABC):
+    """
+    The non-blocking counterpart of the repository contract.
+
+    Class name: AsyncRepo
+
+    Responsibilities:
+        - Defines awaitable versions of the operations of BaseRepo, so
+          listeners don't block the event loop on storage round trips.
+        - Adapts synchronous repositories to this contract.
+
+    Collaborators:
+        - BaseRepo: The synchronous contract.
+        - InlineRepo: Adapts synchronous repositories that don't block.
+        - ThreadPoolRepo: Adapts synchronous repositories that block.
+
+    Natively asynchronous backends subclass it. Synchronous repositories get
+    wrapped in a ThreadPoolRepo, so their round trips don't block the event
+    loop, unless they declare `blocking = False` to run in an InlineRepo.
+    """
+
+    @classmethod
+    def of(cls, repo: Any) -> "AsyncRepo":
+        """
+        Retrieves the asynchronous version of given repository.
+        :param repo: The repository, synchronous or not.
+        :type repo: Any
+        :return: The repository itself, if it's asynchronous already, or an
+        adapter running its operations in a thread pool if they block, or
+        inline otherwise.
+        :rtype: org.acmsl.licdata.AsyncRepo
+        """
+        if isinstance(repo, AsyncRepo):
+            return repo
+        if getattr(repo, "blocking", True):
+            from .thread_pool_repo import ThreadPoolRepo
+
+            return ThreadPoolRepo(repo)
+        from .inline_repo import InlineRepo
+
+        return InlineRepo(repo)
+
+    @abc.abstractmethod
+    async def find_by_id(self, id: str) -> Optional[Entity]:
+        """
+        Retrieves the entity with given id.
+        :param id: The id.
+        :type id: str
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def find_by_pk(self, pk: Dict[str, Any]) -> Optional[Entity]:
+        """
+        Retrieves the entity with given primary key.
+        :param pk: The primary key.
+        :type pk: Dict[str, Any]
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def find_by_pks(self, pks: List[Dict[str, Any]]) -> List[Optional[Entity]]:
+        """
+        Retrieves the entities matching given primary keys, in a single lookup.
+        :param pks: The primary keys.
+        :type pks: List[Dict[str, Any]]
+        :return: The matching entities (or None), in the same order as the keys.
+        :rtype: List[Optional[pythoneda.shared.Entity]]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def find_by_index(self, attribute: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose indexed attribute has given value.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def insert(self, item: Any) -> Any:
+        """
+        Inserts given item.
+        :param item: The item to insert.
+        :type item: Any
+        :return: The outcome of the insertion.
+        :rtype: Any
+        """
+        pass
+
+    @abc.abstractmethod
+    async def insert_all(self, items: List[Any]) -> List[Any]:
+        """
+        Inserts given items, in a single operation.
+        :param items: The items to insert.
+        :type items: List[Any]
+        :return: The outcome of each insertion, in the same order as the items.
+        :rtype: List[Any]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def insert_if_absent(self, item: Any, pk: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Inserts given item, unless an entity with given primary key already exists.
+        :param item: The item to insert.
+        :type item: Any
+        :param pk: The primary key of the entity the item would create.
+        :type pk: Dict[str, Any]
+        :return: Either the outcome of the insertion and True, or the existing
+        entity and False.
+        :rtype: Tuple[Any, bool]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def update(self, item: Any) -> Any:
+        """
+        Updates given item.
+        :param item: The item to update.
+        :type item: Any
+        :return: The outcome of the update.
+        :rtype: Any
+        """
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, item: Any) -> Any:
+        """
+        Deletes given item.
+        :param item: The item to delete.
+        :type item: Any
+        :return: The outcome of the deletion.
+        :rtype: Any
+        """
+        pass
+
+    @abc.abstractmethod
+    async def list(self) -> List[Entity]:
+        """
+        Retrieves all entities.
+        :return: Such entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        pass
+
+    @abc.abstractmethod
+    async def list_page(
+        self, pageSize: int, continuationToken: Optional[str] = None
+    ) -> Tuple[List[Entity], Optional[str]]:
+        """
+        Retrieves a page of entities.
+        :param pageSize: The maximum number of entities in the page.
+        :type pageSize: int
+        :param continuationToken: The token returned with the previous page, if any.
+        :type continuationToken: Optional[str]
+        :return: The entities, and the token of the next page (None if it's the last one).
+        :rtype: Tuple[List[pythoneda.shared.Entity], Optional[str]]
+        """
+        pass
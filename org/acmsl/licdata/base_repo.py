@@ -0,0 +1,183 @@
+"""
+org/acmsl/licdata/base_repo.py
+
+This file defines the BaseRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .repo_handle import RepoHandle
+from collections import OrderedDict
+import itertools
+from pythoneda.shared import Entity, Repo
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import uuid
+
+
+class BaseRepo(Repo):
+    """
+    Common contract of all Licdata repositories.
+
+    Class name: BaseRepo
+
+    Responsibilities:
+        - Extends pythoneda's Repo with bulk operations, paginated listings,
+          conditional insertions and lookups by secondary index.
+        - Provides per-item fallbacks so existing adapters keep working.
+
+    Collaborators:
+        - pythoneda.shared.Repo: The port contract being extended.
+        - RepoHandle: Caches the adapter resolved for each repository port.
+    """
+
+    blocking = True
+    """
+    Whether its operations block on I/O, so AsyncRepo.of runs them in a thread
+    pool. Adapters that never block, i.e. the in-memory ones, opt out with
+    `blocking = False` to run inline.
+    """
+
+    _LOCK_STRIPES = 64
+
+    _MAX_CURSORS = 64
+
+    _warned_insert_if_absent = set()
+
+    def __init__(self, entityClass: type):
+        """
+        Creates a new BaseRepo instance.
+        :param entityClass: The class of the entities managed by the repository.
+        :type entityClass: type
+        """
+        super().__init__(entityClass)
+        self._insert_locks = [threading.Lock() for _ in range(BaseRepo._LOCK_STRIPES)]
+        self._cursors: OrderedDict = OrderedDict()
+        self._cursors_lock = threading.Lock()
+
+    @classmethod
+    def handle(cls) -> RepoHandle:
+        """
+        Retrieves the cached binding of this port to its adapter.
+        :return: Such handle.
+        :rtype: org.acmsl.licdata.RepoHandle
+        """
+        return RepoHandle.for_port(cls)
+
+    def find_by_pks(self, pks: List[Dict[str, Any]]) -> List[Optional[Entity]]:
+        """
+        Retrieves the entities matching given primary keys, in a single lookup.
+        Adapters should override this method to avoid one round trip per key.
+        :param pks: The primary keys.
+        :type pks: List[Dict[str, Any]]
+        :return: The matching entities (or None), in the same order as the keys.
+        :rtype: List[Optional[pythoneda.shared.Entity]]
+        """
+        return [self.find_by_pk(pk) for pk in pks]
+
+    def insert_all(self, items: List[Any]) -> List[Any]:
+        """
+        Inserts given items, in a single operation.
+        Adapters should override this method to avoid one round trip per item.
+        :param items: The items to insert.
+        :type items: List[Any]
+        :return: The outcome of each insertion, in the same order as the items.
+        :rtype: List[Any]
+        """
+        return [self.insert(item) for item in items]
+
+    def list_page(
+        self, pageSize: int, continuationToken: Optional[str] = None
+    ) -> Tuple[List[Entity], Optional[str]]:
+        """
+        Retrieves a page of entities.
+        Adapters should override this method with a keyset cursor on the backing
+        store. This fallback retrieves the listing once per scan, and keeps an
+        iterator over it behind the token, so tokens only work on the same
+        instance, and a scan returns the entities as of its first page.
+        :param pageSize: The maximum number of entities in the page.
+        :type pageSize: int
+        :param continuationToken: The token returned with the previous page, if any.
+        :type continuationToken: Optional[str]
+        :return: The entities, and the token of the next page (None if it's the last one).
+        :rtype: Tuple[List[pythoneda.shared.Entity], Optional[str]]
+        """
+        if pageSize < 1:
+            raise ValueError(f"Invalid page size: {pageSize}")
+        with self._cursors_lock:
+            if continuationToken is None:
+                cursor = iter(self.list())
+            else:
+                cursor = self._cursors.pop(continuationToken, None)
+                if cursor is None:
+                    raise ValueError(f"Unknown or expired token: {continuationToken}")
+        items = list(itertools.islice(cursor, pageSize))
+        # peek, so the last page comes without a token
+        following = list(itertools.islice(cursor, 1))
+        if not following:
+            return items, None
+        next_token = uuid.uuid4().hex
+        with self._cursors_lock:
+            self._cursors[next_token] = itertools.chain(following, cursor)
+            while len(self._cursors) > BaseRepo._MAX_CURSORS:
+                self._cursors.popitem(last=False)
+        return items, next_token
+
+    def insert_if_absent(self, item: Any, pk: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Inserts given item, unless an entity with given primary key already exists.
+        Adapters shared by several processes or hosts must override this method
+        with a conditional write on the backing store (i.e. a unique constraint
+        or a put-if-absent), to make it atomic across workers. This fallback is
+        only atomic for the callers sharing this instance, since it serializes
+        them with in-process locks (by primary key stripes), and it logs a
+        warning the first time each adapter class uses it.
+        :param item: The item to insert.
+        :type item: Any
+        :param pk: The primary key of the entity the item would create.
+        :type pk: Dict[str, Any]
+        :return: Either the outcome of the insertion and True, or the existing
+        entity and False.
+        :rtype: Tuple[Any, bool]
+        """
+        if self.__class__ not in BaseRepo._warned_insert_if_absent:
+            BaseRepo._warned_insert_if_absent.add(self.__class__)
+            self.__class__.logger().warning(
+                "%s does not override insert_if_absent(), so it's not atomic "
+                "across processes",
+                self.__class__.__name__,
+            )
+        stripe = hash(tuple(sorted(pk.items()))) % len(self._insert_locks)
+        with self._insert_locks[stripe]:
+            existing = self.find_by_pk(pk)
+            if existing is not None:
+                return existing, False
+            return self.insert(item), True
+
+    def find_by_index(self, attribute: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose attribute, declared with @secondary_index,
+        has given value.
+        Adapters should override this method, maintaining a SecondaryIndexes
+        on insert, update and delete, since this fallback scans the whole listing.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        return [item for item in self.list() if getattr(item, attribute) == value]
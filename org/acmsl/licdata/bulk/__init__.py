@@ -0,0 +1,69 @@
+# vim: set fileencoding=utf-8
+"""
+org/acmsl/licdata/bulk/__init__.py
+
+This file defines the org.acmsl.licdata.bulk package.
+
+Copyright (C) 2024-today acmsl's Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import importlib
+
+# The public names, and the modules defining them. Each module is imported
+# on first access to any of its names (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "BulkImporter": ".bulk_importer",
+    "IdMap": ".id_map",
+    "ImportCheckpoint": ".import_checkpoint",
+    "ImportReport": ".import_report",
+    "RecordParser": ".record_parser",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module defining given public name, on first access.
+    :param name: The name.
+    :type name: str
+    :return: The value of such name.
+    :rtype: Any
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    """
+    Lists the attributes of the package, including those not imported yet.
+    :return: Such names.
+    :rtype: List[str]
+    """
+    return sorted(set(globals()) | set(__all__))
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
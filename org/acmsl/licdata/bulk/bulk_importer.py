@@ -0,0 +1,384 @@
+"""
+org/acmsl/licdata/bulk/bulk_importer.py
+
+This file defines the BulkImporter class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from ..field_table import FieldTable
+from ..reference import Reference
+from .id_map import IdMap
+from .import_checkpoint import ImportCheckpoint
+from .import_report import ImportReport
+from .record_parser import ParsedRow, RecordParser, parse_chunk
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+import csv
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class BulkImporter:
+    """
+    Streams CSV and JSONL sources into the repositories.
+
+    Class name: BulkImporter
+
+    Responsibilities:
+        - Imports sources in dependency order, so referenced entities come first.
+        - Parses sources lazily, in chunks, optionally in a process pool.
+        - Resolves legacy references to the ids of the imported entities.
+        - Inserts entities in batches, one call to insert_all per batch.
+        - Records its progress after each chunk, so it can resume.
+
+    Collaborators:
+        - RecordParser: Parses and validates the rows.
+        - IdMap: Resolves legacy references.
+        - ImportCheckpoint: Records the progress.
+        - ImportReport: Summarizes the outcome.
+        - Reference: Tells which fields to resolve.
+        - BaseRepo: Stores the entities.
+
+    Memory use is bounded by the chunks in flight, plus the id map, which
+    only keeps the ids of entities other entities can refer to.
+    """
+
+    def __init__(
+        self,
+        repos: Dict[type, Any],
+        idMap: Optional[IdMap] = None,
+        checkpoint: Optional[ImportCheckpoint] = None,
+        batchSize: int = 1000,
+        chunkSize: int = 10000,
+        workers: int = 0,
+    ):
+        """
+        Creates a new BulkImporter instance.
+        :param repos: The repository of each entity class.
+        :type repos: Dict[type, org.acmsl.licdata.BaseRepo]
+        :param idMap: The map of legacy ids, or None to keep one in memory.
+        :type idMap: Optional[org.acmsl.licdata.bulk.IdMap]
+        :param checkpoint: The progress of previous runs, if any.
+        :type checkpoint: Optional[org.acmsl.licdata.bulk.ImportCheckpoint]
+        :param batchSize: The number of entities per insertion.
+        :type batchSize: int
+        :param chunkSize: The number of rows per parsing task.
+        :type chunkSize: int
+        :param workers: The number of parsing processes, or 0 to parse inline.
+        :type workers: int
+        """
+        if batchSize < 1:
+            raise ValueError(f"Invalid batch size: {batchSize}")
+        if chunkSize < 1:
+            raise ValueError(f"Invalid chunk size: {chunkSize}")
+        if workers < 0:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self._repos = repos
+        self._id_map = IdMap() if idMap is None else idMap
+        self._checkpoint = checkpoint
+        self._batch_size = batchSize
+        self._chunk_size = chunkSize
+        self._workers = workers
+
+    @property
+    def id_map(self) -> IdMap:
+        """
+        Retrieves the map of legacy ids.
+        :return: Such map.
+        :rtype: org.acmsl.licdata.bulk.IdMap
+        """
+        return self._id_map
+
+    @classmethod
+    def sorted_sources(
+        cls, sources: Sequence[Tuple[type, str]]
+    ) -> List[Tuple[type, str]]:
+        """
+        Sorts given sources so that referenced entities get imported first.
+        :param sources: The entity class and path of each source.
+        :type sources: Sequence[Tuple[type, str]]
+        :return: The sorted sources.
+        :rtype: List[Tuple[type, str]]
+        """
+        names = {entity_class.__name__ for entity_class, _ in sources}
+        pending = list(sources)
+        done = set()
+        result = []
+        while pending:
+            ready = [
+                source
+                for source in pending
+                if all(
+                    reference.target_name in done
+                    or reference.target_name not in names
+                    or reference.target_name == source[0].__name__
+                    for reference in Reference.of(source[0].__name__)
+                )
+            ]
+            if not ready:
+                raise ValueError(f"Circular references among {sorted(names)}")
+            result.extend(ready)
+            pending = [source for source in pending if source not in ready]
+            done.update(entity_class.__name__ for entity_class, _ in ready)
+        return result
+
+    def run(self, sources: Sequence[Tuple[type, str]]) -> ImportReport:
+        """
+        Imports given sources.
+        :param sources: The entity class and path of each source. Paths ending
+        in .jsonl are parsed as JSON lines, and any other as CSV with a header.
+        :type sources: Sequence[Tuple[type, str]]
+        :return: The outcome.
+        :rtype: org.acmsl.licdata.bulk.ImportReport
+        """
+        result = ImportReport()
+        sources = self.sorted_sources(sources)
+        names = {entity_class.__name__ for entity_class, _ in sources}
+        targets = {reference.target_name for reference in Reference.all()}
+        executor = (
+            ProcessPoolExecutor(max_workers=self._workers) if self._workers else None
+        )
+        try:
+            for entity_class, path in sources:
+                self._import(entity_class, path, names, targets, executor, result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self._id_map.close()
+        return result
+
+    def _import(
+        self,
+        entityClass: type,
+        path: str,
+        names: set,
+        targets: set,
+        executor: Optional[Executor],
+        report: ImportReport,
+    ):
+        """
+        Imports a source.
+        :param entityClass: The class of the entities.
+        :type entityClass: type
+        :param path: The path of the source.
+        :type path: str
+        :param names: The names of the entity classes being imported.
+        :type names: set
+        :param targets: The names of the entity classes other entities refer to.
+        :type targets: set
+        :param executor: The process pool, if any.
+        :type executor: Optional[concurrent.futures.Executor]
+        :param report: The report to fill.
+        :type report: org.acmsl.licdata.bulk.ImportReport
+        """
+        repo = self._repos[entityClass]
+        entity_name = entityClass.__name__
+        rows_done = 0 if self._checkpoint is None else self._checkpoint.rows_done(path)
+        # only the references to entities imported now or before can be resolved
+        references = [
+            reference
+            for reference in Reference.of(entity_name)
+            if reference.target_name in names
+            or self._id_map.knows(reference.target_name)
+        ]
+        with open(path, "r", encoding="utf-8", newline="") as source:
+            if path.endswith(".jsonl"):
+                parser = RecordParser(entityClass, "jsonl")
+                first_row = 1
+            else:
+                parser = RecordParser(entityClass, "csv", next(csv.reader(source)))
+                first_row = 2
+            for _ in islice(source, rows_done):
+                pass
+            first_row += rows_done
+            for rows, parsed in self._parse(parser, source, first_row, executor):
+                self._store(
+                    repo,
+                    FieldTable.of(entityClass),
+                    path,
+                    parsed,
+                    references,
+                    entity_name in targets,
+                    report,
+                )
+                rows_done += rows
+                self._id_map.flush()
+                if self._checkpoint is not None:
+                    self._checkpoint.advance(path, rows_done)
+
+    def _parse(
+        self,
+        parser: RecordParser,
+        lines: Iterable[str],
+        firstRow: int,
+        executor: Optional[Executor],
+    ) -> Iterator[Tuple[int, List[ParsedRow]]]:
+        """
+        Parses given lines in chunks, in order. With a process pool, up to two
+        chunks per worker are in flight.
+        :param parser: The parser.
+        :type parser: org.acmsl.licdata.bulk.RecordParser
+        :param lines: The lines.
+        :type lines: Iterable[str]
+        :param firstRow: The number of the first line.
+        :type firstRow: int
+        :param executor: The process pool, if any.
+        :type executor: Optional[concurrent.futures.Executor]
+        :return: The number of lines and the parsed rows of each chunk.
+        :rtype: Iterator[Tuple[int, List[ParsedRow]]]
+        """
+        lines = iter(lines)
+        row = firstRow
+        if executor is None:
+            while True:
+                chunk = list(islice(lines, self._chunk_size))
+                if not chunk:
+                    return
+                yield len(chunk), parser.parse(row, chunk)
+                row += len(chunk)
+        in_flight = deque()
+        while True:
+            while len(in_flight) < 2 * self._workers:
+                chunk = list(islice(lines, self._chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(
+                    (len(chunk), executor.submit(parse_chunk, parser, row, chunk))
+                )
+                row += len(chunk)
+            if not in_flight:
+                return
+            count, future = in_flight.popleft()
+            yield count, future.result()
+
+    def _store(
+        self,
+        repo: Any,
+        table: FieldTable,
+        source: str,
+        parsed: List[ParsedRow],
+        references: List[Reference],
+        isTarget: bool,
+        report: ImportReport,
+    ):
+        """
+        Resolves, deduplicates and inserts the parsed rows of a chunk.
+        :param repo: The repository.
+        :type repo: org.acmsl.licdata.BaseRepo
+        :param table: The field table of the entities.
+        :type table: org.acmsl.licdata.FieldTable
+        :param source: The path of the source.
+        :type source: str
+        :param parsed: The parsed rows.
+        :type parsed: List[ParsedRow]
+        :param references: The references to resolve.
+        :type references: List[org.acmsl.licdata.Reference]
+        :param isTarget: Whether other entities can refer to these.
+        :type isTarget: bool
+        :param report: The report to fill.
+        :type report: org.acmsl.licdata.bulk.ImportReport
+        """
+        entity_name = table.entity_class.__name__
+        id_map = self._id_map
+        rows = []
+        for row, legacy_id, values, error in parsed:
+            if error is None:
+                for reference in references:
+                    legacy_reference = values.get(reference.attribute)
+                    if legacy_reference is None:
+                        continue
+                    resolved = id_map.get(reference.target_name, legacy_reference)
+                    if resolved is None:
+                        error = f"unknown {reference.target_name} {legacy_reference}"
+                        break
+                    values[reference.attribute] = resolved
+            if error is None:
+                rows.append((row, legacy_id, values))
+            else:
+                report.add_rejected(entity_name, source, row, error)
+        for start in range(0, len(rows), self._batch_size):
+            batch, skipped = self._new_entities(
+                repo, table, source, rows[start : start + self._batch_size], report
+            )
+            if batch:
+                repo.insert_all([entity for _, entity in batch])
+                report.add_imported(entity_name, len(batch))
+            if isTarget:
+                id_map.add_all(
+                    entity_name,
+                    (
+                        (legacy_id, entity.id)
+                        for legacy_id, entity in batch + skipped
+                        if legacy_id is not None
+                        and id_map.get(entity_name, legacy_id) != entity.id
+                    ),
+                )
+
+    def _new_entities(
+        self,
+        repo: Any,
+        table: FieldTable,
+        source: str,
+        rows: List[Tuple[int, Optional[str], Dict[str, Any]]],
+        report: ImportReport,
+    ) -> Tuple[List[Tuple[Optional[str], Any]], List[Tuple[Optional[str], Any]]]:
+        """
+        Builds the entities of given rows, setting aside those already stored
+        (i.e. by an interrupted run) and rejecting repeated primary keys.
+        :param repo: The repository.
+        :type repo: org.acmsl.licdata.BaseRepo
+        :param table: The field table of the entities.
+        :type table: org.acmsl.licdata.FieldTable
+        :param source: The path of the source.
+        :type source: str
+        :param rows: The number, legacy id and values of each row.
+        :type rows: List[Tuple[int, Optional[str], Dict[str, Any]]]
+        :param report: The report to fill.
+        :type report: org.acmsl.licdata.bulk.ImportReport
+        :return: The legacy id and entity of each new row, and the legacy id and
+        stored entity of each row already imported.
+        :rtype: Tuple[List[Tuple[Optional[str], pythoneda.shared.Entity]], List[Tuple[Optional[str], pythoneda.shared.Entity]]]
+        """
+        entity_name = table.entity_class.__name__
+        entities = []
+        for row, legacy_id, values in rows:
+            try:
+                entities.append((row, legacy_id, table.from_dict(values)))
+            except (TypeError, ValueError) as error:
+                report.add_rejected(entity_name, source, row, str(error))
+        if not table.primary_key:
+            return [(legacy_id, entity) for _, legacy_id, entity in entities], []
+        existing = repo.find_by_pks(
+            [table.primary_key_dict(entity) for _, _, entity in entities]
+        )
+        result = []
+        seen = set()
+        skipped = []
+        for (row, legacy_id, entity), stored in zip(entities, existing):
+            pk = table.primary_key_of(entity)
+            if stored is not None:
+                skipped.append((legacy_id, stored))
+            elif pk in seen:
+                report.add_rejected(
+                    entity_name, source, row, f"repeated primary key {pk}"
+                )
+            else:
+                seen.add(pk)
+                result.append((legacy_id, entity))
+        if skipped:
+            report.add_skipped(entity_name, len(skipped))
+        return result, skipped
@@ -0,0 +1,136 @@
+"""
+org/acmsl/licdata/bulk/id_map.py
+
+This file defines the IdMap class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class IdMap:
+    """
+    Maps the ids of a legacy system to the ids of the imported entities.
+
+    Class name: IdMap
+
+    Responsibilities:
+        - Resolves the legacy id of an entity to its new id.
+        - Records new mappings as entities get imported.
+        - Persists the mappings in an append-only journal, so an interrupted
+          import can resume.
+
+    Collaborators:
+        - BulkImporter: Resolves references through it.
+    """
+
+    def __init__(self, journalPath: Optional[str] = None):
+        """
+        Creates a new IdMap instance, loading the journal if it exists.
+        :param journalPath: The journal file, or None to keep mappings in memory.
+        :type journalPath: Optional[str]
+        """
+        self._ids: Dict[str, Dict[str, str]] = {}
+        self._journal_path = journalPath
+        self._journal = None
+        if journalPath is not None and os.path.exists(journalPath):
+            with open(journalPath, "r", encoding="utf-8") as journal:
+                for line in journal:
+                    if line.strip():
+                        entity_name, legacy_id, id = json.loads(line)
+                        self._ids.setdefault(entity_name, {})[legacy_id] = id
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of mappings.
+        :return: Such number.
+        :rtype: int
+        """
+        return sum(len(ids) for ids in self._ids.values())
+
+    def knows(self, entityName: str) -> bool:
+        """
+        Checks whether there are mappings of given entity class.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :return: True in such case.
+        :rtype: bool
+        """
+        return bool(self._ids.get(entityName))
+
+    def get(self, entityName: str, legacyId: str) -> Optional[str]:
+        """
+        Retrieves the new id of an entity.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param legacyId: The id in the legacy system.
+        :type legacyId: str
+        :return: The new id, or None if it's not known.
+        :rtype: Optional[str]
+        """
+        ids = self._ids.get(entityName)
+        return None if ids is None else ids.get(legacyId)
+
+    def add(self, entityName: str, legacyId: str, id: str):
+        """
+        Records the new id of an entity.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param legacyId: The id in the legacy system.
+        :type legacyId: str
+        :param id: The new id.
+        :type id: str
+        """
+        self.add_all(entityName, ((legacyId, id),))
+
+    def add_all(self, entityName: str, pairs: Iterable[Tuple[str, str]]):
+        """
+        Records the new ids of several entities of the same class.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param pairs: The legacy ids and their new ids.
+        :type pairs: Iterable[Tuple[str, str]]
+        """
+        ids = self._ids.setdefault(entityName, {})
+        lines = []
+        for legacy_id, id in pairs:
+            ids[legacy_id] = id
+            if self._journal_path is not None:
+                lines.append(json.dumps([entityName, legacy_id, id]) + "\n")
+        if lines:
+            if self._journal is None:
+                self._journal = open(self._journal_path, "a", encoding="utf-8")
+            self._journal.writelines(lines)
+
+    def flush(self):
+        """
+        Makes sure the journal is on disk.
+        """
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    def close(self):
+        """
+        Flushes and closes the journal.
+        """
+        if self._journal is not None:
+            self.flush()
+            self._journal.close()
+            self._journal = None
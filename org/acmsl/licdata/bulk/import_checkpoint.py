@@ -0,0 +1,77 @@
+"""
+org/acmsl/licdata/bulk/import_checkpoint.py
+
+This file defines the ImportCheckpoint class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+from typing import Dict
+
+
+class ImportCheckpoint:
+    """
+    The progress of a bulk import, so it can resume after an interruption.
+
+    Class name: ImportCheckpoint
+
+    Responsibilities:
+        - Knows how many rows of each source have been imported.
+        - Persists it atomically, after each chunk.
+
+    Collaborators:
+        - BulkImporter: Advances it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Creates a new ImportCheckpoint instance, loading it if it exists.
+        :param path: The checkpoint file.
+        :type path: str
+        """
+        self._path = path
+        self._rows_done: Dict[str, int] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as checkpoint:
+                self._rows_done = json.load(checkpoint)
+
+    def rows_done(self, source: str) -> int:
+        """
+        Retrieves the number of rows already imported from given source.
+        :param source: The path of the source.
+        :type source: str
+        :return: Such number.
+        :rtype: int
+        """
+        return self._rows_done.get(source, 0)
+
+    def advance(self, source: str, rowsDone: int):
+        """
+        Records the rows imported from given source so far.
+        :param source: The path of the source.
+        :type source: str
+        :param rowsDone: The number of rows.
+        :type rowsDone: int
+        """
+        self._rows_done[source] = rowsDone
+        temporary = f"{self._path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as checkpoint:
+            json.dump(self._rows_done, checkpoint)
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        os.replace(temporary, self._path)
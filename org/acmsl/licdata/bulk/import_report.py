@@ -0,0 +1,132 @@
+"""
+org/acmsl/licdata/bulk/import_report.py
+
+This file defines the ImportReport class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, List
+
+
+class ImportReport:
+    """
+    The outcome of a bulk import.
+
+    Class name: ImportReport
+
+    Responsibilities:
+        - Counts the imported, skipped and rejected rows of each entity.
+        - Keeps the first errors, with the source and row they come from.
+
+    Collaborators:
+        - BulkImporter: Fills it.
+    """
+
+    def __init__(self, maxErrors: int = 100):
+        """
+        Creates a new ImportReport instance.
+        :param maxErrors: The maximum number of errors to keep.
+        :type maxErrors: int
+        """
+        self._max_errors = maxErrors
+        self._imported: Dict[str, int] = {}
+        self._skipped: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        self._errors: List[str] = []
+
+    @property
+    def imported(self) -> Dict[str, int]:
+        """
+        Retrieves the number of imported rows.
+        :return: Such number, by entity class name.
+        :rtype: Dict[str, int]
+        """
+        return self._imported
+
+    @property
+    def skipped(self) -> Dict[str, int]:
+        """
+        Retrieves the number of rows whose primary key was already stored.
+        :return: Such number, by entity class name.
+        :rtype: Dict[str, int]
+        """
+        return self._skipped
+
+    @property
+    def rejected(self) -> Dict[str, int]:
+        """
+        Retrieves the number of rejected rows.
+        :return: Such number, by entity class name.
+        :rtype: Dict[str, int]
+        """
+        return self._rejected
+
+    @property
+    def errors(self) -> List[str]:
+        """
+        Retrieves the first errors.
+        :return: Their descriptions.
+        :rtype: List[str]
+        """
+        return self._errors
+
+    def add_imported(self, entityName: str, count: int):
+        """
+        Counts imported rows.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param count: The number of rows.
+        :type count: int
+        """
+        self._imported[entityName] = self._imported.get(entityName, 0) + count
+
+    def add_skipped(self, entityName: str, count: int):
+        """
+        Counts rows whose primary key was already stored.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param count: The number of rows.
+        :type count: int
+        """
+        self._skipped[entityName] = self._skipped.get(entityName, 0) + count
+
+    def add_rejected(self, entityName: str, source: str, row: int, error: str):
+        """
+        Counts a rejected row.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :param source: The path of the source.
+        :type source: str
+        :param row: The number of the row, starting at 1.
+        :type row: int
+        :param error: Why it was rejected.
+        :type error: str
+        """
+        self._rejected[entityName] = self._rejected.get(entityName, 0) + 1
+        if len(self._errors) < self._max_errors:
+            self._errors.append(f"{source}:{row}: {error}")
+
+    def __repr__(self) -> str:
+        """
+        Retrieves a summary of the report.
+        :return: Such summary.
+        :rtype: str
+        """
+        return (
+            f"ImportReport(imported={self._imported}, skipped={self._skipped}, "
+            f"rejected={self._rejected})"
+        )
@@ -0,0 +1,284 @@
+"""
+org/acmsl/licdata/bulk/record_parser.py
+
+This file defines the RecordParser class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from ..field_table import FieldTable
+import csv
+import datetime
+import inspect
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ParsedRow = Tuple[int, Optional[str], Optional[Dict[str, Any]], Optional[str]]
+"""
+A parsed row: its number, its legacy id, its field values, and the error if
+it's not valid (in which case there are no values).
+"""
+
+
+def _to_date(value: Any) -> datetime.date:
+    """
+    Converts given value to a date.
+    :param value: The value, either a date or an ISO-8601 string.
+    :type value: Any
+    :return: The date.
+    :rtype: datetime.date
+    """
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value)
+
+
+def _to_datetime(value: Any) -> datetime.datetime:
+    """
+    Converts given value to a timestamp.
+    :param value: The value, either a timestamp or an ISO-8601 string.
+    :type value: Any
+    :return: The timestamp.
+    :rtype: datetime.datetime
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.fromisoformat(value)
+
+
+def _to_int(value: Any) -> int:
+    """
+    Converts given value to an integer, without truncating decimals.
+    :param value: The value.
+    :type value: Any
+    :return: The integer.
+    :rtype: int
+    """
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"not an integer: {value}")
+        return int(value)
+    if isinstance(value, bool):
+        raise ValueError(f"not an integer: {value}")
+    return int(value)
+
+
+def _to_str(value: Any) -> str:
+    """
+    Converts given value to a string.
+    :param value: The value.
+    :type value: Any
+    :return: The string.
+    :rtype: str
+    """
+    return value if isinstance(value, str) else str(value)
+
+
+_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {
+    datetime.date: _to_date,
+    datetime.datetime: _to_datetime,
+    float: float,
+    int: _to_int,
+    str: _to_str,
+}
+
+
+class RecordParser:
+    """
+    Parses and validates the rows of a CSV or JSONL source.
+
+    Class name: RecordParser
+
+    Responsibilities:
+        - Parses rows into the field values of an entity class.
+        - Converts values to the types annotated in the field table.
+        - Rejects rows lacking the fields the constructor requires.
+
+    Collaborators:
+        - FieldTable: Provides the fields, their types and their parameters.
+        - BulkImporter: Feeds it chunks of rows, possibly in other processes.
+
+    Parsers are picklable, so chunks can be parsed by a process pool. CSV
+    records must not span lines, since chunks are split by lines.
+    """
+
+    def __init__(
+        self,
+        entityClass: type,
+        format: str,
+        fieldnames: Optional[Sequence[str]] = None,
+        idField: str = "id",
+    ):
+        """
+        Creates a new RecordParser instance.
+        :param entityClass: The class of the entities.
+        :type entityClass: type
+        :param format: Either "csv" or "jsonl".
+        :type format: str
+        :param fieldnames: The columns of the CSV source, from its header.
+        :type fieldnames: Optional[Sequence[str]]
+        :param idField: The column holding the legacy id.
+        :type idField: str
+        """
+        if format not in ("csv", "jsonl"):
+            raise ValueError(f"Unsupported format: {format}")
+        if format == "csv" and not fieldnames:
+            raise ValueError("CSV sources require the column names")
+        self._entity_class = entityClass
+        self._format = format
+        self._fieldnames = None if fieldnames is None else tuple(fieldnames)
+        self._id_field = idField
+        self._converters = None
+        self._required = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Retrieves the state to pickle, leaving out what's derived from the class.
+        :return: Such state.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "entity_class": self._entity_class,
+            "format": self._format,
+            "fieldnames": self._fieldnames,
+            "id_field": self._id_field,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """
+        Restores a pickled parser.
+        :param state: The pickled state.
+        :type state: Dict[str, Any]
+        """
+        self.__init__(
+            state["entity_class"],
+            state["format"],
+            state["fieldnames"],
+            state["id_field"],
+        )
+
+    @property
+    def entity_class(self) -> type:
+        """
+        Retrieves the class of the entities.
+        :return: Such class.
+        :rtype: type
+        """
+        return self._entity_class
+
+    def _prepare(self):
+        """
+        Builds the converter of each field, and the list of required fields.
+        """
+        table = FieldTable.of(self._entity_class)
+        self._converters = {
+            field.name: _CONVERTERS.get(field.value_type, lambda value: value)
+            for field in table.fields
+        }
+        parameters = inspect.signature(self._entity_class.__init__).parameters
+        self._required = tuple(
+            field.name
+            for field in table.fields
+            if field.parameter in parameters
+            and parameters[field.parameter].default is inspect.Parameter.empty
+        )
+
+    def _records(self, lines: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Splits given lines into raw records.
+        :param lines: The lines.
+        :type lines: List[str]
+        :return: The records, with None for blank lines.
+        :rtype: List[Optional[Dict[str, Any]]]
+        """
+        if self._format == "jsonl":
+            return [json.loads(line) if line.strip() else None for line in lines]
+        fieldnames = self._fieldnames
+        return [
+            dict(zip(fieldnames, row)) if row else None for row in csv.reader(lines)
+        ]
+
+    def parse(self, firstRow: int, lines: List[str]) -> List[ParsedRow]:
+        """
+        Parses given lines.
+        :param firstRow: The number of the first line.
+        :type firstRow: int
+        :param lines: The lines.
+        :type lines: List[str]
+        :return: The parsed rows, skipping blank lines.
+        :rtype: List[ParsedRow]
+        """
+        if self._converters is None:
+            self._prepare()
+        converters = self._converters
+        id_field = self._id_field
+        result = []
+        try:
+            records = self._records(lines)
+        except (ValueError, csv.Error):
+            # isolate the malformed line(s)
+            if len(lines) == 1:
+                return [(firstRow, None, None, "malformed record")]
+            for offset, line in enumerate(lines):
+                result.extend(self.parse(firstRow + offset, [line]))
+            return result
+        for offset, record in enumerate(records):
+            if record is None:
+                continue
+            row = firstRow + offset
+            if not isinstance(record, dict):
+                result.append((row, None, None, "malformed record"))
+                continue
+            legacy_id = record.get(id_field)
+            legacy_id = None if legacy_id in (None, "") else str(legacy_id)
+            values = {}
+            error = None
+            for name, value in record.items():
+                converter = converters.get(name)
+                if converter is None or value is None or value == "":
+                    continue
+                try:
+                    values[name] = converter(value)
+                except (TypeError, ValueError):
+                    error = f"invalid {name}: {value!r}"
+                    break
+            if error is None:
+                missing = [name for name in self._required if name not in values]
+                if missing:
+                    error = f"missing {', '.join(missing)}"
+            if error is None:
+                result.append((row, legacy_id, values, None))
+            else:
+                result.append((row, legacy_id, None, error))
+        return result
+
+
+def parse_chunk(
+    parser: RecordParser, firstRow: int, lines: List[str]
+) -> List[ParsedRow]:
+    """
+    Parses a chunk of lines. It's a module-level function so that process
+    pools can run it.
+    :param parser: The parser.
+    :type parser: org.acmsl.licdata.bulk.RecordParser
+    :param firstRow: The number of the first line.
+    :type firstRow: int
+    :param lines: The lines.
+    :type lines: List[str]
+    :return: The parsed rows.
+    :rtype: List[ParsedRow]
+    """
+    return parser.parse(firstRow, lines)
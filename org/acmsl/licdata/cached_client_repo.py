@@ -0,0 +1,53 @@
+"""
+org/acmsl/licdata/cached_client_repo.py
+
+This file defines the CachedClientRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .cached_repo import CachedRepo
+from .client_repo import ClientRepo
+from typing import Optional
+
+
+class CachedClientRepo(CachedRepo, ClientRepo):
+    """
+    A ClientRepo that caches the clients of another ClientRepo.
+
+    Class name: CachedClientRepo
+
+    Responsibilities:
+        - Avoids hitting the backing store for recently accessed clients.
+
+    Collaborators:
+        - CachedRepo: Provides the caching behavior.
+        - ClientRepo: The port being cached.
+    """
+
+    def __init__(
+        self, delegate: ClientRepo, maxSize: int = 1024, ttl: Optional[float] = None
+    ):
+        """
+        Creates a new CachedClientRepo instance.
+        :param delegate: The repository to wrap.
+        :type delegate: org.acmsl.licdata.ClientRepo
+        :param maxSize: The maximum number of cached clients.
+        :type maxSize: int
+        :param ttl: The time-to-live of each entry, in seconds, or None.
+        :type ttl: Optional[float]
+        """
+        super().__init__(delegate, maxSize=maxSize, ttl=ttl)
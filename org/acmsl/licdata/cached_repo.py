@@ -0,0 +1,244 @@
+"""
+org/acmsl/licdata/cached_repo.py
+
+This file defines the CachedRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .entity_cache import EntityCache
+from pythoneda.shared import Entity, Event, Repo
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class CachedRepo:
+    """
+    A read-through, write-invalidated caching layer in front of a repository.
+
+    Class name: CachedRepo
+
+    Responsibilities:
+        - Serves find_by_id and find_by_pk from an EntityCache when possible.
+        - Forwards every write to the wrapped repository.
+        - Invalidates cached entities affected by writes or by incoming events.
+
+    Collaborators:
+        - EntityCache: Stores the entities.
+        - pythoneda.shared.Repo: The wrapped repository.
+
+    It's meant to be mixed in before the repository port it caches, i.e.
+    `class CachedLicenseRepo(CachedRepo, LicenseRepo)`, so the result can be
+    registered and resolved as the original port.
+    """
+
+    def __init__(
+        self, delegate: Repo, maxSize: int = 1024, ttl: Optional[float] = None
+    ):
+        """
+        Creates a new CachedRepo instance.
+        :param delegate: The repository to wrap.
+        :type delegate: pythoneda.shared.Repo
+        :param maxSize: The maximum number of cached entries.
+        :type maxSize: int
+        :param ttl: The time-to-live of each entry, in seconds, or None.
+        :type ttl: Optional[float]
+        """
+        super().__init__()
+        self._delegate = delegate
+        self._cache = EntityCache(maxSize=maxSize, ttl=ttl)
+
+    @property
+    def delegate(self) -> Repo:
+        """
+        Retrieves the wrapped repository.
+        :return: Such repository.
+        :rtype: pythoneda.shared.Repo
+        """
+        return self._delegate
+
+    @property
+    def cache(self) -> EntityCache:
+        """
+        Retrieves the cache, i.e. to check its hit and miss counters.
+        :return: Such cache.
+        :rtype: org.acmsl.licdata.EntityCache
+        """
+        return self._cache
+
+    def find_by_id(self, id: str) -> Optional[Entity]:
+        """
+        Retrieves the entity with given id.
+        :param id: The entity id.
+        :type id: str
+        :return: The entity, or None if not found.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        result = self._cache.get(EntityCache.id_key(id))
+        if result is None:
+            result = self._delegate.find_by_id(id)
+            if result is not None:
+                self._cache.put(result)
+        return result
+
+    def find_by_pk(self, pk: Dict[str, Any]) -> Optional[Entity]:
+        """
+        Retrieves the entity with given primary key.
+        :param pk: The primary key.
+        :type pk: Dict[str, Any]
+        :return: The entity, or None if not found.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        result = self._cache.get(EntityCache.pk_key(pk))
+        if result is None:
+            result = self._delegate.find_by_pk(pk)
+            if result is not None:
+                self._cache.put(result, pk)
+        return result
+
+    def find_by_pks(self, pks: List[Dict[str, Any]]) -> List[Optional[Entity]]:
+        """
+        Retrieves the entities matching given primary keys. Only the keys
+        not found in the cache are forwarded, in a single lookup.
+        :param pks: The primary keys.
+        :type pks: List[Dict[str, Any]]
+        :return: The matching entities (or None), in the same order as the keys.
+        :rtype: List[Optional[pythoneda.shared.Entity]]
+        """
+        result = [self._cache.get(EntityCache.pk_key(pk)) for pk in pks]
+        missing = [index for index, entity in enumerate(result) if entity is None]
+        if missing:
+            found = self._delegate.find_by_pks([pks[index] for index in missing])
+            for index, entity in zip(missing, found):
+                if entity is not None:
+                    self._cache.put(entity, pks[index])
+                result[index] = entity
+        return result
+
+    def find_by_index(self, attribute: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose indexed attribute has given value.
+        Such lookups are never cached.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        return self._delegate.find_by_index(attribute, value)
+
+    def list(self) -> List[Entity]:
+        """
+        Retrieves all entities. Listings are never cached.
+        :return: Such entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        return self._delegate.list()
+
+    def list_page(
+        self, pageSize: int, continuationToken: Optional[str] = None
+    ) -> Tuple[List[Entity], Optional[str]]:
+        """
+        Retrieves a page of entities. Listings are never cached.
+        :param pageSize: The maximum number of entities in the page.
+        :type pageSize: int
+        :param continuationToken: The token returned with the previous page, if any.
+        :type continuationToken: Optional[str]
+        :return: The entities, and the token of the next page (None if it's the last one).
+        :rtype: Tuple[List[pythoneda.shared.Entity], Optional[str]]
+        """
+        return self._delegate.list_page(pageSize, continuationToken)
+
+    def insert(self, item: Any) -> Any:
+        """
+        Inserts given item.
+        :param item: The item to insert.
+        :type item: Any
+        :return: The outcome of the insertion.
+        :rtype: Any
+        """
+        result = self._delegate.insert(item)
+        self.on_event(result)
+        return result
+
+    def insert_all(self, items: List[Any]) -> List[Any]:
+        """
+        Inserts given items.
+        :param items: The items to insert.
+        :type items: List[Any]
+        :return: The outcome of each insertion.
+        :rtype: List[Any]
+        """
+        result = self._delegate.insert_all(items)
+        for outcome in result:
+            self.on_event(outcome)
+        return result
+
+    def insert_if_absent(self, item: Any, pk: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Inserts given item, unless an entity with given primary key already exists.
+        :param item: The item to insert.
+        :type item: Any
+        :param pk: The primary key of the entity the item would create.
+        :type pk: Dict[str, Any]
+        :return: Either the outcome of the insertion and True, or the existing
+        entity and False.
+        :rtype: Tuple[Any, bool]
+        """
+        result, created = self._delegate.insert_if_absent(item, pk)
+        if created:
+            self.on_event(result)
+        else:
+            self._cache.put(result, pk)
+        return result, created
+
+    def update(self, item: Any) -> Any:
+        """
+        Updates an entity.
+        :param item: The update request.
+        :type item: Any
+        :return: The outcome of the update.
+        :rtype: Any
+        """
+        self.on_event(item)
+        result = self._delegate.update(item)
+        self.on_event(result)
+        return result
+
+    def delete(self, item: Any) -> Any:
+        """
+        Deletes an entity.
+        :param item: The deletion request.
+        :type item: Any
+        :return: The outcome of the deletion.
+        :rtype: Any
+        """
+        self.on_event(item)
+        result = self._delegate.delete(item)
+        self.on_event(result)
+        return result
+
+    def on_event(self, event: Optional[Event]):
+        """
+        Invalidates the cached entity affected by given event, if any.
+        Infrastructure can forward the ClientUpdated / ClientDeleted events
+        published by other processes here, to keep their caches coherent.
+        :param event: The event.
+        :type event: Optional[pythoneda.shared.Event]
+        """
+        entity_id = getattr(event, "entity_id", None)
+        if entity_id is not None:
+            self._cache.invalidate(entity_id)
@@ -0,0 +1,171 @@
+"""
+org/acmsl/licdata/causation_chain.py
+
+This file defines the CausationChain class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections.abc import Sequence
+from pythoneda.shared import Event
+from typing import Iterator, List, Optional
+
+
+class CausationChain(Sequence):
+    """
+    The ids of the events causing an event, sharing its tail with its parent chain.
+
+    Class name: CausationChain
+
+    Responsibilities:
+        - References the ancestry of an event in constant time and space,
+          through a pointer to the causing event's own chain.
+        - Resolves the full lineage, oldest first, on demand.
+
+    Collaborators:
+        - pythoneda.shared.Event: Provides the ids and the chains.
+
+    Events hold it as their previousEventIds. It's only flattened, through
+    to_list(), when they get marshalled, i.e. by BinaryCodec or by a JSON
+    `default` hook.
+    """
+
+    __slots__ = ("_event_id", "_parent", "_depth")
+
+    def __init__(self, eventId: str, parent: Optional[Sequence] = None):
+        """
+        Creates a new CausationChain instance.
+        :param eventId: The id of the most recent event in the chain.
+        :type eventId: str
+        :param parent: The ids of the events preceding it, oldest first.
+        :type parent: Optional[Sequence[str]]
+        """
+        self._event_id = eventId
+        self._parent = parent
+        self._depth = 1 if parent is None else len(parent) + 1
+
+    @classmethod
+    def following(cls, event: Event) -> "CausationChain":
+        """
+        Builds the chain of the events caused by given event.
+        :param event: The causing event.
+        :type event: pythoneda.shared.Event
+        :return: Its previous event ids, followed by its own id.
+        :rtype: org.acmsl.licdata.CausationChain
+        """
+        return cls(event.id, event.previous_event_ids or None)
+
+    @property
+    def event_id(self) -> str:
+        """
+        Retrieves the id of the most recent event in the chain.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._event_id
+
+    @property
+    def parent(self) -> Optional[Sequence]:
+        """
+        Retrieves the ids of the events preceding the most recent one.
+        :return: Such ids, oldest first.
+        :rtype: Optional[Sequence[str]]
+        """
+        return self._parent
+
+    @property
+    def depth(self) -> int:
+        """
+        Retrieves the number of events in the chain.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._depth
+
+    def to_list(self) -> List[str]:
+        """
+        Resolves the full lineage.
+        :return: The event ids, oldest first.
+        :rtype: List[str]
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of events in the chain.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._depth
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the event ids, oldest first.
+        :return: Such iterator.
+        :rtype: Iterator[str]
+        """
+        newest_first = []
+        node = self
+        while isinstance(node, CausationChain):
+            newest_first.append(node._event_id)
+            node = node._parent
+        if node is not None:
+            yield from node
+        yield from reversed(newest_first)
+
+    def __getitem__(self, index):
+        """
+        Retrieves the event id at given position, oldest first.
+        :param index: The position or slice.
+        :type index: int or slice
+        :return: Such id or ids.
+        :rtype: str or List[str]
+        """
+        if index == -1 or index == self._depth - 1:
+            return self._event_id
+        return self.to_list()[index]
+
+    def __add__(self, other: Sequence) -> List[str]:
+        """
+        Concatenates the lineage with other ids, as lists do.
+        :param other: The other ids.
+        :type other: Sequence[str]
+        :return: The concatenation.
+        :rtype: List[str]
+        """
+        return self.to_list() + list(other)
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks whether given sequence holds the same ids.
+        :param other: The other sequence.
+        :type other: Any
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == self._depth and self.to_list() == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of the chain.
+        :return: Such representation.
+        :rtype: str
+        """
+        return repr(self.to_list())
@@ -19,6 +19,8 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .async_repo import AsyncRepo
+from .causation_chain import CausationChain
 from org.acmsl.licdata.events.clients import (
     BaseClientEvent,
     ClientAlreadyExists,
@@ -34,19 +36,16 @@ from org.acmsl.licdata.events.clients import (
     NoMatchingClientsFound,
     UpdateClientRequested,
 )
-from pythoneda.shared import (
-    attribute,
-    Entity,
-    Event,
-    EventListener,
-    EventReference,
-    listen,
-    Ports,
-    primary_key_attribute,
-)
-from typing import List, Optional
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from .ordered_dispatcher import OrderedDispatcher
+from .replay_error import ReplayError
+from pythoneda.shared import Entity, Event, EventListener, EventReference, listen
+import logging
+from typing import AsyncIterator, Hashable, List, Optional
 
 
+@with_field_table
 class Client(Entity, EventListener):
     """
     Represents a client.
@@ -57,17 +56,23 @@ class Client(Entity, EventListener):
         - Contains all relevant information about a client.
 
     Collaborators:
-        - None
+        - ClientRepo: Persists the clients.
 
     """
 
+    __slots__ = ("_email", "_address", "_contact", "_phone", "_primary_key")
+
+    _repo_handle = None
+
+    _async_repo = None
+
     def __init__(
         self,
         email: str,
         address: Optional[str] = None,
         contact: Optional[str] = None,
         phone: Optional[str] = None,
-        eventHistory: List[EventReference] = [],
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new Client instance.
@@ -80,14 +85,15 @@ class Client(Entity, EventListener):
         :param phone: The phone.
         :type phone: Optional[str]
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._email = email
         self._address = address
         self._contact = contact
         self._phone = phone
-        super().__init__(eventHistory=eventHistory)
-        print(f"email: {email}, address: {address}, contact: {contact}, phone: {phone}")
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @classmethod
     def empty(cls):
@@ -104,7 +110,14 @@ class Client(Entity, EventListener):
         :param event: The updated event.
         :type event: org.acmsl.licdata.events.clients.ClientUpdated
         """
-        print(f"Applying updated event: {event}")
+        logger = self.__class__.logger()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying %s %s to client %s",
+                event.__class__.__name__,
+                event.id,
+                self.id,
+            )
         self._address = event.address
         self._contact = event.contact
         self._phone = event.phone
@@ -127,6 +140,36 @@ class Client(Entity, EventListener):
             eventHistory=[EventReference(event.id, event.__class__.__name__)],
         )
 
+    @classmethod
+    def replay(
+        cls,
+        event: Event,
+        client: Optional["Client"] = None,
+        entityId: Optional[str] = None,
+    ) -> "Client":
+        """
+        Applies given event to rebuild a client from its event stream.
+        :param event: The event.
+        :type event: pythoneda.shared.Event
+        :param client: The client rebuilt so far, if any.
+        :type client: Optional[org.acmsl.licdata.Client]
+        :param entityId: The id of the client, to keep it when the creation
+        event gets replayed.
+        :type entityId: Optional[str]
+        :return: The client after applying the event.
+        :rtype: org.acmsl.licdata.Client
+        """
+        if isinstance(event, NewClientRequested):
+            result = cls._create_instance_from(event)
+            if entityId is not None:
+                result.restore_id(entityId)
+            return result
+        if client is None:
+            raise ReplayError(cls, event)
+        if isinstance(event, ClientUpdated):
+            client.apply_updated(event)
+        return client
+
     def create_created_event(
         self, createRequested: NewClientRequested
     ) -> NewClientCreated:
@@ -143,9 +186,7 @@ class Client(Entity, EventListener):
             address=self.address,
             contact=self.contact,
             phone=self.phone,
-            previousEventIds=(
-                createRequested.previous_event_ids + [createRequested.id]
-            ),
+            previousEventIds=CausationChain.following(createRequested),
         )
 
     def create_deleted_event(
@@ -164,7 +205,7 @@ class Client(Entity, EventListener):
             address=self.address,
             contact=self.contact,
             phone=self.phone,
-            previousEventIds=deleteRequest.previous_event_ids + [deleteRequest.id],
+            previousEventIds=CausationChain.following(deleteRequest),
         )
 
     @property
@@ -217,7 +258,7 @@ class Client(Entity, EventListener):
 
     @property
     @attribute
-    def phone(self):
+    def phone(self) -> str:
         """
         Retrieves the phone.
         :return: Such phone.
@@ -234,6 +275,80 @@ class Client(Entity, EventListener):
         """
         self._phone = newValue
 
+    @classmethod
+    def repo(cls):
+        """
+        Retrieves the repository of clients, resolving it only when needed.
+        :return: Such repository.
+        :rtype: org.acmsl.licdata.ClientRepo
+        """
+        handle = Client._repo_handle
+        if handle is None:
+            from .client_repo import ClientRepo
+
+            handle = ClientRepo.handle()
+            Client._repo_handle = handle
+        return handle.get()
+
+    @classmethod
+    def async_repo(cls) -> AsyncRepo:
+        """
+        Retrieves the non-blocking version of the repository of clients.
+        :return: Such repository.
+        :rtype: org.acmsl.licdata.AsyncRepo
+        """
+        repo = cls.repo()
+        cached = Client._async_repo
+        if cached is None or cached[0] is not repo:
+            cached = (repo, AsyncRepo.of(repo))
+            Client._async_repo = cached
+        return cached[1]
+
+    @classmethod
+    def ordering_key(cls, event: Event) -> Hashable:
+        """
+        Retrieves the key whose events must be handled in order.
+        :param event: The event.
+        :type event: pythoneda.shared.Event
+        :return: The entity id, or the email for clients not created yet.
+        :rtype: Hashable
+        """
+        result = getattr(event, "entity_id", None)
+        if result is None:
+            result = getattr(event, "email", None)
+        if result is None:
+            # events not about a particular client can run in any order
+            result = event.id
+        return result
+
+    @classmethod
+    async def dispatch(cls, event: Event, dispatcher: OrderedDispatcher) -> List[Event]:
+        """
+        Handles given event through a dispatcher, so events of different clients
+        run concurrently while the ones of the same client keep their order.
+        :param event: The event.
+        :type event: pythoneda.shared.Event
+        :param dispatcher: The dispatcher.
+        :type dispatcher: org.acmsl.licdata.OrderedDispatcher
+        :return: The outcome of the listener of the event.
+        :rtype: List[pythoneda.shared.Event]
+        """
+        listener = getattr(cls, f"listen_{event.__class__.__name__}", None)
+        if listener is None:
+            return []
+
+        async def handle():
+            result = await listener(event)
+            for outcome in result:
+                entity_id = getattr(outcome, "entity_id", None)
+                email = getattr(outcome, "email", None)
+                if entity_id is not None and email is not None:
+                    # later events refer to the client by id, not by email
+                    dispatcher.alias(entity_id, email)
+            return result
+
+        return await dispatcher.dispatch(cls.ordering_key(event), handle)
+
     @classmethod
     @listen(NewClientRequested)
     async def listen_NewClientRequested(
@@ -246,34 +361,111 @@ class Client(Entity, EventListener):
         :return: The event representing a new client has been created.
         :rtype event: List[org.acmsl.licdata.events.clients.BaseClientEvent]
         """
-        from .client_repo import ClientRepo
-
-        cls.logger().info(f"New client requested: {newClientRequested}")
+        cls.logger().info("New client requested: %s", newClientRequested)
 
         result = []
 
-        repo = Ports.instance().resolve_first(ClientRepo)
+        repo = cls.async_repo()
 
-        existing_client = repo.find_by_pk({"email": newClientRequested.email})
+        outcome, created = await repo.insert_if_absent(
+            newClientRequested, {"email": newClientRequested.email}
+        )
 
-        if existing_client is None:
-            result.append(repo.insert(newClientRequested))
+        if created:
+            result.append(outcome)
         else:
-            result.append(
-                ClientAlreadyExists(
-                    id=existing_client.id,
-                    email=existing_client.email,
-                    address=existing_client.address,
-                    contact=existing_client.contact,
-                    phone=existing_client.phone,
-                    previousEventIds=(
-                        newClientRequested.previous_event_ids + [newClientRequested.id]
-                    ),
-                )
+            result.append(cls._create_already_exists_event(outcome, newClientRequested))
+
+        return result
+
+    @classmethod
+    async def listen_NewClientRequested_in_batch(
+        cls, newClientRequests: List[NewClientRequested]
+    ) -> List[BaseClientEvent]:
+        """
+        Receives a batch of events requesting the creation of new clients.
+        It performs a single existence lookup and a single insertion,
+        regardless of the size of the batch.
+        :param newClientRequests: The requests.
+        :type newClientRequests: List[org.acmsl.licdata.events.NewClientRequested]
+        :return: The outcome of each request, in the same order.
+        :rtype: List[org.acmsl.licdata.events.clients.BaseClientEvent]
+        """
+        cls.logger().info("New clients requested: %d", len(newClientRequests))
+
+        repo = cls.async_repo()
+
+        pending = {}
+        for request in newClientRequests:
+            pending.setdefault(request.email, request)
+
+        existing_clients = dict(
+            zip(
+                pending.keys(),
+                await repo.find_by_pks([{"email": email} for email in pending.keys()]),
             )
+        )
+
+        to_insert = [
+            request
+            for email, request in pending.items()
+            if existing_clients[email] is None
+        ]
+        created = dict(
+            zip(
+                [request.email for request in to_insert],
+                await repo.insert_all(to_insert),
+            )
+        )
+
+        result = []
+
+        for request in newClientRequests:
+            existing_client = existing_clients[request.email]
+            if existing_client is not None:
+                result.append(
+                    cls._create_already_exists_event(existing_client, request)
+                )
+            elif pending[request.email] is request:
+                result.append(created[request.email])
+            else:
+                # the same email was requested earlier in this batch
+                created_event = created[request.email]
+                result.append(
+                    ClientAlreadyExists(
+                        id=created_event.entity_id,
+                        email=created_event.email,
+                        address=created_event.address,
+                        contact=created_event.contact,
+                        phone=created_event.phone,
+                        previousEventIds=CausationChain.following(request),
+                    )
+                )
 
         return result
 
+    @classmethod
+    def _create_already_exists_event(
+        cls, existingClient, createRequested: NewClientRequested
+    ) -> ClientAlreadyExists:
+        """
+        Creates a client already exists event.
+        :param existingClient: The client already stored.
+        :type existingClient: org.acmsl.licdata.Client
+        :param createRequested: The request.
+        :type createRequested: org.acmsl.licdata.events.NewClientRequested
+        :return: The event.
+        :rtype: org.acmsl.licdata.events.ClientAlreadyExists
+        """
+        return ClientAlreadyExists(
+            id=existingClient.id,
+            email=existingClient.email,
+            address=existingClient.address,
+            contact=existingClient.contact,
+            phone=existingClient.phone,
+            previousEventIds=CausationChain.following(createRequested),
+        )
+
     @classmethod
     @listen(FindClientByIdRequested)
     async def listen_FindClientByIdRequested(
@@ -286,24 +478,22 @@ class Client(Entity, EventListener):
         :return: The event representing the outcome of the operation.
         :rtype event: List[pythoneda.shared.Event]
         """
-        from .client_repo import ClientRepo
-
         result = []
 
-        repo = Ports.instance().resolve_first(ClientRepo)
+        repo = cls.async_repo()
 
-        existing_client = repo.find_by_id(event.entity_id)
+        existing_client = await repo.find_by_id(event.entity_id)
 
         if existing_client is None:
             no_matching_clients_found = NoMatchingClientsFound(
-                {}, event.previous_event_ids + [event.id]
+                {}, CausationChain.following(event)
             )
             result.append(no_matching_clients_found)
         else:
             result.append(
                 MatchingClientFound(
                     existing_client,
-                    event.previous_event_ids + [event.id],
+                    CausationChain.following(event),
                 )
             )
 
@@ -321,17 +511,15 @@ class Client(Entity, EventListener):
         :return: The event representing the outcome of the operation.
         :rtype event: List[pythoneda.shared.Event]
         """
-        from .client_repo import ClientRepo
-
         result = []
 
-        repo = Ports.instance().resolve_first(ClientRepo)
+        repo = cls.async_repo()
 
-        existing_clients = repo.list()
+        existing_clients = await repo.list()
 
         if len(existing_clients) == 0:
             no_matching_clients_found = NoMatchingClientsFound(
-                {}, event.previous_event_ids + [event.id]
+                {}, CausationChain.following(event)
             )
             result.append(no_matching_clients_found)
         else:
@@ -339,12 +527,46 @@ class Client(Entity, EventListener):
                 MatchingClientsFound(
                     existing_clients,
                     {},
-                    event.previous_event_ids + [event.id],
+                    CausationChain.following(event),
                 )
             )
 
         return result
 
+    @classmethod
+    async def stream_ListClientsRequested(
+        cls, event: ListClientsRequested, pageSize: int = 100
+    ) -> AsyncIterator[Event]:
+        """
+        Receives an event requesting the listing of clients, and emits the
+        clients in chunks, retrieving one page at a time from the repository.
+        :param event: The request.
+        :type event: org.acmsl.licdata.events.ListClientsRequested
+        :param pageSize: The maximum number of clients in each chunk.
+        :type pageSize: int
+        :return: The events representing the outcome of the operation.
+        :rtype event: AsyncIterator[pythoneda.shared.Event]
+        """
+        repo = cls.async_repo()
+
+        previous_event_ids = CausationChain.following(event)
+
+        clients, continuation_token = await repo.list_page(pageSize)
+
+        if not clients:
+            yield NoMatchingClientsFound({}, previous_event_ids)
+            return
+
+        while True:
+            yield MatchingClientsFound(clients, {}, previous_event_ids)
+            if continuation_token is None:
+                break
+            clients, continuation_token = await repo.list_page(
+                pageSize, continuation_token
+            )
+            if not clients:
+                break
+
     @classmethod
     @listen(DeleteClientRequested)
     async def listen_DeleteClientRequested(
@@ -357,13 +579,11 @@ class Client(Entity, EventListener):
         :return: The event representing a deleting a client has been requested.
         :rtype event: List[pythoneda.shared.Event]
         """
-        from .client_repo import ClientRepo
-
         result = []
 
-        repo = Ports.instance().resolve_first(ClientRepo)
+        repo = cls.async_repo()
 
-        result.append(repo.delete(event))
+        result.append(await repo.delete(event))
 
         return result
 
@@ -379,27 +599,22 @@ class Client(Entity, EventListener):
         :return: The event representing the request to update a client.
         :rtype event: List[pythoneda.shared.Event]
         """
-        from .client_repo import ClientRepo
-
         result = []
 
-        cls.logger().info(f"Update client requested: {updateClientRequested}")
+        cls.logger().info("Update client requested: %s", updateClientRequested)
 
-        repo = Ports.instance().resolve_first(ClientRepo)
+        repo = cls.async_repo()
 
-        existing_client = repo.find_by_id(updateClientRequested.entity_id)
+        existing_client = await repo.find_by_id(updateClientRequested.entity_id)
 
         if existing_client is None:
             result.append(
                 NoMatchingClientsFound(
                     id=updateClientRequested.entity_id,
-                    previousEventIds=(
-                        updateClientRequested.previous_event_ids
-                        + [updateClientRequested.id]
-                    ),
+                    previousEventIds=CausationChain.following(updateClientRequested),
                 )
             )
         else:
-            result.append(repo.update(updateClientRequested))
+            result.append(await repo.update(updateClientRequested))
 
         return result
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .client import Client
-from pythoneda.shared import Repo
 
 
-class ClientRepo(Repo):
+class ClientRepo(BaseRepo):
     """
-    A subclass of Repo that manages Clients.
+    A subclass of BaseRepo that manages Clients.
 
     Class name: ClientRepo
 
@@ -0,0 +1,212 @@
+"""
+org/acmsl/licdata/columnar_export.py
+
+This file defines the ColumnarExport class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .base_repo import BaseRepo
+from .license_expiry import _import_numpy
+from array import array
+from collections import Counter
+import datetime
+from typing import Any, Dict, Iterator, List, Sequence
+
+
+class ColumnarExport:
+    """
+    Streams the entities of a repository as columnar batches.
+
+    Class name: ColumnarExport
+
+    Responsibilities:
+        - Reads the repository one page at a time.
+        - Converts each page into one array per column: NumPy arrays if
+          available, array.array or lists otherwise.
+        - Dictionary-encodes the requested columns, sharing the dictionary
+          across batches.
+        - Aggregates the encoded columns without building Python objects.
+
+    Collaborators:
+        - BaseRepo: Provides the entities, through list_page().
+    """
+
+    LICENSE_COLUMNS = ("client_id", "product_id", "duration", "order_date")
+    """
+    The columns of License and Order.
+    """
+
+    ID_COLUMNS = ("client_id", "product_id")
+    """
+    The columns of License and Order worth dictionary-encoding.
+    """
+
+    def __init__(
+        self,
+        repo: BaseRepo,
+        columns: Sequence[str] = LICENSE_COLUMNS,
+        encodedColumns: Sequence[str] = ID_COLUMNS,
+        batchSize: int = 65536,
+    ):
+        """
+        Creates a new ColumnarExport instance.
+        :param repo: The repository.
+        :type repo: org.acmsl.licdata.BaseRepo
+        :param columns: The attributes to export.
+        :type columns: Sequence[str]
+        :param encodedColumns: The columns to dictionary-encode.
+        :type encodedColumns: Sequence[str]
+        :param batchSize: The maximum number of rows per batch.
+        :type batchSize: int
+        """
+        unknown = set(encodedColumns) - set(columns)
+        if unknown:
+            raise ValueError(f"Encoded columns not exported: {sorted(unknown)}")
+        self._repo = repo
+        self._columns = tuple(columns)
+        self._batch_size = batchSize
+        self._codes: Dict[str, Dict[Any, int]] = {
+            column: {} for column in encodedColumns
+        }
+        self._dictionaries: Dict[str, List[Any]] = {
+            column: [] for column in encodedColumns
+        }
+
+    @property
+    def columns(self) -> Sequence[str]:
+        """
+        Retrieves the exported columns.
+        :return: Their names.
+        :rtype: Sequence[str]
+        """
+        return self._columns
+
+    @property
+    def dictionaries(self) -> Dict[str, List[Any]]:
+        """
+        Retrieves the dictionaries of the encoded columns, as built so far.
+        The code of each value is its position in its dictionary.
+        :return: The values of each encoded column.
+        :rtype: Dict[str, List[Any]]
+        """
+        return self._dictionaries
+
+    def batches(self) -> Iterator[Dict[str, Sequence]]:
+        """
+        Exports the repository.
+        :return: The batches, each one mapping column names to arrays of equal length.
+        :rtype: Iterator[Dict[str, Sequence]]
+        """
+        token = None
+        while True:
+            items, token = self._repo.list_page(self._batch_size, token)
+            if items:
+                yield self._to_batch(items)
+            if token is None or not items:
+                break
+
+    def count_by(self, column: str) -> Dict[Any, int]:
+        """
+        Exports the repository, counting the rows of each value of an encoded
+        column, i.e. the licenses per product.
+        :param column: The encoded column.
+        :type column: str
+        :return: The number of rows of each value.
+        :rtype: Dict[Any, int]
+        """
+        if column not in self._codes:
+            raise ValueError(f"{column} is not dictionary-encoded")
+        numpy = _import_numpy()
+        if numpy is None:
+            totals = Counter()
+            for batch in self.batches():
+                totals.update(batch[column])
+            counts = [totals[code] for code in range(len(self._dictionaries[column]))]
+        else:
+            counts = numpy.zeros(0, dtype=numpy.int64)
+            for batch in self.batches():
+                partial = numpy.bincount(batch[column])
+                if len(partial) > len(counts):
+                    counts = numpy.pad(counts, (0, len(partial) - len(counts)))
+                counts[: len(partial)] += partial
+            counts = counts.tolist()
+        return dict(zip(self._dictionaries[column], counts))
+
+    def _to_batch(self, items: List[Any]) -> Dict[str, Sequence]:
+        """
+        Converts a page of entities into columns.
+        :param items: The entities.
+        :type items: List[pythoneda.shared.Entity]
+        :return: The columns.
+        :rtype: Dict[str, Sequence]
+        """
+        result = {}
+        for column in self._columns:
+            values = [getattr(item, column) for item in items]
+            if column in self._codes:
+                result[column] = self._encode(column, values)
+            else:
+                result[column] = self._to_array(values)
+        return result
+
+    def _encode(self, column: str, values: List[Any]) -> Sequence[int]:
+        """
+        Dictionary-encodes given values.
+        :param column: The column.
+        :type column: str
+        :param values: The values.
+        :type values: List[Any]
+        :return: Their codes.
+        :rtype: Sequence[int]
+        """
+        codes = self._codes[column]
+        dictionary = self._dictionaries[column]
+        encoded = []
+        for value in values:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(dictionary)
+                dictionary.append(value)
+            encoded.append(code)
+        numpy = _import_numpy()
+        if numpy is None:
+            return array("q", encoded)
+        return numpy.array(encoded, dtype=numpy.int64)
+
+    @classmethod
+    def _to_array(cls, values: List[Any]) -> Sequence:
+        """
+        Converts given values into the most compact array available.
+        :param values: The values.
+        :type values: List[Any]
+        :return: The array.
+        :rtype: Sequence
+        """
+        sample = next((value for value in values if value is not None), None)
+        is_int = isinstance(sample, int) and not isinstance(sample, bool)
+        numpy = _import_numpy()
+        if numpy is None:
+            if is_int and None not in values:
+                return array("q", values)
+            return values
+        if isinstance(sample, datetime.datetime):
+            return numpy.array(values, dtype="datetime64[us]")
+        if isinstance(sample, datetime.date):
+            return numpy.array(values, dtype="datetime64[D]")
+        if is_int and None not in values:
+            return numpy.array(values, dtype=numpy.int64)
+        return numpy.array(values, dtype=object)
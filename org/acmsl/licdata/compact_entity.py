@@ -0,0 +1,228 @@
+"""
+org/acmsl/licdata/compact_entity.py
+
+This file defines the CompactEntity class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .field import Field
+from .field_table import FieldTable
+import operator
+from pythoneda.shared import Entity
+from typing import Any, Callable, Dict, Tuple
+
+
+def _item_getter(position: int, field: Field) -> Callable[[Tuple], Any]:
+    """
+    Builds the getter of a field of a compact entity, with the metadata of
+    the getter of the entity.
+    :param position: The position of the field in the tuple.
+    :type position: int
+    :param field: The field.
+    :type field: org.acmsl.licdata.Field
+    :return: Such getter.
+    :rtype: Callable[[Tuple], Any]
+    """
+
+    def getter(compact: Tuple) -> Any:
+        return compact[position]
+
+    getter.__name__ = field.name
+    getter.__doc__ = field.getter.__doc__
+    getter.__annotations__ = dict(getattr(field.getter, "__annotations__", {}))
+    getter._field_roles = field.roles
+    return getter
+
+
+def _restore(entityClass: type, values: Tuple) -> "CompactEntity":
+    """
+    Rebuilds a pickled compact entity.
+    :param entityClass: The class of the entity.
+    :type entityClass: type
+    :param values: The id and the field values.
+    :type values: Tuple
+    :return: The compact entity.
+    :rtype: org.acmsl.licdata.CompactEntity
+    """
+    return CompactEntity.of(entityClass)(values)
+
+
+class CompactEntity(tuple):
+    """
+    The state of an entity, as a tuple of its id and its field values.
+
+    Class name: CompactEntity
+
+    Responsibilities:
+        - Builds, once per entity class, a tuple subclass with the same field
+          properties and field metadata as the entity.
+        - Converts entities to compact entities, and back.
+        - Compares and hashes compact entities by their class and values.
+
+    Collaborators:
+        - FieldTable: Provides the fields, their order and their metadata.
+        - pythoneda.shared.Entity: The entities.
+
+    Compact entities have no __dict__ and no event history, so they take a
+    fraction of the memory of entities, whose pythoneda base classes have no
+    __slots__. They are meant for holding millions of entities in memory,
+    i.e. for validation, and are immutable.
+    """
+
+    __slots__ = ()
+
+    _entity_class = None
+
+    _field_names: Tuple[str, ...] = ()
+
+    _classes: Dict[type, type] = {}
+
+    @classmethod
+    def of(cls, entityClass: type) -> type:
+        """
+        Retrieves the compact class of given entity class.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :return: Such class. Its instances are built from an iterable of the id
+        and the field values, in the order of the field table.
+        :rtype: type
+        """
+        result = CompactEntity._classes.get(entityClass)
+        if result is None:
+            result = CompactEntity._classes.setdefault(
+                entityClass, CompactEntity._build(entityClass)
+            )
+        return result
+
+    @staticmethod
+    def _build(entityClass: type) -> type:
+        """
+        Builds the compact class of given entity class.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :return: Such class.
+        :rtype: type
+        """
+        fields = FieldTable.of(entityClass).fields
+        namespace = {
+            "__slots__": (),
+            "__doc__": f"The compact form of {entityClass.__name__}.",
+            "__module__": __name__,
+            "_entity_class": entityClass,
+            "_field_names": tuple(field.name for field in fields),
+            "id": property(operator.itemgetter(0), doc="The id of the entity."),
+        }
+        for position, field in enumerate(fields, 1):
+            namespace[field.name] = property(_item_getter(position, field))
+        return type(f"Compact{entityClass.__name__}", (CompactEntity,), namespace)
+
+    @classmethod
+    def from_entity(cls, entity: Entity) -> "CompactEntity":
+        """
+        Builds the compact form of given entity.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: Its compact form.
+        :rtype: org.acmsl.licdata.CompactEntity
+        """
+        entity_class = entity.__class__
+        return CompactEntity.of(entity_class)(
+            (entity.id,) + FieldTable.of(entity_class).values_of(entity)
+        )
+
+    @property
+    def entity_class(self) -> type:
+        """
+        Retrieves the class of the entity.
+        :return: Such class.
+        :rtype: type
+        """
+        return self._entity_class
+
+    @property
+    def primary_key(self) -> Tuple:
+        """
+        Retrieves the primary key, as entities do.
+        :return: The values of the primary key fields, or the id if there are none.
+        :rtype: Tuple
+        """
+        table = FieldTable.of(self.__class__)
+        return table.primary_key_of(self) if table.primary_key else (self[0],)
+
+    def to_entity(self) -> Entity:
+        """
+        Rebuilds the entity, with its id and an empty event history.
+        :return: The entity.
+        :rtype: pythoneda.shared.Entity
+        """
+        result = FieldTable.of(self._entity_class).from_dict(
+            dict(zip(self._field_names, self[1:]))
+        )
+        result.restore_id(self[0])
+        return result
+
+    def __reduce__(self):
+        """
+        Supports pickling, since compact classes are built at runtime.
+        :return: The function rebuilding the compact entity, and its arguments.
+        :rtype: Tuple
+        """
+        return (_restore, (self._entity_class, tuple(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks whether two compact entities are the same: of the same entity
+        class, with the same id and field values. Unlike tuples, compact
+        entities of different classes, or plain tuples, are never equal.
+        :param other: The other object.
+        :type other: Any
+        :return: True in such case.
+        :rtype: bool
+        """
+        return other.__class__ is self.__class__ and tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        """
+        Checks whether two compact entities are different, consistently with
+        __eq__().
+        :param other: The other object.
+        :type other: Any
+        :return: True in such case.
+        :rtype: bool
+        """
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        """
+        Hashes the compact entity, including its class, consistently with
+        __eq__().
+        :return: The hash.
+        :rtype: int
+        """
+        return hash((self.__class__, tuple.__hash__(self)))
+
+    def __repr__(self) -> str:
+        """
+        Retrieves a representation of the compact entity.
+        :return: Such representation.
+        :rtype: str
+        """
+        values = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(("id",) + self._field_names, self)
+        )
+        return f"{self.__class__.__name__}({values})"
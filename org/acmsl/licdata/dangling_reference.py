@@ -0,0 +1,118 @@
+"""
+org/acmsl/licdata/dangling_reference.py
+
+This file defines the DanglingReference class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .reference import Reference
+
+
+class DanglingReference:
+    """
+    A reference to an entity that does not exist.
+
+    Class name: DanglingReference
+
+    Responsibilities:
+        - Identifies the reference, the referencing entity and the missing id.
+
+    Collaborators:
+        - Reference: The kind of reference.
+        - IntegrityChecker: Finds them in bulk.
+        - IntegrityIndex: Keeps track of them incrementally.
+    """
+
+    __slots__ = ("_reference", "_source_id", "_target_id")
+
+    def __init__(self, reference: Reference, sourceId: str, targetId: str):
+        """
+        Creates a new DanglingReference instance.
+        :param reference: The kind of reference.
+        :type reference: org.acmsl.licdata.Reference
+        :param sourceId: The id of the referencing entity.
+        :type sourceId: str
+        :param targetId: The id of the missing entity.
+        :type targetId: str
+        """
+        self._reference = reference
+        self._source_id = sourceId
+        self._target_id = targetId
+
+    @property
+    def reference(self) -> Reference:
+        """
+        Retrieves the kind of reference.
+        :return: Such reference.
+        :rtype: org.acmsl.licdata.Reference
+        """
+        return self._reference
+
+    @property
+    def source_id(self) -> str:
+        """
+        Retrieves the id of the referencing entity.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._source_id
+
+    @property
+    def target_id(self) -> str:
+        """
+        Retrieves the id of the missing entity.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._target_id
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks whether given object is the same dangling reference.
+        :param other: The other object.
+        :type other: Any
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, DanglingReference):
+            return NotImplemented
+        return (
+            self._reference.source_name == other._reference.source_name
+            and self._reference.attribute == other._reference.attribute
+            and self._source_id == other._source_id
+            and self._target_id == other._target_id
+        )
+
+    def __hash__(self) -> int:
+        """
+        Retrieves the hash of the dangling reference.
+        :return: Such hash.
+        :rtype: int
+        """
+        return hash((self._reference.attribute, self._source_id, self._target_id))
+
+    def __repr__(self) -> str:
+        """
+        Retrieves a representation of the dangling reference.
+        :return: Such representation.
+        :rtype: str
+        """
+        return (
+            f"{self._reference.source_name}({self._source_id})."
+            f"{self._reference.attribute} -> "
+            f"{self._reference.target_name}({self._target_id})"
+        )
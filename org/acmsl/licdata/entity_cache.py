@@ -0,0 +1,218 @@
+"""
+org/acmsl/licdata/entity_cache.py
+
+This file defines the EntityCache class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict
+from pythoneda.shared import Entity
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+
+class EntityCache:
+    """
+    A bounded LRU cache of entities, with optional time-to-live.
+
+    Class name: EntityCache
+
+    Responsibilities:
+        - Keeps entities indexed by id and by primary key.
+        - Evicts the least recently used entries beyond its maximum size.
+        - Expires entries older than its time-to-live, if any.
+        - Counts hits, misses and evictions, to help sizing it.
+
+    Collaborators:
+        - pythoneda.shared.Entity: The cached items.
+    """
+
+    def __init__(
+        self,
+        maxSize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Creates a new EntityCache instance.
+        :param maxSize: The maximum number of entries.
+        :type maxSize: int
+        :param ttl: The time-to-live of each entry, in seconds, or None.
+        :type ttl: Optional[float]
+        :param clock: The clock used to expire entries.
+        :type clock: Callable[[], float]
+        """
+        if maxSize < 1:
+            raise ValueError(f"Invalid cache size: {maxSize}")
+        self._max_size = maxSize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._keys_by_id: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Retrieves the maximum number of entries.
+        :return: Such size.
+        :rtype: int
+        """
+        return self._max_size
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """
+        Retrieves the time-to-live of the entries.
+        :return: Such value, in seconds.
+        :rtype: Optional[float]
+        """
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        """
+        Retrieves the number of lookups served from the cache.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Retrieves the number of lookups not found in the cache.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Retrieves the number of entries evicted due to the size bound.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._evictions
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of entries.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    @classmethod
+    def id_key(cls, id: str) -> Hashable:
+        """
+        Builds the cache key of given entity id.
+        :param id: The entity id.
+        :type id: str
+        :return: The key.
+        :rtype: Hashable
+        """
+        return ("id", id)
+
+    @classmethod
+    def pk_key(cls, pk: Dict[str, Any]) -> Hashable:
+        """
+        Builds the cache key of given primary key.
+        :param pk: The primary key.
+        :type pk: Dict[str, Any]
+        :return: The key.
+        :rtype: Hashable
+        """
+        return ("pk", tuple(sorted(pk.items())))
+
+    def get(self, key: Hashable) -> Optional[Entity]:
+        """
+        Retrieves the entity cached under given key.
+        :param key: The key, built with id_key() or pk_key().
+        :type key: Hashable
+        :return: The entity, or None if missing or expired.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entity, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entity
+                self._remove_id(entity.id)
+            self._misses += 1
+            return None
+
+    def put(self, entity: Entity, pk: Optional[Dict[str, Any]] = None):
+        """
+        Caches given entity, under its id and, optionally, its primary key.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :param pk: The primary key, if known.
+        :type pk: Optional[Dict[str, Any]]
+        """
+        expires_at = None if self._ttl is None else self._clock() + self._ttl
+        keys = [self.id_key(entity.id)]
+        if pk is not None:
+            keys.append(self.pk_key(pk))
+        with self._lock:
+            aliases = self._keys_by_id.setdefault(entity.id, set())
+            for key in keys:
+                self._entries[key] = (entity, expires_at)
+                self._entries.move_to_end(key)
+                aliases.add(key)
+            while len(self._entries) > self._max_size:
+                key, (evicted, _) = self._entries.popitem(last=False)
+                self._evictions += 1
+                evicted_aliases = self._keys_by_id.get(evicted.id)
+                if evicted_aliases is not None:
+                    evicted_aliases.discard(key)
+                    if not evicted_aliases:
+                        del self._keys_by_id[evicted.id]
+
+    def invalidate(self, id: str):
+        """
+        Removes all entries of the entity with given id.
+        :param id: The entity id.
+        :type id: str
+        """
+        with self._lock:
+            self._remove_id(id)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def _remove_id(self, id: str):
+        """
+        Removes all entries of the entity with given id. The lock must be held.
+        :param id: The entity id.
+        :type id: str
+        """
+        for key in self._keys_by_id.pop(id, ()):
+            self._entries.pop(key, None)
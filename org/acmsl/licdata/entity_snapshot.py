@@ -0,0 +1,97 @@
+"""
+org/acmsl/licdata/entity_snapshot.py
+
+This file defines the EntitySnapshot class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import copy
+from pythoneda.shared import Entity
+
+
+class EntitySnapshot:
+    """
+    The state of an entity after applying a given event.
+
+    Class name: EntitySnapshot
+
+    Responsibilities:
+        - Keeps a private copy of an entity, tagged with the id of the last
+          event applied to it and the number of events applied so far.
+        - Provides independent copies of such entity, to resume replaying.
+
+    Collaborators:
+        - pythoneda.shared.Entity: The entity.
+    """
+
+    def __init__(self, entity: Entity, lastEventId: str, version: int):
+        """
+        Creates a new EntitySnapshot instance.
+        :param entity: The entity. It gets copied.
+        :type entity: pythoneda.shared.Entity
+        :param lastEventId: The id of the last event applied to the entity.
+        :type lastEventId: str
+        :param version: The number of events applied to the entity.
+        :type version: int
+        """
+        self._entity = copy.deepcopy(entity)
+        self._last_event_id = lastEventId
+        self._version = version
+
+    @property
+    def entity_id(self) -> str:
+        """
+        Retrieves the id of the entity.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._entity.id
+
+    @property
+    def entity_class(self) -> type:
+        """
+        Retrieves the class of the entity.
+        :return: Such class.
+        :rtype: type
+        """
+        return self._entity.__class__
+
+    @property
+    def last_event_id(self) -> str:
+        """
+        Retrieves the id of the last event applied to the entity.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._last_event_id
+
+    @property
+    def version(self) -> int:
+        """
+        Retrieves the number of events applied to the entity.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._version
+
+    def restore(self) -> Entity:
+        """
+        Retrieves a copy of the entity, safe to apply further events to.
+        :return: Such copy.
+        :rtype: pythoneda.shared.Entity
+        """
+        return copy.deepcopy(self._entity)
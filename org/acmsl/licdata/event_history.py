@@ -0,0 +1,208 @@
+"""
+org/acmsl/licdata/event_history.py
+
+This file defines the EventHistory class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from collections import deque
+from pythoneda.shared import EventReference
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableSequence,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+class EventHistory(deque):
+    """
+    The event history of an entity, optionally bounded to its latest references.
+
+    Class name: EventHistory
+
+    Responsibilities:
+        - Keeps at most a given number of references, as a ring buffer.
+        - Hands the references it drops on append to a spill callback (i.e. the
+          event store).
+        - Applies the retention policy of each entity class to the histories
+          of its new instances.
+
+    Collaborators:
+        - pythoneda.shared.EventReference: The items of the history.
+
+    Each entity gets its own history. Its bound comes from the retention policy
+    of its class (see retain()), unless an EventHistory is passed as the
+    eventHistory of the entity, which is used as is. Entities of classes
+    without a policy keep a plain, unbounded list.
+    """
+
+    _retention: Dict[type, Tuple[int, Optional[Callable[[EventReference], None]]]] = {}
+
+    def __init__(
+        self,
+        references: Iterable[EventReference] = (),
+        maxLength: Optional[int] = None,
+        spill: Optional[Callable[[EventReference], None]] = None,
+    ):
+        """
+        Creates a new EventHistory instance.
+        :param references: The initial references. Only the latest ones are kept
+        if there are more than the maximum length, without spilling the others,
+        since they come from an existing history.
+        :type references: Iterable[pythoneda.shared.EventReference]
+        :param maxLength: The maximum number of references kept, or None.
+        :type maxLength: Optional[int]
+        :param spill: The callback receiving the references dropped, if any.
+        :type spill: Optional[Callable[[pythoneda.shared.EventReference], None]]
+        """
+        if maxLength is not None and maxLength < 1:
+            raise ValueError(f"Invalid event history length: {maxLength}")
+        super().__init__(references, maxLength)
+        self._spill_callback = spill
+
+    def __reduce__(self):
+        """
+        Supports pickling and copying, leaving out the spill callback.
+        :return: The constructor and its arguments.
+        :rtype: Tuple
+        """
+        return (self.__class__, (list(self), self.maxlen))
+
+    @property
+    def max_length(self) -> Optional[int]:
+        """
+        Retrieves the maximum number of references kept.
+        :return: Such number, or None if unbounded.
+        :rtype: Optional[int]
+        """
+        return self.maxlen
+
+    @classmethod
+    def retain(
+        cls,
+        entityClass: type,
+        maxLength: Optional[int],
+        spill: Optional[Callable[[EventReference], None]] = None,
+    ):
+        """
+        Sets the retention policy of the new instances of given entity class,
+        and of its subclasses without a policy of their own.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :param maxLength: The maximum number of references kept, or None to
+        remove the policy.
+        :type maxLength: Optional[int]
+        :param spill: The callback receiving the references dropped, if any.
+        :type spill: Optional[Callable[[pythoneda.shared.EventReference], None]]
+        """
+        if maxLength is None:
+            cls._retention.pop(entityClass, None)
+            return
+        if maxLength < 1:
+            raise ValueError(f"Invalid event history length: {maxLength}")
+        cls._retention[entityClass] = (maxLength, spill)
+
+    @classmethod
+    def for_entity(
+        cls,
+        entityClass: type,
+        eventHistory: Optional[Iterable[EventReference]] = None,
+    ) -> MutableSequence[EventReference]:
+        """
+        Retrieves the history of a new entity.
+        :param entityClass: The class of the entity.
+        :type entityClass: type
+        :param eventHistory: The initial history, if any. An EventHistory is
+        used as is, keeping its own bound.
+        :type eventHistory: Optional[Iterable[pythoneda.shared.EventReference]]
+        :return: An EventHistory bounded by the retention policy of the class,
+        if it has one, or a list otherwise.
+        :rtype: MutableSequence[pythoneda.shared.EventReference]
+        """
+        if isinstance(eventHistory, EventHistory):
+            return eventHistory
+        for ancestor in entityClass.__mro__:
+            policy = cls._retention.get(ancestor)
+            if policy is not None:
+                return cls(eventHistory or (), policy[0], policy[1])
+        return [] if eventHistory is None else eventHistory
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[EventReference, List[EventReference]]:
+        """
+        Retrieves a reference, or a list of them if given a slice, as lists do.
+        :param index: The position, or the slice.
+        :type index: Union[int, slice]
+        :return: The reference, or the references.
+        :rtype: Union[pythoneda.shared.EventReference, List[pythoneda.shared.EventReference]]
+        """
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def __add__(self, references: Iterable[EventReference]) -> List[EventReference]:
+        """
+        Concatenates the history with given references, as lists do.
+        :param references: The references.
+        :type references: Iterable[pythoneda.shared.EventReference]
+        :return: A new list, leaving the history untouched.
+        :rtype: List[pythoneda.shared.EventReference]
+        """
+        return list(self) + list(references)
+
+    def append(self, reference: EventReference):
+        """
+        Appends a reference, spilling the oldest one if the history is full.
+        :param reference: The reference.
+        :type reference: pythoneda.shared.EventReference
+        """
+        if (
+            self._spill_callback is not None
+            and self.maxlen is not None
+            and len(self) == self.maxlen
+        ):
+            self._spill_callback(self[0])
+        super().append(reference)
+
+    def extend(self, references: Iterable[EventReference]):
+        """
+        Appends given references, spilling the oldest ones if the history is full.
+        :param references: The references.
+        :type references: Iterable[pythoneda.shared.EventReference]
+        """
+        if self._spill_callback is None:
+            super().extend(references)
+        else:
+            for reference in references:
+                self.append(reference)
+
+    def __iadd__(self, references: Iterable[EventReference]):
+        """
+        Appends given references, spilling the oldest ones if the history is full.
+        :param references: The references.
+        :type references: Iterable[pythoneda.shared.EventReference]
+        :return: This history.
+        :rtype: org.acmsl.licdata.EventHistory
+        """
+        self.extend(references)
+        return self
@@ -0,0 +1,117 @@
+"""
+org/acmsl/licdata/expiry_index.py
+
+This file defines the ExpiryIndex class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .license_expiry import LicenseExpiry
+import bisect
+import datetime
+from pythoneda.shared import Entity
+from typing import Dict, Iterable, List, Tuple
+
+
+class ExpiryIndex:
+    """
+    Entity ids sorted by expiry.
+
+    Class name: ExpiryIndex
+
+    Responsibilities:
+        - Keeps the ids of licenses or orders sorted by their expiry.
+        - Finds the ones expiring within a period with a range scan.
+
+    Collaborators:
+        - License: Indexed through its expires_at property.
+        - Order: Indexed through its expires_at property.
+        - LicenseExpiry: Normalizes expiries to dates, since order dates can
+          be either dates or timestamps.
+    """
+
+    def __init__(self, entities: Iterable[Entity] = ()):
+        """
+        Creates a new ExpiryIndex instance.
+        :param entities: The initial entities.
+        :type entities: Iterable[pythoneda.shared.Entity]
+        """
+        as_date = LicenseExpiry.as_date
+        self._expiries: Dict[str, datetime.date] = {
+            entity.id: as_date(entity.expires_at)
+            for entity in entities
+            if entity.expires_at is not None
+        }
+        self._entries: List[Tuple[datetime.date, str]] = sorted(
+            (expiry, id) for id, expiry in self._expiries.items()
+        )
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of indexed entities.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def add(self, entity: Entity):
+        """
+        Indexes given entity, replacing any previous entry for it.
+        :param entity: The license or order.
+        :type entity: pythoneda.shared.Entity
+        """
+        self.remove(entity.id)
+        expiry = LicenseExpiry.as_date(entity.expires_at)
+        if expiry is not None:
+            self._expiries[entity.id] = expiry
+            bisect.insort(self._entries, (expiry, entity.id))
+
+    def remove(self, entityId: str):
+        """
+        Removes the entity with given id.
+        :param entityId: The id.
+        :type entityId: str
+        """
+        expiry = self._expiries.pop(entityId, None)
+        if expiry is not None:
+            index = bisect.bisect_left(self._entries, (expiry, entityId))
+            del self._entries[index]
+
+    def expiring_between(self, start: datetime.date, end: datetime.date) -> List[str]:
+        """
+        Retrieves the entities expiring in [start, end).
+        :param start: The start of the period.
+        :type start: datetime.date
+        :param end: The end of the period, excluded.
+        :type end: datetime.date
+        :return: Their ids, by expiry.
+        :rtype: List[str]
+        """
+        low = bisect.bisect_left(self._entries, (LicenseExpiry.as_date(start),))
+        high = bisect.bisect_left(self._entries, (LicenseExpiry.as_date(end),), lo=low)
+        return [id for _, id in self._entries[low:high]]
+
+    def expiring_within(self, days: int, today: datetime.date) -> List[str]:
+        """
+        Retrieves the entities expiring in the next given days.
+        :param days: The number of days.
+        :type days: int
+        :param today: The current date.
+        :type today: datetime.date
+        :return: Their ids, by expiry.
+        :rtype: List[str]
+        """
+        return self.expiring_between(today, today + datetime.timedelta(days=days))
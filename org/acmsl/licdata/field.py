@@ -0,0 +1,130 @@
+"""
+org/acmsl/licdata/field.py
+
+This file defines the Field class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Callable, FrozenSet, Optional
+
+
+class Field:
+    """
+    A field of an entity class, as declared by its decorators.
+
+    Class name: Field
+
+    Responsibilities:
+        - Knows the name, the roles and the constructor parameter of a field.
+        - Provides the getter and setter of the field.
+        - Knows the type of its values, from the annotation of the getter.
+
+    Collaborators:
+        - FieldTable: Groups the fields of each entity class.
+    """
+
+    __slots__ = ("_name", "_parameter", "_roles", "_getter", "_setter", "_value_type")
+
+    def __init__(
+        self,
+        name: str,
+        parameter: str,
+        roles: FrozenSet[str],
+        getter: Callable[[Any], Any],
+        setter: Optional[Callable[[Any, Any], None]],
+    ):
+        """
+        Creates a new Field instance.
+        :param name: The name of the attribute, i.e. "product_id".
+        :type name: str
+        :param parameter: The constructor parameter, i.e. "productId".
+        :type parameter: str
+        :param roles: The roles, i.e. "primary_key", "filter", "sensitive".
+        :type roles: FrozenSet[str]
+        :param getter: Retrieves the value from an instance.
+        :type getter: Callable[[Any], Any]
+        :param setter: Changes the value of an instance, if it's writable.
+        :type setter: Optional[Callable[[Any, Any], None]]
+        """
+        self._name = name
+        self._parameter = parameter
+        self._roles = roles
+        self._getter = getter
+        self._setter = setter
+        self._value_type = getattr(getter, "__annotations__", {}).get("return")
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the name of the attribute.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def parameter(self) -> str:
+        """
+        Retrieves the name of the constructor parameter.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._parameter
+
+    @property
+    def roles(self) -> FrozenSet[str]:
+        """
+        Retrieves the roles.
+        :return: Such roles.
+        :rtype: FrozenSet[str]
+        """
+        return self._roles
+
+    @property
+    def getter(self) -> Callable[[Any], Any]:
+        """
+        Retrieves the getter.
+        :return: Such function.
+        :rtype: Callable[[Any], Any]
+        """
+        return self._getter
+
+    @property
+    def setter(self) -> Optional[Callable[[Any, Any], None]]:
+        """
+        Retrieves the setter.
+        :return: Such function, or None if the field is read-only.
+        :rtype: Optional[Callable[[Any, Any], None]]
+        """
+        return self._setter
+
+    @property
+    def value_type(self) -> Optional[type]:
+        """
+        Retrieves the type of the values, as annotated in the getter.
+        :return: Such type, or None if it's not annotated.
+        :rtype: Optional[type]
+        """
+        return self._value_type
+
+    def __repr__(self) -> str:
+        """
+        Retrieves a representation of the field.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"Field({self._name!r}, {sorted(self._roles)!r})"
@@ -0,0 +1,473 @@
+"""
+org/acmsl/licdata/field_table.py
+
+This file defines the FieldTable class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .field import Field
+import operator
+from pythoneda.shared import attribute as pythoneda_attribute
+from pythoneda.shared import filter_attribute as pythoneda_filter_attribute
+from pythoneda.shared import primary_key_attribute as pythoneda_primary_key_attribute
+from pythoneda.shared import sensitive as pythoneda_sensitive
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def _with_role(func: Callable, role: str) -> Callable:
+    """
+    Records a role of a field in its getter.
+    :param func: The getter.
+    :type func: Callable
+    :param role: The role.
+    :type role: str
+    :return: The same getter.
+    :rtype: Callable
+    """
+    func._field_roles = getattr(func, "_field_roles", frozenset()) | {role}
+    return func
+
+
+def attribute(func: Callable) -> Callable:
+    """
+    Decorator to declare a plain attribute. It's pythoneda's @attribute,
+    also recording the role for the FieldTable.
+    :param func: The getter of the attribute.
+    :type func: Callable
+    :return: The decorated getter.
+    :rtype: Callable
+    """
+    return _with_role(pythoneda_attribute(func), "attribute")
+
+
+def primary_key_attribute(func: Callable) -> Callable:
+    """
+    Decorator to declare a primary key attribute. It's pythoneda's
+    @primary_key_attribute, also recording the role for the FieldTable.
+    :param func: The getter of the attribute.
+    :type func: Callable
+    :return: The decorated getter.
+    :rtype: Callable
+    """
+    return _with_role(pythoneda_primary_key_attribute(func), "primary_key")
+
+
+def filter_attribute(func: Callable) -> Callable:
+    """
+    Decorator to declare a filter attribute. It's pythoneda's
+    @filter_attribute, also recording the role for the FieldTable.
+    :param func: The getter of the attribute.
+    :type func: Callable
+    :return: The decorated getter.
+    :rtype: Callable
+    """
+    return _with_role(pythoneda_filter_attribute(func), "filter")
+
+
+def sensitive(func: Callable) -> Callable:
+    """
+    Decorator to declare a sensitive attribute. It's pythoneda's @sensitive,
+    also recording the role for the FieldTable.
+    :param func: The getter of the attribute.
+    :type func: Callable
+    :return: The decorated getter.
+    :rtype: Callable
+    """
+    return _with_role(pythoneda_sensitive(func), "sensitive")
+
+
+def with_field_table(entityClass: type) -> type:
+    """
+    Class decorator to build the FieldTable of an entity class, once, when
+    the class is created. It also gives the class a cached primary_key,
+    equality and hashing based on it, and restore_id() to give rebuilt
+    instances their original id. The class must declare a _primary_key
+    slot, and its primary key fields must not change.
+    :param entityClass: The entity class.
+    :type entityClass: type
+    :return: The same class.
+    :rtype: type
+    """
+    entityClass._field_table = FieldTable(entityClass)
+    entityClass.primary_key = property(_primary_key)
+    entityClass.__eq__ = _equal_primary_keys
+    entityClass.__hash__ = _hash_primary_key
+    entityClass.restore_id = _restore_id
+    return entityClass
+
+
+def _restore_id(entity: Any, id: str):
+    """
+    Gives an entity rebuilt from its events, or from a serialized form, the id
+    it had originally, instead of the one assigned on construction.
+    :param entity: The entity.
+    :type entity: pythoneda.shared.Entity
+    :param id: The original id.
+    :type id: str
+    """
+    # pythoneda keeps the identity of entities in _id, and has no setter
+    entity._id = id
+    if not entity._field_table.primary_key:
+        try:
+            del entity._primary_key
+        except AttributeError:
+            pass
+
+
+def _primary_key(entity: Any) -> Tuple:
+    """
+    Retrieves the primary key of an entity, computing it on first use.
+    :param entity: The entity.
+    :type entity: pythoneda.shared.Entity
+    :return: The values of its primary key fields, or its id if it has none.
+    :rtype: Tuple
+    """
+    try:
+        return entity._primary_key
+    except AttributeError:
+        table = entity._field_table
+        result = table.primary_key_of(entity) if table.primary_key else (entity.id,)
+        entity._primary_key = result
+        return result
+
+
+def _equal_primary_keys(entity: Any, other: Any) -> bool:
+    """
+    Checks whether two entities are the same, by their primary keys.
+    :param entity: The entity.
+    :type entity: pythoneda.shared.Entity
+    :param other: The other object.
+    :type other: Any
+    :return: True in such case.
+    :rtype: bool
+    """
+    if entity is other:
+        return True
+    if other.__class__ is not entity.__class__:
+        return NotImplemented
+    return _primary_key(entity) == _primary_key(other)
+
+
+def _hash_primary_key(entity: Any) -> int:
+    """
+    Hashes an entity by its primary key.
+    :param entity: The entity.
+    :type entity: pythoneda.shared.Entity
+    :return: The hash.
+    :rtype: int
+    """
+    return hash(_primary_key(entity))
+
+
+def _camel_case(name: str) -> str:
+    """
+    Converts an attribute name to the name of its constructor parameter.
+    :param name: The attribute name, i.e. "product_type_id".
+    :type name: str
+    :return: The parameter name, i.e. "productTypeId".
+    :rtype: str
+    """
+    head, *tail = name.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
+def _snake_case(name: str) -> str:
+    """
+    Converts the name of a constructor parameter to its attribute name, as
+    the inverse of _camel_case().
+    :param name: The parameter name, i.e. "productTypeId".
+    :type name: str
+    :return: The attribute name, i.e. "product_type_id".
+    :rtype: str
+    """
+    return "".join(
+        "_" + char.lower() if char.isupper() and index else char.lower()
+        for index, char in enumerate(name)
+    )
+
+
+class FieldTable:
+    """
+    The fields of an entity class, resolved once.
+
+    Class name: FieldTable
+
+    Responsibilities:
+        - Finds the fields of an entity class and their roles, from the
+          decorators of its properties, including inherited ones.
+        - Extracts primary keys and field values with precompiled getters.
+        - Compares, hashes and serializes entities by their fields.
+
+    Collaborators:
+        - Field: Each of the fields.
+        - pythoneda.shared.Entity: The described entities.
+
+    Entity classes get theirs built when they are created, with
+    @with_field_table; any other class gets one on first use.
+    """
+
+    _tables: Dict[type, "FieldTable"] = {}
+
+    __slots__ = (
+        "_entity_class",
+        "_fields",
+        "_fields_by_name",
+        "_fields_by_parameter",
+        "_primary_key",
+        "_filters",
+        "_sensitive",
+        "_indexed",
+        "_primary_key_getter",
+        "_values_getter",
+    )
+
+    def __init__(self, entityClass: type):
+        """
+        Creates a new FieldTable instance.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        """
+        fields: Dict[str, Field] = {}
+        for klass in reversed(entityClass.__mro__):
+            for name, member in vars(klass).items():
+                if not isinstance(member, property):
+                    continue
+                roles = getattr(member.fget, "_field_roles", frozenset())
+                if getattr(member.fget, "_secondary_index", False):
+                    roles = roles | {"indexed"}
+                if roles:
+                    fields[name] = Field(
+                        name, _camel_case(name), roles, member.fget, member.fset
+                    )
+        self._entity_class = entityClass
+        self._fields = tuple(fields.values())
+        self._fields_by_name = fields
+        self._fields_by_parameter = {
+            field.parameter: field for field in fields.values()
+        }
+        self._primary_key = self._names_with("primary_key")
+        self._filters = self._names_with("filter")
+        self._sensitive = self._names_with("sensitive")
+        self._indexed = self._names_with("indexed")
+        self._primary_key_getter = self._tuple_getter(self._primary_key)
+        self._values_getter = self._tuple_getter(tuple(fields))
+
+    @classmethod
+    def of(cls, entityClass: type) -> "FieldTable":
+        """
+        Retrieves the field table of given class.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :return: Such table.
+        :rtype: org.acmsl.licdata.FieldTable
+        """
+        result = entityClass.__dict__.get("_field_table")
+        if result is None:
+            result = cls._tables.get(entityClass)
+            if result is None:
+                result = cls._tables.setdefault(entityClass, cls(entityClass))
+        return result
+
+    def _names_with(self, role: str) -> Tuple[str, ...]:
+        """
+        Retrieves the names of the fields with given role.
+        :param role: The role.
+        :type role: str
+        :return: Such names, in declaration order.
+        :rtype: Tuple[str, ...]
+        """
+        return tuple(field.name for field in self._fields if role in field.roles)
+
+    @staticmethod
+    def _tuple_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+        """
+        Builds a function retrieving the values of given attributes, as a tuple.
+        :param names: The names of the attributes.
+        :type names: Tuple[str, ...]
+        :return: Such function.
+        :rtype: Callable[[Any], Tuple]
+        """
+        if not names:
+            return lambda instance: ()
+        if len(names) == 1:
+            getter = operator.attrgetter(names[0])
+            return lambda instance: (getter(instance),)
+        return operator.attrgetter(*names)
+
+    @property
+    def entity_class(self) -> type:
+        """
+        Retrieves the entity class.
+        :return: Such class.
+        :rtype: type
+        """
+        return self._entity_class
+
+    @property
+    def fields(self) -> Tuple[Field, ...]:
+        """
+        Retrieves the fields, in declaration order.
+        :return: Such fields.
+        :rtype: Tuple[org.acmsl.licdata.Field, ...]
+        """
+        return self._fields
+
+    @property
+    def primary_key(self) -> Tuple[str, ...]:
+        """
+        Retrieves the names of the primary key fields.
+        :return: Such names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._primary_key
+
+    @property
+    def filters(self) -> Tuple[str, ...]:
+        """
+        Retrieves the names of the filter fields.
+        :return: Such names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._filters
+
+    @property
+    def sensitive(self) -> Tuple[str, ...]:
+        """
+        Retrieves the names of the sensitive fields.
+        :return: Such names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._sensitive
+
+    @property
+    def indexed(self) -> Tuple[str, ...]:
+        """
+        Retrieves the names of the fields declared with @secondary_index.
+        :return: Such names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._indexed
+
+    def field(self, name: str) -> Optional[Field]:
+        """
+        Retrieves a field by name.
+        :param name: The name of the field.
+        :type name: str
+        :return: Such field, or None if there's none.
+        :rtype: Optional[org.acmsl.licdata.Field]
+        """
+        return self._fields_by_name.get(name)
+
+    def attribute_for(self, parameter: str) -> str:
+        """
+        Retrieves the attribute initialized by given constructor parameter.
+        :param parameter: The name of the parameter, i.e. "productTypeId".
+        :type parameter: str
+        :return: The name of its field, if declared, or the snake_case
+        counterpart of the parameter otherwise, i.e. "product_type_id".
+        :rtype: str
+        """
+        field = self._fields_by_parameter.get(parameter)
+        return _snake_case(parameter) if field is None else field.name
+
+    def primary_key_of(self, entity: Any) -> Tuple:
+        """
+        Retrieves the primary key of given entity.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: The values of its primary key fields, empty if it has none.
+        :rtype: Tuple
+        """
+        return self._primary_key_getter(entity)
+
+    def primary_key_dict(self, entity: Any) -> Dict[str, Any]:
+        """
+        Retrieves the primary key of given entity, as repositories expect it.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: The values of its primary key fields, by name.
+        :rtype: Dict[str, Any]
+        """
+        return dict(zip(self._primary_key, self._primary_key_getter(entity)))
+
+    def values_of(self, entity: Any) -> Tuple:
+        """
+        Retrieves the values of all fields of given entity.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: Such values, in declaration order.
+        :rtype: Tuple
+        """
+        return self._values_getter(entity)
+
+    def equal(self, first: Any, second: Any) -> bool:
+        """
+        Checks whether two entities have the same field values.
+        :param first: The first entity.
+        :type first: pythoneda.shared.Entity
+        :param second: The second entity.
+        :type second: pythoneda.shared.Entity
+        :return: True in such case.
+        :rtype: bool
+        """
+        return first.__class__ is second.__class__ and self._values_getter(
+            first
+        ) == self._values_getter(second)
+
+    def hash_of(self, entity: Any) -> int:
+        """
+        Hashes given entity by its field values, consistently with equal().
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: The hash.
+        :rtype: int
+        """
+        return hash(self._values_getter(entity))
+
+    def to_dict(self, entity: Any, includeSensitive: bool = False) -> Dict[str, Any]:
+        """
+        Serializes given entity as a dictionary of its field values.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :param includeSensitive: Whether to include the sensitive fields.
+        :type includeSensitive: bool
+        :return: The values, by field name.
+        :rtype: Dict[str, Any]
+        """
+        result = dict(zip(self._fields_by_name, self._values_getter(entity)))
+        if not includeSensitive:
+            for name in self._sensitive:
+                del result[name]
+        return result
+
+    def from_dict(self, values: Dict[str, Any], **kwargs) -> Any:
+        """
+        Builds an entity from a dictionary of its field values.
+        :param values: The values, by field name.
+        :type values: Dict[str, Any]
+        :param kwargs: Other constructor arguments, i.e. eventHistory.
+        :type kwargs: Dict
+        :return: The entity.
+        :rtype: pythoneda.shared.Entity
+        """
+        arguments = {
+            field.parameter: values[field.name]
+            for field in self._fields
+            if field.name in values
+        }
+        arguments.update(kwargs)
+        return self._entity_class(**arguments)
@@ -0,0 +1,139 @@
+"""
+org/acmsl/licdata/in_memory_client_repo.py
+
+This file defines the InMemoryClientRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .causation_chain import CausationChain
+from .client import Client
+from .client_repo import ClientRepo
+from org.acmsl.licdata.events.clients import (
+    ClientUpdated,
+    DeleteClientRequested,
+    NewClientRequested,
+    UpdateClientRequested,
+)
+from .in_memory_repo import InMemoryRepo
+from typing import Any, List
+
+
+class InMemoryClientRepo(InMemoryRepo, ClientRepo):
+    """
+    A ClientRepo keeping the Clients in memory.
+
+    Class name: InMemoryClientRepo
+
+    Responsibilities:
+        - Stores Clients in memory.
+        - Rejects Clients with duplicated emails.
+        - Handles the requests the Client listeners send to their repository.
+
+    Collaborators:
+        - InMemoryRepo: Provides the storage.
+        - ClientRepo: The port being implemented.
+        - Client: Creates the events of the handled requests.
+    """
+
+    def __init__(self):
+        """
+        Creates a new InMemoryClientRepo instance.
+        """
+        super().__init__(Client)
+
+    def insert(self, item: Any) -> Any:
+        """
+        Inserts given client, or creates one from given request.
+        :param item: The client, or a NewClientRequested event.
+        :type item: Any
+        :return: The client, or the NewClientCreated event.
+        :rtype: Any
+        """
+        if isinstance(item, NewClientRequested):
+            client = Client._create_instance_from(item)
+            super().insert(client)
+            return client.create_created_event(item)
+        return super().insert(item)
+
+    def insert_all(self, items: List[Any]) -> List[Any]:
+        """
+        Inserts given clients, or creates them from given requests, in a single
+        atomic operation.
+        :param items: The clients, or NewClientRequested events.
+        :type items: List[Any]
+        :return: The client or NewClientCreated event of each item, in order.
+        :rtype: List[Any]
+        """
+        clients = [
+            (
+                Client._create_instance_from(item)
+                if isinstance(item, NewClientRequested)
+                else item
+            )
+            for item in items
+        ]
+        super().insert_all(clients)
+        return [
+            (
+                client.create_created_event(item)
+                if isinstance(item, NewClientRequested)
+                else client
+            )
+            for item, client in zip(items, clients)
+        ]
+
+    def update(self, item: Any) -> Any:
+        """
+        Updates given client, or the one affected by given request.
+        :param item: The client, or an UpdateClientRequested event.
+        :type item: Any
+        :return: The client or the ClientUpdated event, or None if not found.
+        :rtype: Any
+        """
+        if not isinstance(item, UpdateClientRequested):
+            return super().update(item)
+        with self._lock:
+            client = self.find_by_id(item.entity_id)
+            if client is None:
+                return None
+            result = ClientUpdated(
+                entityId=client.id,
+                email=client.email,
+                address=item.address,
+                contact=item.contact,
+                phone=item.phone,
+                previousEventIds=CausationChain.following(item),
+            )
+            client.apply_updated(result)
+            super().update(client)
+        return result
+
+    def delete(self, item: Any) -> Any:
+        """
+        Deletes given client, or the one affected by given request.
+        :param item: The client, or a DeleteClientRequested event.
+        :type item: Any
+        :return: The client or the ClientDeleted event, or None if not found.
+        :rtype: Any
+        """
+        if not isinstance(item, DeleteClientRequested):
+            return super().delete(item)
+        with self._lock:
+            client = self._unstore(item.entity_id)
+        if client is None:
+            return None
+        return client.create_deleted_event(item)
@@ -0,0 +1,46 @@
+"""
+org/acmsl/licdata/in_memory_order_repo.py
+
+This file defines the InMemoryOrderRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .in_memory_repo import InMemoryRepo
+from .order import Order
+from .order_repo import OrderRepo
+
+
+class InMemoryOrderRepo(InMemoryRepo, OrderRepo):
+    """
+    A OrderRepo keeping the Orders in memory.
+
+    Class name: InMemoryOrderRepo
+
+    Responsibilities:
+        - Stores Orders in memory.
+        - Rejects Orders with duplicated primary keys.
+
+    Collaborators:
+        - InMemoryRepo: Provides the storage.
+        - OrderRepo: The port being implemented.
+    """
+
+    def __init__(self):
+        """
+        Creates a new InMemoryOrderRepo instance.
+        """
+        super().__init__(Order)
@@ -0,0 +1,46 @@
+"""
+org/acmsl/licdata/in_memory_prelicense_repo.py
+
+This file defines the InMemoryPrelicenseRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .in_memory_repo import InMemoryRepo
+from .prelicense import Prelicense
+from .prelicense_repo import PrelicenseRepo
+
+
+class InMemoryPrelicenseRepo(InMemoryRepo, PrelicenseRepo):
+    """
+    A PrelicenseRepo keeping the Prelicenses in memory.
+
+    Class name: InMemoryPrelicenseRepo
+
+    Responsibilities:
+        - Stores Prelicenses in memory.
+        - Rejects Prelicenses with duplicated primary keys.
+
+    Collaborators:
+        - InMemoryRepo: Provides the storage.
+        - PrelicenseRepo: The port being implemented.
+    """
+
+    def __init__(self):
+        """
+        Creates a new InMemoryPrelicenseRepo instance.
+        """
+        super().__init__(Prelicense)
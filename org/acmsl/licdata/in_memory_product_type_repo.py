@@ -0,0 +1,46 @@
+"""
+org/acmsl/licdata/in_memory_product_type_repo.py
+
+This file defines the InMemoryProductTypeRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .in_memory_repo import InMemoryRepo
+from .product_type import ProductType
+from .product_type_repo import ProductTypeRepo
+
+
+class InMemoryProductTypeRepo(InMemoryRepo, ProductTypeRepo):
+    """
+    A ProductTypeRepo keeping the ProductTypes in memory.
+
+    Class name: InMemoryProductTypeRepo
+
+    Responsibilities:
+        - Stores ProductTypes in memory.
+        - Rejects ProductTypes with duplicated primary keys.
+
+    Collaborators:
+        - InMemoryRepo: Provides the storage.
+        - ProductTypeRepo: The port being implemented.
+    """
+
+    def __init__(self):
+        """
+        Creates a new InMemoryProductTypeRepo instance.
+        """
+        super().__init__(ProductType)
@@ -0,0 +1,472 @@
+"""
+org/acmsl/licdata/in_memory_repo.py
+
+This file defines the InMemoryRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .field_table import FieldTable
+from .secondary_indexes import SecondaryIndexes
+import bisect
+from pythoneda.shared import Entity
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class InMemoryRepo:
+    """
+    A repository keeping its entities in memory.
+
+    Class name: InMemoryRepo
+
+    Responsibilities:
+        - Stores entities by id, rejecting duplicated primary keys.
+        - Finds entities by id and primary key with a dictionary lookup.
+        - Indexes the filter attributes and the @secondary_index attributes.
+        - Notifies its subscribers of every stored and removed entity.
+        - Serves as a baseline for benchmarks, and as a local stand-in for
+          the production store.
+
+    Collaborators:
+        - FieldTable: Provides the primary key and filter attributes.
+        - SecondaryIndexes: Indexes the @secondary_index attributes.
+        - pythoneda.shared.Entity: The stored entities.
+
+    It's meant to be mixed in before the repository port it implements, i.e.
+    `class InMemoryLicenseRepo(InMemoryRepo, LicenseRepo)`. All operations are
+    thread-safe, so it can be used behind a ThreadPoolRepo, although it
+    never blocks, so AsyncRepo.of runs it inline.
+    """
+
+    blocking = False
+    """
+    Its operations never block on I/O, so AsyncRepo.of runs them inline.
+    """
+
+    def __init__(self, entityClass: type):
+        """
+        Creates a new InMemoryRepo instance.
+        :param entityClass: The class of the entities.
+        :type entityClass: type
+        """
+        super().__init__()
+        self._field_table = FieldTable.of(entityClass)
+        self._primary_key = self._field_table.primary_key
+        self._filter_attributes = self._field_table.filters
+        self._lock = threading.RLock()
+        self._entities: Dict[str, Entity] = {}
+        self._ids_by_pk: Dict[Tuple, str] = {}
+        self._ids_by_filter: Dict[str, Dict[Any, Dict[str, None]]] = {
+            attribute: {} for attribute in self._filter_attributes
+        }
+        self._indexes = SecondaryIndexes(entityClass)
+        # the primary key and filter values of each entity, when it was stored
+        self._indexed_values: Dict[str, Tuple[Optional[Tuple], Tuple]] = {}
+        # the insertion order, as an append-only list of sequence numbers and
+        # ids (None once deleted), so pages resume after the last sequence
+        self._last_sequence = 0
+        self._sequence_by_id: Dict[str, int] = {}
+        self._ordered_sequences: List[int] = []
+        self._ordered_ids: List[Optional[str]] = []
+        self._deleted_in_order = 0
+        self._subscribers: List[Any] = []
+
+    @property
+    def primary_key(self) -> Tuple[str, ...]:
+        """
+        Retrieves the primary key attributes.
+        :return: Their names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._primary_key
+
+    @property
+    def filter_attributes(self) -> Tuple[str, ...]:
+        """
+        Retrieves the filter attributes.
+        :return: Their names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._filter_attributes
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of stored entities.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entities)
+
+    def subscribe(self, subscriber: Any):
+        """
+        Notifies given subscriber of the stored entities, and then of every
+        write: subscriber.index(entity) once an entity is inserted or updated,
+        and subscriber.unindex(entity) once it's removed. Notifications happen
+        under the lock, so the subscriber sees the writes in order, and
+        neither misses nor repeats any of them.
+        :param subscriber: The subscriber, i.e. a LicenseValidationIndex.
+        :type subscriber: Any
+        """
+        with self._lock:
+            for entity in self.list():
+                subscriber.index(entity)
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Any):
+        """
+        Stops notifying given subscriber.
+        :param subscriber: The subscriber.
+        :type subscriber: Any
+        """
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def _pk_of(self, entity: Entity) -> Optional[Tuple]:
+        """
+        Retrieves the primary key of given entity.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :return: The values of its primary key attributes, or None if it has none.
+        :rtype: Optional[Tuple]
+        """
+        if not self._primary_key:
+            return None
+        return entity.primary_key
+
+    def _store(self, entity: Entity):
+        """
+        Stores given entity, replacing the one with the same id, if any.
+        Replaced entities keep their position in the insertion order.
+        The lock must be held.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        """
+        pk = self._pk_of(entity)
+        if pk is not None:
+            owner = self._ids_by_pk.get(pk)
+            if owner is not None and owner != entity.id:
+                raise ValueError(
+                    f"Duplicated primary key {dict(zip(self._primary_key, pk))}"
+                )
+        if entity.id in self._entities:
+            # callers may have changed the stored instance itself, so the
+            # values to unindex are the ones recorded when it was stored
+            self._unindex(entity.id)
+        else:
+            self._last_sequence += 1
+            self._sequence_by_id[entity.id] = self._last_sequence
+            self._ordered_sequences.append(self._last_sequence)
+            self._ordered_ids.append(entity.id)
+        self._entities[entity.id] = entity
+        if pk is not None:
+            self._ids_by_pk[pk] = entity.id
+        values = tuple(
+            getattr(entity, attribute) for attribute in self._filter_attributes
+        )
+        for value, index in zip(values, self._ids_by_filter.values()):
+            index.setdefault(value, {})[entity.id] = None
+        self._indexed_values[entity.id] = (pk, values)
+        self._indexes.add(entity)
+        for subscriber in self._subscribers:
+            subscriber.index(entity)
+
+    def _unindex(self, entityId: str):
+        """
+        Removes the entity with given id from the primary key and attribute
+        indexes, using the values it had when it was stored.
+        The lock must be held.
+        :param entityId: The id of the entity.
+        :type entityId: str
+        """
+        pk, values = self._indexed_values.pop(entityId)
+        if pk is not None and self._ids_by_pk.get(pk) == entityId:
+            del self._ids_by_pk[pk]
+        for value, index in zip(values, self._ids_by_filter.values()):
+            ids = index.get(value)
+            if ids is not None:
+                ids.pop(entityId, None)
+                if not ids:
+                    del index[value]
+        self._indexes.remove(entityId)
+
+    def _unstore(self, entityId: str) -> Optional[Entity]:
+        """
+        Removes the entity with given id. The lock must be held.
+        :param entityId: The id of the entity.
+        :type entityId: str
+        :return: The removed entity, or None if there was none.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        entity = self._entities.pop(entityId, None)
+        if entity is None:
+            return None
+        self._unindex(entityId)
+        sequence = self._sequence_by_id.pop(entityId)
+        position = bisect.bisect_left(self._ordered_sequences, sequence)
+        self._ordered_ids[position] = None
+        self._deleted_in_order += 1
+        if self._deleted_in_order * 2 > len(self._ordered_ids):
+            live = [
+                (sequence, id)
+                for sequence, id in zip(self._ordered_sequences, self._ordered_ids)
+                if id is not None
+            ]
+            self._ordered_sequences = [sequence for sequence, _ in live]
+            self._ordered_ids = [id for _, id in live]
+            self._deleted_in_order = 0
+        for subscriber in self._subscribers:
+            subscriber.unindex(entity)
+        return entity
+
+    def find_by_id(self, id: str) -> Optional[Entity]:
+        """
+        Retrieves the entity with given id.
+        :param id: The id.
+        :type id: str
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        return self._entities.get(id)
+
+    def find_by_pk(self, pk: Dict[str, Any]) -> Optional[Entity]:
+        """
+        Retrieves the entity with given primary key.
+        :param pk: The primary key. Otherwise, the entities are scanned, narrowed
+        by the filter attributes if any.
+        :type pk: Dict[str, Any]
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        if self._primary_key and len(pk) == len(self._primary_key):
+            try:
+                key = tuple(pk[attribute] for attribute in self._primary_key)
+            except KeyError:
+                key = None
+            if key is not None:
+                entity_id = self._ids_by_pk.get(key)
+                return None if entity_id is None else self._entities.get(entity_id)
+        with self._lock:
+            candidates = self._entities.values()
+            for name, value in pk.items():
+                index = self._ids_by_filter.get(name)
+                if index is not None:
+                    candidates = [self._entities[id] for id in index.get(value, ())]
+                    break
+            for entity in candidates:
+                if all(getattr(entity, name) == value for name, value in pk.items()):
+                    return entity
+        return None
+
+    def find_by_primary_key(self, primaryKey: Tuple) -> Optional[Entity]:
+        """
+        Retrieves the entity with given primary key, as returned by the
+        primary_key property of the entities.
+        :param primaryKey: The values of the primary key fields, in order.
+        :type primaryKey: Tuple
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        entity_id = self._ids_by_pk.get(primaryKey)
+        return None if entity_id is None else self._entities.get(entity_id)
+
+    def find_by_attribute(self, attributeName: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose attribute has given value.
+        Filter attributes are looked up in their index; others scan all entities.
+        :param attributeName: The name of the attribute.
+        :type attributeName: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            index = self._ids_by_filter.get(attributeName)
+            if index is not None:
+                return [self._entities[id] for id in index.get(value, ())]
+            return [
+                entity
+                for entity in self._entities.values()
+                if getattr(entity, attributeName) == value
+            ]
+
+    def find_by_index(self, attribute: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose attribute, declared with @secondary_index,
+        has given value.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            return [self._entities[id] for id in self._indexes.lookup(attribute, value)]
+
+    def insert(self, item: Entity) -> Entity:
+        """
+        Inserts given entity.
+        :param item: The entity.
+        :type item: pythoneda.shared.Entity
+        :return: The same entity.
+        :rtype: pythoneda.shared.Entity
+        """
+        with self._lock:
+            if item.id in self._entities:
+                raise ValueError(f"Duplicated id {item.id}")
+            self._store(item)
+        return item
+
+    def insert_all(self, items: List[Entity]) -> List[Entity]:
+        """
+        Inserts given entities, in a single atomic operation: either all of them
+        get inserted, or none if any id or primary key is duplicated.
+        :param items: The entities.
+        :type items: List[pythoneda.shared.Entity]
+        :return: The outcome of each insertion, in the same order as the entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            ids = set()
+            pks = set()
+            for item in items:
+                if item.id in self._entities or item.id in ids:
+                    raise ValueError(f"Duplicated id {item.id}")
+                ids.add(item.id)
+                pk = self._pk_of(item)
+                if pk is not None:
+                    if pk in self._ids_by_pk or pk in pks:
+                        raise ValueError(
+                            f"Duplicated primary key {dict(zip(self._primary_key, pk))}"
+                        )
+                    pks.add(pk)
+            for item in items:
+                self._store(item)
+        return items
+
+    def insert_if_absent(self, item: Any, pk: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Inserts given item, unless an entity with given primary key already exists,
+        as a single atomic operation (under the lock of the repository, since its
+        entities live in this process).
+        :param item: The item to insert.
+        :type item: Any
+        :param pk: The primary key of the entity the item would create.
+        :type pk: Dict[str, Any]
+        :return: Either the outcome of the insertion and True, or the existing
+        entity and False.
+        :rtype: Tuple[Any, bool]
+        """
+        with self._lock:
+            existing = self.find_by_pk(pk)
+            if existing is not None:
+                return existing, False
+            return self.insert(item), True
+
+    def update(self, item: Entity) -> Optional[Entity]:
+        """
+        Replaces the stored entity with the same id.
+        :param item: The entity.
+        :type item: pythoneda.shared.Entity
+        :return: The same entity, or None if it wasn't stored.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            if item.id not in self._entities:
+                return None
+            self._store(item)
+        return item
+
+    def delete(self, item: Entity) -> Optional[Entity]:
+        """
+        Deletes given entity.
+        :param item: The entity.
+        :type item: pythoneda.shared.Entity
+        :return: The deleted entity, or None if it wasn't stored.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            return self._unstore(item.id)
+
+    def list(self) -> List[Entity]:
+        """
+        Retrieves all entities, in insertion order.
+        :return: Such entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        with self._lock:
+            return list(self._entities.values())
+
+    def list_page(
+        self, pageSize: int, continuationToken: Optional[str] = None
+    ) -> Tuple[List[Entity], Optional[str]]:
+        """
+        Retrieves a page of entities, in insertion order.
+        The token is the insertion sequence of the last entity of the page, so
+        each page costs O(log n + pageSize), and entities deleted or inserted
+        during a scan don't make it skip others.
+        :param pageSize: The maximum number of entities in the page.
+        :type pageSize: int
+        :param continuationToken: The token returned with the previous page, if any.
+        :type continuationToken: Optional[str]
+        :return: The entities, and the token of the next page (None if it's the last one).
+        :rtype: Tuple[List[pythoneda.shared.Entity], Optional[str]]
+        """
+        if pageSize < 1:
+            raise ValueError(f"Invalid page size: {pageSize}")
+        with self._lock:
+            sequences = self._ordered_sequences
+            ids = self._ordered_ids
+            position = (
+                0
+                if continuationToken is None
+                else bisect.bisect_right(sequences, int(continuationToken))
+            )
+            end = len(ids)
+            items = []
+            while position < end and len(items) < pageSize:
+                id = ids[position]
+                if id is not None:
+                    items.append(self._entities[id])
+                position += 1
+            while position < end and ids[position] is None:
+                position += 1
+            next_token = (
+                str(sequences[position - 1]) if position < end and items else None
+            )
+        return items, next_token
+
+    def clear(self):
+        """
+        Removes all entities.
+        """
+        with self._lock:
+            for subscriber in self._subscribers:
+                for entity in self._entities.values():
+                    subscriber.unindex(entity)
+            self._entities.clear()
+            self._sequence_by_id.clear()
+            self._ordered_sequences = []
+            self._ordered_ids = []
+            self._deleted_in_order = 0
+            self._ids_by_pk.clear()
+            self._indexed_values.clear()
+            for index in self._ids_by_filter.values():
+                index.clear()
+            self._indexes.clear()
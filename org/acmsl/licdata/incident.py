@@ -19,10 +19,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import primary_key_attribute, with_field_table
+from .secondary_indexes import secondary_index
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class Incident(Entity):
     """
     Represents a incident.
@@ -37,8 +41,13 @@ class Incident(Entity):
         - PC: Each incident is related to a PC.
     """
 
+    __slots__ = ("_license_id", "_pc_id", "_primary_key")
+
     def __init__(
-        self, licenseId: str, pcId: str, eventHistory: List[EventReference] = []
+        self,
+        licenseId: str,
+        pcId: str,
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new Incident instance.
@@ -47,11 +56,13 @@ class Incident(Entity):
         :param pcId: The id of the PC.
         :type pcId: str
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._license_id = licenseId
         self._pc_id = pcId
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
@@ -64,6 +75,7 @@ class Incident(Entity):
         return self._license_id
 
     @property
+    @secondary_index
     @primary_key_attribute
     def pc_id(self) -> str:
         """
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .incident import Incident
-from pythoneda.shared import Repo
 
 
-class IncidentRepo(Repo):
+class IncidentRepo(BaseRepo):
     """
-    A subclass of Repo that manages Incidents.
+    A subclass of BaseRepo that manages Incidents.
 
     Class name: IncidentRepo
 
@@ -0,0 +1,188 @@
+"""
+org/acmsl/licdata/inline_repo.py
+
+This file defines the InlineRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .async_repo import AsyncRepo
+from pythoneda.shared import Entity
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class InlineRepo(AsyncRepo):
+    """
+    Runs the operations of a synchronous repository in the event loop.
+
+    Class name: InlineRepo
+
+    Responsibilities:
+        - Adapts synchronous repositories whose operations don't block, such
+          as the in-memory ones, to the AsyncRepo contract.
+
+    Collaborators:
+        - AsyncRepo: The contract it implements.
+        - BaseRepo: The synchronous repositories it adapts.
+        - ThreadPoolRepo: Adapts the ones whose operations block.
+    """
+
+    def __init__(self, delegate: Any):
+        """
+        Creates a new InlineRepo instance.
+        :param delegate: The synchronous repository.
+        :type delegate: org.acmsl.licdata.BaseRepo
+        """
+        super().__init__()
+        self._delegate = delegate
+
+    @property
+    def delegate(self) -> Any:
+        """
+        Retrieves the synchronous repository.
+        :return: Such repository.
+        :rtype: org.acmsl.licdata.BaseRepo
+        """
+        return self._delegate
+
+    async def _call(self, operation: str, *args) -> Any:
+        """
+        Runs an operation of the synchronous repository.
+        :param operation: The name of the operation.
+        :type operation: str
+        :param args: Its arguments.
+        :type args: Tuple
+        :return: Its outcome.
+        :rtype: Any
+        """
+        return getattr(self._delegate, operation)(*args)
+
+    async def find_by_id(self, id: str) -> Optional[Entity]:
+        """
+        Retrieves the entity with given id.
+        :param id: The id.
+        :type id: str
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        return await self._call("find_by_id", id)
+
+    async def find_by_pk(self, pk: Dict[str, Any]) -> Optional[Entity]:
+        """
+        Retrieves the entity with given primary key.
+        :param pk: The primary key.
+        :type pk: Dict[str, Any]
+        :return: Such entity, or None.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        return await self._call("find_by_pk", pk)
+
+    async def find_by_pks(self, pks: List[Dict[str, Any]]) -> List[Optional[Entity]]:
+        """
+        Retrieves the entities matching given primary keys, in a single lookup.
+        :param pks: The primary keys.
+        :type pks: List[Dict[str, Any]]
+        :return: The matching entities (or None), in the same order as the keys.
+        :rtype: List[Optional[pythoneda.shared.Entity]]
+        """
+        return await self._call("find_by_pks", pks)
+
+    async def find_by_index(self, attribute: str, value: Any) -> List[Entity]:
+        """
+        Retrieves the entities whose indexed attribute has given value.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: The matching entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        return await self._call("find_by_index", attribute, value)
+
+    async def insert(self, item: Any) -> Any:
+        """
+        Inserts given item.
+        :param item: The item to insert.
+        :type item: Any
+        :return: The outcome of the insertion.
+        :rtype: Any
+        """
+        return await self._call("insert", item)
+
+    async def insert_all(self, items: List[Any]) -> List[Any]:
+        """
+        Inserts given items, in a single operation.
+        :param items: The items to insert.
+        :type items: List[Any]
+        :return: The outcome of each insertion, in the same order as the items.
+        :rtype: List[Any]
+        """
+        return await self._call("insert_all", items)
+
+    async def insert_if_absent(self, item: Any, pk: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Inserts given item, unless an entity with given primary key already exists.
+        :param item: The item to insert.
+        :type item: Any
+        :param pk: The primary key of the entity the item would create.
+        :type pk: Dict[str, Any]
+        :return: Either the outcome of the insertion and True, or the existing
+        entity and False.
+        :rtype: Tuple[Any, bool]
+        """
+        return await self._call("insert_if_absent", item, pk)
+
+    async def update(self, item: Any) -> Any:
+        """
+        Updates given item.
+        :param item: The item to update.
+        :type item: Any
+        :return: The outcome of the update.
+        :rtype: Any
+        """
+        return await self._call("update", item)
+
+    async def delete(self, item: Any) -> Any:
+        """
+        Deletes given item.
+        :param item: The item to delete.
+        :type item: Any
+        :return: The outcome of the deletion.
+        :rtype: Any
+        """
+        return await self._call("delete", item)
+
+    async def list(self) -> List[Entity]:
+        """
+        Retrieves all entities.
+        :return: Such entities.
+        :rtype: List[pythoneda.shared.Entity]
+        """
+        return await self._call("list")
+
+    async def list_page(
+        self, pageSize: int, continuationToken: Optional[str] = None
+    ) -> Tuple[List[Entity], Optional[str]]:
+        """
+        Retrieves a page of entities.
+        :param pageSize: The maximum number of entities in the page.
+        :type pageSize: int
+        :param continuationToken: The token returned with the previous page, if any.
+        :type continuationToken: Optional[str]
+        :return: The entities, and the token of the next page (None if it's the last one).
+        :rtype: Tuple[List[pythoneda.shared.Entity], Optional[str]]
+        """
+        return await self._call("list_page", pageSize, continuationToken)
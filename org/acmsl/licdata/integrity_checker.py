@@ -0,0 +1,257 @@
+"""
+org/acmsl/licdata/integrity_checker.py
+
+This file defines the IntegrityChecker class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .dangling_reference import DanglingReference
+from .field_table import FieldTable
+from .reference import Reference
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pythoneda.shared import Entity
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+_worker_ids: Dict[str, FrozenSet[str]] = {}
+"""
+The ids of the referenced entities, in each worker process.
+"""
+
+
+def _init_worker(ids: Dict[str, FrozenSet[str]]):
+    """
+    Receives the ids of the referenced entities, once per worker process.
+    :param ids: The ids, by entity class name.
+    :type ids: Dict[str, FrozenSet[str]]
+    """
+    global _worker_ids
+    _worker_ids = ids
+
+
+def _find_dangling(
+    targetNames: Tuple[str, ...], rows: List[Tuple[str, Tuple[Optional[str], ...]]]
+) -> List[Tuple[int, str, str]]:
+    """
+    Finds the dangling references among given rows, in a worker process.
+    :param targetNames: The referenced entity class of each referencing field.
+    :type targetNames: Tuple[str, ...]
+    :param rows: The id of each referencing entity, and its referencing fields.
+    :type rows: List[Tuple[str, Tuple[Optional[str], ...]]]
+    :return: The position of the field, the referencing id and the missing id.
+    :rtype: List[Tuple[int, str, str]]
+    """
+    indexes = [_worker_ids[name] for name in targetNames]
+    result = []
+    for source_id, values in rows:
+        for position, value in enumerate(values):
+            if value is not None and value not in indexes[position]:
+                result.append((position, source_id, value))
+    return result
+
+
+class IntegrityChecker:
+    """
+    Finds the references to entities that do not exist.
+
+    Class name: IntegrityChecker
+
+    Responsibilities:
+        - Builds a hash index of the ids of each referenced repository, once.
+        - Checks all references of an entity class in a single pass over its
+          repository.
+        - Optionally spreads the checks over a process pool.
+
+    Collaborators:
+        - Reference: Declares the references to check.
+        - DanglingReference: The outcome.
+        - BaseRepo: Provides the entities, page by page.
+        - IntegrityIndex: Keeps the outcome up to date afterwards.
+
+    References to entity classes without a repository are not checked.
+    """
+
+    def __init__(
+        self,
+        repos: Dict[type, Any],
+        pageSize: int = 10000,
+        workers: int = 0,
+    ):
+        """
+        Creates a new IntegrityChecker instance.
+        :param repos: The repository of each entity class.
+        :type repos: Dict[type, org.acmsl.licdata.BaseRepo]
+        :param pageSize: The number of entities retrieved at once.
+        :type pageSize: int
+        :param workers: The number of checking processes, or 0 to check inline.
+        :type workers: int
+        """
+        if pageSize < 1:
+            raise ValueError(f"Invalid page size: {pageSize}")
+        if workers < 0:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self._repos = {
+            entity_class.__name__: repo for entity_class, repo in repos.items()
+        }
+        self._page_size = pageSize
+        self._workers = workers
+
+    def references(self) -> List[Reference]:
+        """
+        Retrieves the references it checks.
+        :return: The references among the entity classes with a repository.
+        :rtype: List[org.acmsl.licdata.Reference]
+        """
+        return [
+            reference
+            for reference in Reference.all()
+            if reference.source_name in self._repos
+            and reference.target_name in self._repos
+        ]
+
+    def check(self) -> List[DanglingReference]:
+        """
+        Finds all dangling references.
+        :return: Such references, grouped by referencing entity class.
+        :rtype: List[org.acmsl.licdata.DanglingReference]
+        """
+        references = self.references()
+        ids = {
+            name: frozenset(entity.id for entity in self._scan(name))
+            for name in sorted({reference.target_name for reference in references})
+        }
+        by_source: Dict[str, List[Reference]] = {}
+        for reference in references:
+            by_source.setdefault(reference.source_name, []).append(reference)
+        if not self._workers:
+            result = []
+            for source_name, source_references in by_source.items():
+                result.extend(self._check_inline(source_name, source_references, ids))
+            return result
+        with ProcessPoolExecutor(
+            max_workers=self._workers, initializer=_init_worker, initargs=(ids,)
+        ) as executor:
+            result = []
+            for source_name, source_references in by_source.items():
+                result.extend(
+                    self._check_in_pool(source_name, source_references, executor)
+                )
+            return result
+
+    def _scan(self, entityName: str) -> Iterator[Entity]:
+        """
+        Retrieves the entities of given class, page by page.
+        :param entityName: The name of the entity class.
+        :type entityName: str
+        :return: Such entities.
+        :rtype: Iterator[pythoneda.shared.Entity]
+        """
+        repo = self._repos[entityName]
+        token = None
+        while True:
+            page, token = repo.list_page(self._page_size, token)
+            yield from page
+            if token is None:
+                return
+
+    def _getters(self, references: Sequence[Reference]) -> List:
+        """
+        Retrieves the getters of the referencing fields of an entity class.
+        :param references: The references.
+        :type references: Sequence[org.acmsl.licdata.Reference]
+        :return: Such getters.
+        :rtype: List[Callable[[pythoneda.shared.Entity], Optional[str]]]
+        """
+        table = FieldTable.of(references[0].source_class)
+        return [table.field(reference.attribute).getter for reference in references]
+
+    def _check_inline(
+        self,
+        sourceName: str,
+        references: List[Reference],
+        ids: Dict[str, FrozenSet[str]],
+    ) -> List[DanglingReference]:
+        """
+        Checks the references of an entity class in this process.
+        :param sourceName: The name of the referencing entity class.
+        :type sourceName: str
+        :param references: Its references.
+        :type references: List[org.acmsl.licdata.Reference]
+        :param ids: The ids of the referenced entities, by entity class name.
+        :type ids: Dict[str, FrozenSet[str]]
+        :return: The dangling references.
+        :rtype: List[org.acmsl.licdata.DanglingReference]
+        """
+        checks = list(
+            zip(
+                references,
+                self._getters(references),
+                [ids[reference.target_name] for reference in references],
+            )
+        )
+        result = []
+        for entity in self._scan(sourceName):
+            for reference, getter, targets in checks:
+                value = getter(entity)
+                if value is not None and value not in targets:
+                    result.append(DanglingReference(reference, entity.id, value))
+        return result
+
+    def _check_in_pool(
+        self,
+        sourceName: str,
+        references: List[Reference],
+        executor: ProcessPoolExecutor,
+    ) -> List[DanglingReference]:
+        """
+        Checks the references of an entity class in the process pool, one page
+        per task, with up to two pages per worker in flight.
+        :param sourceName: The name of the referencing entity class.
+        :type sourceName: str
+        :param references: Its references.
+        :type references: List[org.acmsl.licdata.Reference]
+        :param executor: The process pool.
+        :type executor: concurrent.futures.ProcessPoolExecutor
+        :return: The dangling references.
+        :rtype: List[org.acmsl.licdata.DanglingReference]
+        """
+        getters = self._getters(references)
+        target_names = tuple(reference.target_name for reference in references)
+        entities = self._scan(sourceName)
+        result = []
+        in_flight = deque()
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < 2 * self._workers:
+                rows = []
+                for entity in entities:
+                    rows.append(
+                        (entity.id, tuple(getter(entity) for getter in getters))
+                    )
+                    if len(rows) == self._page_size:
+                        break
+                exhausted = len(rows) < self._page_size
+                if rows:
+                    in_flight.append(
+                        executor.submit(_find_dangling, target_names, rows)
+                    )
+            if not in_flight:
+                return result
+            for position, source_id, target_id in in_flight.popleft().result():
+                result.append(
+                    DanglingReference(references[position], source_id, target_id)
+                )
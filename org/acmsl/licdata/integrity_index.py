@@ -0,0 +1,172 @@
+"""
+org/acmsl/licdata/integrity_index.py
+
+This file defines the IntegrityIndex class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .dangling_reference import DanglingReference
+from .field_table import FieldTable
+from .reference import Reference
+from pythoneda.shared import Entity
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class IntegrityIndex:
+    """
+    Keeps track of the dangling references as entities come and go.
+
+    Class name: IntegrityIndex
+
+    Responsibilities:
+        - Knows the ids of the entities other entities can refer to.
+        - Knows which entities refer to each id.
+        - Updates the dangling references as entities are indexed or removed,
+          without scanning any repository.
+        - Serializes the updates coming from different repositories, and
+          the lookups, with a lock of its own.
+
+    Collaborators:
+        - Reference: Declares the references to track.
+        - DanglingReference: The references to entities that do not exist.
+        - IntegrityChecker: Finds the dangling references in bulk.
+    """
+
+    def __init__(self, references: Optional[Iterable[Reference]] = None):
+        """
+        Creates a new IntegrityIndex instance.
+        :param references: The references to track, or None for all of them.
+        :type references: Optional[Iterable[org.acmsl.licdata.Reference]]
+        """
+        references = Reference.all() if references is None else tuple(references)
+        # each repository notifies under its own lock, so writes to different
+        # repositories would otherwise update the index at the same time
+        self._lock = threading.RLock()
+        self._references_by_source: Dict[str, List[Reference]] = {}
+        for reference in references:
+            self._references_by_source.setdefault(reference.source_name, []).append(
+                reference
+            )
+        self._ids: Dict[str, Set[str]] = {
+            reference.target_name: set() for reference in references
+        }
+        self._checks: Dict[type, List[Tuple[Reference, Callable]]] = {}
+        self._links: Dict[Tuple[str, str], List[DanglingReference]] = {}
+        self._referrers: Dict[Tuple[str, str], Set[DanglingReference]] = {}
+        self._dangling: Set[DanglingReference] = set()
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of dangling references.
+        :return: Such number.
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._dangling)
+
+    def dangling(self) -> List[DanglingReference]:
+        """
+        Retrieves the dangling references.
+        :return: Such references.
+        :rtype: List[org.acmsl.licdata.DanglingReference]
+        """
+        with self._lock:
+            return list(self._dangling)
+
+    def index(self, entity: Entity):
+        """
+        Indexes given entity, after it has been inserted or updated.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        """
+        with self._lock:
+            name = type(entity).__name__
+            ids = self._ids.get(name)
+            if ids is not None and entity.id not in ids:
+                ids.add(entity.id)
+                self._dangling.difference_update(
+                    self._referrers.get((name, entity.id), ())
+                )
+            checks = self._checks_of(type(entity))
+            if not checks:
+                return
+            self._unlink(name, entity.id)
+            links = []
+            for reference, getter in checks:
+                value = getter(entity)
+                if value is None:
+                    continue
+                link = DanglingReference(reference, entity.id, value)
+                links.append(link)
+                self._referrers.setdefault((reference.target_name, value), set()).add(
+                    link
+                )
+                if value not in self._ids[reference.target_name]:
+                    self._dangling.add(link)
+            if links:
+                self._links[(name, entity.id)] = links
+
+    def unindex(self, entity: Entity):
+        """
+        Removes given entity, after it has been deleted.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        """
+        with self._lock:
+            name = type(entity).__name__
+            self._unlink(name, entity.id)
+            ids = self._ids.get(name)
+            if ids is not None and entity.id in ids:
+                ids.discard(entity.id)
+                self._dangling.update(self._referrers.get((name, entity.id), ()))
+
+    def _checks_of(self, entityClass: type) -> List[Tuple[Reference, Callable]]:
+        """
+        Retrieves the references of given entity class, with their getters.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :return: Such references and getters.
+        :rtype: List[Tuple[org.acmsl.licdata.Reference, Callable]]
+        """
+        result = self._checks.get(entityClass)
+        if result is None:
+            references = self._references_by_source.get(entityClass.__name__, ())
+            table = FieldTable.of(entityClass) if references else None
+            result = [
+                (reference, table.field(reference.attribute).getter)
+                for reference in references
+            ]
+            self._checks[entityClass] = result
+        return result
+
+    def _unlink(self, sourceName: str, sourceId: str):
+        """
+        Forgets the references of given entity.
+        :param sourceName: The name of the entity class.
+        :type sourceName: str
+        :param sourceId: The id of the entity.
+        :type sourceId: str
+        """
+        for link in self._links.pop((sourceName, sourceId), ()):
+            key = (link.reference.target_name, link.target_id)
+            referrers = self._referrers.get(key)
+            if referrers is not None:
+                referrers.discard(link)
+                if not referrers:
+                    del self._referrers[key]
+            self._dangling.discard(link)
@@ -19,10 +19,16 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute, attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from .license_expiry import LicenseExpiry
+from .secondary_indexes import secondary_index
+import datetime
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class License(Entity):
     """
     Represents a license.
@@ -37,13 +43,21 @@ class License(Entity):
         - Product: The license applies to a Product.
     """
 
+    __slots__ = (
+        "_client_id",
+        "_product_id",
+        "_duration",
+        "_order_date",
+        "_primary_key",
+    )
+
     def __init__(
         self,
         clientId: str,
         productId: str,
         duration: int,
         orderDate,
-        eventHistory: List[EventReference] = [],
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new License instance.
@@ -58,13 +72,15 @@ class License(Entity):
         :param orderDate: The time when the license was ordered.
         :type orderDate: date
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._client_id = clientId
         self._product_id = productId
         self._duration = duration
         self._order_date = orderDate
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
@@ -77,8 +93,9 @@ class License(Entity):
         return self._client_id
 
     @property
+    @secondary_index
     @primary_key_attribute
-    def product_id(self):
+    def product_id(self) -> str:
         """
         Retrieves the product id.
         :return: Such id.
@@ -107,7 +124,7 @@ class License(Entity):
 
     @property
     @attribute
-    def order_date(self):
+    def order_date(self) -> datetime.date:
         """
         Retrieves the order date.
         :return: Such information.
@@ -123,3 +140,12 @@ class License(Entity):
         :type newValue: date
         """
         self._order_date = newValue
+
+    @property
+    def expires_at(self):
+        """
+        Retrieves when the license expires: its duration, in days, after its order date.
+        :return: Such time, or None if unknown.
+        :rtype: Optional[date]
+        """
+        return LicenseExpiry.expires_at(self._order_date, self._duration)
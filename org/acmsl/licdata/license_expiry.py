@@ -0,0 +1,147 @@
+"""
+org/acmsl/licdata/license_expiry.py
+
+This file defines the LicenseExpiry class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import datetime
+from typing import Any, Optional, Sequence, Union
+
+_numpy = None
+
+
+def _import_numpy() -> Any:
+    """
+    Imports numpy on first use, since importing it takes longer than
+    importing the whole package.
+    :return: The numpy module, or None if it's not installed.
+    :rtype: Any
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # numpy is optional
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+class LicenseExpiry:
+    """
+    Computes when licenses and orders expire.
+
+    Class name: LicenseExpiry
+
+    Responsibilities:
+        - Computes the expiry of a single order date and duration (in days).
+        - Computes the expiry of arrays of them, vectorized when numpy is available.
+        - Computes which of them are active at a given time.
+        - Normalizes dates and timestamps to dates, so they can be compared.
+
+    Collaborators:
+        - License: Provides its expiry through it.
+        - Order: Provides its expiry through it.
+    """
+
+    @classmethod
+    def as_date(cls, value: Optional[datetime.date]) -> Optional[datetime.date]:
+        """
+        Normalizes given date or timestamp to a date, since both are used as
+        order dates, and comparing them raises TypeError.
+        :param value: The date or timestamp.
+        :type value: Optional[datetime.date]
+        :return: The date, or None if unknown.
+        :rtype: Optional[datetime.date]
+        """
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        return value
+
+    @classmethod
+    def expires_at(
+        cls, orderDate: Optional[datetime.date], duration: Optional[int]
+    ) -> Optional[datetime.date]:
+        """
+        Computes the expiry of an order date and a duration.
+        :param orderDate: The order date.
+        :type orderDate: Optional[datetime.date]
+        :param duration: The duration, in days.
+        :type duration: Optional[int]
+        :return: The expiry (a datetime if the order date is one), or None if unknown.
+        :rtype: Optional[datetime.date]
+        """
+        if orderDate is None or duration is None:
+            return None
+        return orderDate + datetime.timedelta(days=duration)
+
+    @classmethod
+    def expires_at_many(
+        cls, orderDates: Sequence, durations: Sequence[int]
+    ) -> Union["numpy.ndarray", list]:
+        """
+        Computes the expiries of arrays of order dates and durations, such as
+        the order_date and duration columns exported by ColumnarExport.
+        :param orderDates: The order dates.
+        :type orderDates: Sequence
+        :param durations: The durations, in days.
+        :type durations: Sequence[int]
+        :return: The expiries, as datetime64[D] if numpy is available.
+        :rtype: Union[numpy.ndarray, list]
+        """
+        numpy = _import_numpy()
+        if numpy is None:
+            return [
+                cls.expires_at(order_date, duration)
+                for order_date, duration in zip(orderDates, durations)
+            ]
+        return numpy.asarray(orderDates, dtype="datetime64[D]") + numpy.asarray(
+            durations, dtype="timedelta64[D]"
+        )
+
+    @classmethod
+    def active_at(
+        cls, orderDates: Sequence, durations: Sequence[int], at: datetime.date
+    ) -> Union["numpy.ndarray", list]:
+        """
+        Computes which order dates and durations are active at given time,
+        i.e. ordered on or before it and expiring after it.
+        :param orderDates: The order dates.
+        :type orderDates: Sequence
+        :param durations: The durations, in days.
+        :type durations: Sequence[int]
+        :param at: The time.
+        :type at: datetime.date
+        :return: The mask, as a boolean array if numpy is available.
+        :rtype: Union[numpy.ndarray, list]
+        """
+        numpy = _import_numpy()
+        if numpy is None:
+            at = cls.as_date(at)
+            return [
+                order_date is not None
+                and duration is not None
+                and cls.as_date(order_date)
+                <= at
+                < cls.as_date(cls.expires_at(order_date, duration))
+                for order_date, duration in zip(orderDates, durations)
+            ]
+        at = numpy.datetime64(at, "D")
+        order_dates = numpy.asarray(orderDates, dtype="datetime64[D]")
+        expiries = order_dates + numpy.asarray(durations, dtype="timedelta64[D]")
+        return (order_dates <= at) & (at < expiries)
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .license import License
-from pythoneda.shared import Repo
 
 
-class LicenseRepo(Repo):
+class LicenseRepo(BaseRepo):
     """
-    A subclass of Repo that manages Licenses.
+    A subclass of BaseRepo that manages Licenses.
 
     Class name: LicenseRepo
 
@@ -0,0 +1,376 @@
+"""
+org/acmsl/licdata/license_validation_index.py
+
+This file defines the LicenseValidationIndex class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .incident import Incident
+from .license import License
+from .license_expiry import LicenseExpiry
+from .license_verdict import LicenseVerdict
+from .order import Order
+from .pc import Pc
+from .product import Product
+import datetime
+from pythoneda.shared import Entity
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_Window = Tuple[datetime.date, datetime.date, str]
+"""
+The start, the end and the product id of a validity window.
+"""
+
+
+class LicenseValidationIndex:
+    """
+    Maps installation codes to the validity windows of their licenses.
+
+    Class name: LicenseValidationIndex
+
+    Responsibilities:
+        - Resolves Pc -> Incident/License -> Product -> expiry ahead of time.
+        - Validates an installation code with a single dictionary lookup,
+          optionally for a given product.
+        - Validates batches of installation codes.
+        - Follows the writes of the repositories, so it doesn't drift from
+          them.
+        - Serializes the updates coming from different repositories, and
+          the lookups, with a lock of its own.
+
+    Collaborators:
+        - Pc: Provides the installation codes.
+        - Incident: Links licenses to PCs.
+        - License: Provides the validity windows.
+        - Order: Renews the License of the same client and product.
+        - Product: Licenses only count while their product exists.
+        - LicenseExpiry: Normalizes the windows to dates.
+        - LicenseVerdict: The outcome of each validation.
+        - InMemoryRepo: Notifies it of every write, once followed.
+    """
+
+    def __init__(self):
+        """
+        Creates a new LicenseValidationIndex instance.
+        """
+        # each repository notifies under its own lock, so writes to different
+        # repositories would otherwise update the index at the same time
+        self._lock = threading.RLock()
+        self._code_by_pc: Dict[str, str] = {}
+        self._licenses_by_pc: Dict[str, Set[str]] = {}
+        self._pcs_by_license: Dict[str, Set[str]] = {}
+        self._incidents: Dict[str, Tuple[str, str]] = {}
+        self._incidents_by_link: Dict[Tuple[str, str], int] = {}
+        self._licenses: Dict[str, Tuple[Tuple[str, str], Optional[_Window]]] = {}
+        self._licenses_by_pk: Dict[Tuple[str, str], Set[str]] = {}
+        self._orders: Dict[str, Tuple[str, str]] = {}
+        self._order_windows_by_pk: Dict[Tuple[str, str], Dict[str, _Window]] = {}
+        self._products: Set[str] = set()
+        self._windows_by_code: Dict[str, Tuple[_Window, ...]] = {}
+
+    def follow(self, repos: Iterable[Any]):
+        """
+        Indexes the entities of given repositories, and keeps up with their
+        writes from then on.
+        :param repos: The Pc, Incident, License, Order and Product repositories.
+        :type repos: Iterable[org.acmsl.licdata.InMemoryRepo]
+        """
+        for repo in repos:
+            repo.subscribe(self)
+
+    def index(self, entity: Entity):
+        """
+        Indexes given entity, after it has been inserted or updated.
+        :param entity: The Pc, Incident, License, Order or Product. Other
+        entities are ignored.
+        :type entity: pythoneda.shared.Entity
+        """
+        with self._lock:
+            if isinstance(entity, Pc):
+                self._index_pc(entity)
+            elif isinstance(entity, Incident):
+                self._index_incident(entity)
+            elif isinstance(entity, License):
+                self._index_license(entity)
+            elif isinstance(entity, Order):
+                self._index_order(entity)
+            elif isinstance(entity, Product):
+                if entity.id not in self._products:
+                    self._products.add(entity.id)
+                    self._refresh_product(entity.id)
+
+    def unindex(self, entity: Entity):
+        """
+        Removes given entity, after it has been deleted.
+        :param entity: The Pc, Incident, License, Order or Product. Other
+        entities are ignored.
+        :type entity: pythoneda.shared.Entity
+        """
+        with self._lock:
+            if isinstance(entity, Pc):
+                code = self._code_by_pc.pop(entity.id, None)
+                self._windows_by_code.pop(code, None)
+            elif isinstance(entity, Incident):
+                self._remove_incident(entity.id)
+            elif isinstance(entity, License):
+                self._remove_license(entity.id)
+            elif isinstance(entity, Order):
+                self._remove_order(entity.id)
+            elif isinstance(entity, Product):
+                if entity.id in self._products:
+                    self._products.discard(entity.id)
+                    self._refresh_product(entity.id)
+
+    def validate(
+        self,
+        installationCode: str,
+        at: datetime.date,
+        productId: Optional[str] = None,
+    ) -> LicenseVerdict:
+        """
+        Validates an installation code.
+        :param installationCode: The installation code.
+        :type installationCode: str
+        :param at: The time of the validation.
+        :type at: datetime.date
+        :param productId: The product to validate, or None for any.
+        :type productId: Optional[str]
+        :return: The verdict.
+        :rtype: org.acmsl.licdata.LicenseVerdict
+        """
+        with self._lock:
+            # windows are immutable tuples, replaced whole on every refresh,
+            # so they can be checked once the lock is released
+            windows = self._windows_by_code.get(installationCode)
+        if windows is None:
+            return LicenseVerdict.UNKNOWN
+        at = LicenseExpiry.as_date(at)
+        licensed = False
+        for start, end, product_id in windows:
+            if productId is not None and product_id != productId:
+                continue
+            if start <= at < end:
+                return LicenseVerdict.VALID
+            licensed = True
+        return LicenseVerdict.EXPIRED if licensed else LicenseVerdict.UNLICENSED
+
+    def validate_many(
+        self,
+        installationCodes: Iterable[str],
+        at: datetime.date,
+        productId: Optional[str] = None,
+    ) -> List[LicenseVerdict]:
+        """
+        Validates a batch of installation codes, at the same time.
+        :param installationCodes: The installation codes.
+        :type installationCodes: Iterable[str]
+        :param at: The time of the validation.
+        :type at: datetime.date
+        :param productId: The product to validate, or None for any.
+        :type productId: Optional[str]
+        :return: The verdicts, in the same order.
+        :rtype: List[org.acmsl.licdata.LicenseVerdict]
+        """
+        validate = self.validate
+        at = LicenseExpiry.as_date(at)
+        with self._lock:
+            return [validate(code, at, productId) for code in installationCodes]
+
+    @classmethod
+    def _window_of(cls, entity: Entity) -> Optional[_Window]:
+        """
+        Retrieves the validity window of given License or Order.
+        :param entity: The License or Order.
+        :type entity: pythoneda.shared.Entity
+        :return: The window, or None if it never expires nor starts.
+        :rtype: Optional[_Window]
+        """
+        expires_at = entity.expires_at
+        if expires_at is None:
+            return None
+        return (
+            LicenseExpiry.as_date(entity.order_date),
+            LicenseExpiry.as_date(expires_at),
+            entity.product_id,
+        )
+
+    def _index_pc(self, pc: Pc):
+        """
+        Indexes given Pc.
+        :param pc: The Pc.
+        :type pc: org.acmsl.licdata.Pc
+        """
+        previous = self._code_by_pc.get(pc.id)
+        if previous is not None and previous != pc.installation_code:
+            self._windows_by_code.pop(previous, None)
+        self._code_by_pc[pc.id] = pc.installation_code
+        self._refresh_pcs((pc.id,))
+
+    def _index_incident(self, incident: Incident):
+        """
+        Indexes given Incident.
+        :param incident: The Incident.
+        :type incident: org.acmsl.licdata.Incident
+        """
+        self._remove_incident(incident.id)
+        link = (incident.license_id, incident.pc_id)
+        self._incidents[incident.id] = link
+        self._incidents_by_link[link] = self._incidents_by_link.get(link, 0) + 1
+        self._licenses_by_pc.setdefault(incident.pc_id, set()).add(incident.license_id)
+        self._pcs_by_license.setdefault(incident.license_id, set()).add(incident.pc_id)
+        self._refresh_pcs((incident.pc_id,))
+
+    def _remove_incident(self, incidentId: str):
+        """
+        Removes the Incident with given id.
+        :param incidentId: The id of the Incident.
+        :type incidentId: str
+        """
+        link = self._incidents.pop(incidentId, None)
+        if link is None:
+            return
+        license_id, pc_id = link
+        remaining = self._incidents_by_link.pop(link) - 1
+        if remaining:
+            self._incidents_by_link[link] = remaining
+        else:
+            self._discard(self._licenses_by_pc, pc_id, license_id)
+            self._discard(self._pcs_by_license, license_id, pc_id)
+        self._refresh_pcs((pc_id,))
+
+    def _index_license(self, license: License):
+        """
+        Indexes given License.
+        :param license: The License.
+        :type license: org.acmsl.licdata.License
+        """
+        self._remove_license(license.id, refresh=False)
+        pk = (license.client_id, license.product_id)
+        self._licenses[license.id] = (pk, self._window_of(license))
+        self._licenses_by_pk.setdefault(pk, set()).add(license.id)
+        self._refresh_pcs(self._pcs_by_license.get(license.id, ()))
+
+    def _remove_license(self, licenseId: str, refresh: bool = True):
+        """
+        Removes the License with given id.
+        :param licenseId: The id of the License.
+        :type licenseId: str
+        :param refresh: Whether to recompute the windows of its PCs.
+        :type refresh: bool
+        """
+        entry = self._licenses.pop(licenseId, None)
+        if entry is not None:
+            self._discard(self._licenses_by_pk, entry[0], licenseId)
+        if refresh:
+            self._refresh_pcs(self._pcs_by_license.get(licenseId, ()))
+
+    def _index_order(self, order: Order):
+        """
+        Indexes given Order, as a renewal of the License of the same client
+        and product.
+        :param order: The Order.
+        :type order: org.acmsl.licdata.Order
+        """
+        self._remove_order(order.id, refresh=False)
+        pk = (order.client_id, order.product_id)
+        window = self._window_of(order)
+        if window is not None:
+            self._orders[order.id] = pk
+            self._order_windows_by_pk.setdefault(pk, {})[order.id] = window
+        self._refresh_licenses(self._licenses_by_pk.get(pk, ()))
+
+    def _remove_order(self, orderId: str, refresh: bool = True):
+        """
+        Removes the Order with given id.
+        :param orderId: The id of the Order.
+        :type orderId: str
+        :param refresh: Whether to recompute the windows of its License's PCs.
+        :type refresh: bool
+        """
+        pk = self._orders.pop(orderId, None)
+        if pk is None:
+            return
+        windows = self._order_windows_by_pk[pk]
+        del windows[orderId]
+        if not windows:
+            del self._order_windows_by_pk[pk]
+        if refresh:
+            self._refresh_licenses(self._licenses_by_pk.get(pk, ()))
+
+    def _refresh_product(self, productId: str):
+        """
+        Recomputes the windows of the PCs licensed for given Product.
+        :param productId: The id of the Product.
+        :type productId: str
+        """
+        self._refresh_licenses(
+            license_id
+            for license_id, ((_, product_id), _) in self._licenses.items()
+            if product_id == productId
+        )
+
+    def _refresh_licenses(self, licenseIds: Iterable[str]):
+        """
+        Recomputes the windows of the PCs of given Licenses.
+        :param licenseIds: The ids of the Licenses.
+        :type licenseIds: Iterable[str]
+        """
+        pc_ids = set()
+        for license_id in licenseIds:
+            pc_ids.update(self._pcs_by_license.get(license_id, ()))
+        self._refresh_pcs(pc_ids)
+
+    def _refresh_pcs(self, pcIds: Iterable[str]):
+        """
+        Recomputes the validity windows of the installation codes of given Pcs.
+        :param pcIds: The ids of the Pcs.
+        :type pcIds: Iterable[str]
+        """
+        for pc_id in list(pcIds):
+            code = self._code_by_pc.get(pc_id)
+            if code is None:
+                continue
+            windows = []
+            for license_id in self._licenses_by_pc.get(pc_id, ()):
+                entry = self._licenses.get(license_id)
+                if entry is None:
+                    continue
+                pk, window = entry
+                if pk[1] not in self._products:
+                    continue
+                if window is not None:
+                    windows.append(window)
+                windows.extend(self._order_windows_by_pk.get(pk, {}).values())
+            self._windows_by_code[code] = tuple(sorted(windows))
+
+    @classmethod
+    def _discard(cls, index: Dict[Any, Set[str]], key: Any, value: str):
+        """
+        Removes a value from a multimap.
+        :param index: The multimap.
+        :type index: Dict[Any, Set[str]]
+        :param key: The key.
+        :type key: Any
+        :param value: The value.
+        :type value: str
+        """
+        values = index.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del index[key]
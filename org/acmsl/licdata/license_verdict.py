@@ -0,0 +1,56 @@
+"""
+org/acmsl/licdata/license_verdict.py
+
+This file defines the LicenseVerdict class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from enum import Enum
+
+
+class LicenseVerdict(Enum):
+    """
+    The outcome of validating an installation.
+
+    Class name: LicenseVerdict
+
+    Responsibilities:
+        - Enumerates the possible outcomes of validating an installation code.
+
+    Collaborators:
+        - None
+    """
+
+    VALID = "valid"
+    """
+    A license of the installation is active.
+    """
+
+    EXPIRED = "expired"
+    """
+    The installation has licenses, but none is active.
+    """
+
+    UNLICENSED = "unlicensed"
+    """
+    The installation is known, but has no licenses.
+    """
+
+    UNKNOWN = "unknown"
+    """
+    The installation code is not known.
+    """
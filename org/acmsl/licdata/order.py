@@ -19,10 +19,15 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute, attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from .license_expiry import LicenseExpiry
+import datetime
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class Order(Entity):
     """
     Represents an order.
@@ -37,13 +42,21 @@ class Order(Entity):
         - Product: An order contains a Product.
     """
 
+    __slots__ = (
+        "_client_id",
+        "_product_id",
+        "_duration",
+        "_order_date",
+        "_primary_key",
+    )
+
     def __init__(
         self,
         clientId: str,
         productId: str,
         duration: int,
         orderDate,
-        eventHistory: List[EventReference] = [],
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new Order instance.
@@ -56,13 +69,15 @@ class Order(Entity):
         :param orderDate: When the order was placed.
         :type orderDate: date
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._client_id = clientId
         self._product_id = productId
         self._duration = duration
         self._order_date = orderDate
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
@@ -76,7 +91,7 @@ class Order(Entity):
 
     @property
     @primary_key_attribute
-    def product_id(self):
+    def product_id(self) -> str:
         """
         Retrieves the id of the product.
         :return: Such id.
@@ -105,7 +120,7 @@ class Order(Entity):
 
     @property
     @attribute
-    def order_date(self):
+    def order_date(self) -> datetime.date:
         """
         Retrieves the order date.
         :return: Such information.
@@ -121,3 +136,12 @@ class Order(Entity):
         :type newValue: date
         """
         self._order_date = newValue
+
+    @property
+    def expires_at(self):
+        """
+        Retrieves when the order expires: its duration, in days, after its order date.
+        :return: Such time, or None if unknown.
+        :rtype: Optional[date]
+        """
+        return LicenseExpiry.expires_at(self._order_date, self._duration)
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .order import Order
-from pythoneda.shared import Repo
 
 
-class OrderRepo(Repo):
+class OrderRepo(BaseRepo):
     """
-    A subclass of Repo that manages Orders.
+    A subclass of BaseRepo that manages Orders.
 
     Class name: OrderRepo
 
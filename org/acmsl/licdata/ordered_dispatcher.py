@@ -0,0 +1,170 @@
+"""
+org/acmsl/licdata/ordered_dispatcher.py
+
+This file defines the OrderedDispatcher class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+from pythoneda.shared import BaseObject
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set
+
+
+class OrderedDispatcher(BaseObject):
+    """
+    Runs handlers concurrently, but in order for the same key.
+
+    Class name: OrderedDispatcher
+
+    Responsibilities:
+        - Runs the handlers of different keys concurrently, up to a limit.
+        - Runs the handlers of the same key one after another, in submission order.
+        - Treats aliased keys (i.e. an entity id and an email) as the same key,
+          while the handlers of such key are pending.
+        - Logs the failures of the handlers nobody awaits.
+
+    Collaborators:
+        - pythoneda.shared.BaseObject: Provides the logger.
+    """
+
+    def __init__(self, maxConcurrency: int = 32):
+        """
+        Creates a new OrderedDispatcher instance.
+        :param maxConcurrency: The maximum number of handlers running at once.
+        :type maxConcurrency: int
+        """
+        if maxConcurrency < 1:
+            raise ValueError(f"Invalid concurrency: {maxConcurrency}")
+        self._semaphore = asyncio.Semaphore(maxConcurrency)
+        self._tails: Dict[Hashable, asyncio.Task] = {}
+        self._aliases: Dict[Hashable, Hashable] = {}
+        self._aliases_of: Dict[Hashable, Set[Hashable]] = {}
+        super().__init__()
+
+    def alias(self, key: Hashable, canonicalKey: Hashable):
+        """
+        Declares two keys identify the same entity, until the handlers of the
+        canonical key drain. Afterwards there's nothing left to order after,
+        so the alias is dropped instead of being kept forever.
+        :param key: The new key.
+        :type key: Hashable
+        :param canonicalKey: The key it's equivalent to.
+        :type canonicalKey: Hashable
+        """
+        canonical = self._aliases.get(canonicalKey, canonicalKey)
+        if key != canonical and canonical in self._tails:
+            self._aliases[key] = canonical
+            self._aliases_of.setdefault(canonical, set()).add(key)
+
+    def submit(
+        self, key: Hashable, handler: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """
+        Schedules given handler after the ones already submitted for the same key.
+        It must be called from within the event loop. Failures are logged unless
+        the task is awaited through dispatch().
+        :param key: The ordering key, i.e. the entity id.
+        :type key: Hashable
+        :param handler: The handler.
+        :type handler: Callable[[], Awaitable[Any]]
+        :return: The task running the handler.
+        :rtype: asyncio.Task
+        """
+        result = self._schedule(key, handler)
+        result.add_done_callback(self._log_failure)
+        return result
+
+    def _schedule(
+        self, key: Hashable, handler: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """
+        Schedules given handler after the ones already submitted for the same key.
+        :param key: The ordering key, i.e. the entity id.
+        :type key: Hashable
+        :param handler: The handler.
+        :type handler: Callable[[], Awaitable[Any]]
+        :return: The task running the handler.
+        :rtype: asyncio.Task
+        """
+        key = self._aliases.get(key, key)
+        result = asyncio.ensure_future(self._run(self._tails.get(key), handler))
+        self._tails[key] = result
+        result.add_done_callback(lambda task: self._forget(key, task))
+        return result
+
+    async def dispatch(
+        self, key: Hashable, handler: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Runs given handler after the ones already submitted for the same key.
+        :param key: The ordering key, i.e. the entity id.
+        :type key: Hashable
+        :param handler: The handler.
+        :type handler: Callable[[], Awaitable[Any]]
+        :return: The outcome of the handler.
+        :rtype: Any
+        """
+        return await self._schedule(key, handler)
+
+    async def drain(self):
+        """
+        Waits until all submitted handlers have finished.
+        """
+        while self._tails:
+            await asyncio.wait(list(self._tails.values()))
+
+    async def _run(
+        self, previous: asyncio.Task, handler: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Runs given handler once the previous one of its key has finished,
+        whatever its outcome.
+        :param previous: The task of the previous handler, if any.
+        :type previous: Optional[asyncio.Task]
+        :param handler: The handler.
+        :type handler: Callable[[], Awaitable[Any]]
+        :return: The outcome of the handler.
+        :rtype: Any
+        """
+        if previous is not None:
+            await asyncio.wait([previous])
+        async with self._semaphore:
+            return await handler()
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """
+        Drops the tail of given key, and its aliases, if it's given task.
+        :param key: The key.
+        :type key: Hashable
+        :param task: The finished task.
+        :type task: asyncio.Task
+        """
+        if self._tails.get(key) is task:
+            del self._tails[key]
+            for alias in self._aliases_of.pop(key, ()):
+                if self._aliases.get(alias) == key:
+                    del self._aliases[alias]
+
+    @classmethod
+    def _log_failure(cls, task: asyncio.Task):
+        """
+        Logs the exception of given task, if any, so it doesn't go unnoticed.
+        :param task: The finished task.
+        :type task: asyncio.Task
+        """
+        if not task.cancelled() and task.exception() is not None:
+            cls.logger().error("Handler failed", exc_info=task.exception())
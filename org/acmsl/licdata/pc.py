@@ -19,10 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute, attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class Pc(Entity):
     """
     Represents a PC.
@@ -36,7 +39,11 @@ class Pc(Entity):
         - None
     """
 
-    def __init__(self, installationCode: str, eventHistory: List[EventReference] = []):
+    __slots__ = ("_installation_code", "_primary_key")
+
+    def __init__(
+        self, installationCode: str, eventHistory: Optional[List[EventReference]] = None
+    ):
         """
         Creates a new Pc instance.
         :param id: The id.
@@ -44,10 +51,12 @@ class Pc(Entity):
         :param installationCode: The installation code.
         :type installationCode: str
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._installation_code = installationCode
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public Pc
 along with this program.  If not, see <https://www.gnu.org/pcs/>.
 """
 
+from .base_repo import BaseRepo
 from .pc import Pc
-from pythoneda.shared import Repo
 
 
-class PcRepo(Repo):
+class PcRepo(BaseRepo):
     """
-    A subclass of Repo that manages Pcs.
+    A subclass of BaseRepo that manages Pcs.
 
     Class name: PcRepo
 
@@ -19,10 +19,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute, attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from .secondary_indexes import secondary_index
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class Prelicense(Entity):
     """
     Represents a prelicense.
@@ -36,12 +40,14 @@ class Prelicense(Entity):
         - Order: A Prelicense belongs to an order.
     """
 
+    __slots__ = ("_order_id", "_seats", "_duration", "_primary_key")
+
     def __init__(
         self,
         orderId: str,
         seats: int,
         duration: int,
-        eventHistory: List[EventReference] = [],
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new Prelicense instance.
@@ -54,14 +60,17 @@ class Prelicense(Entity):
         :param duration: The duration.
         :type duration: int
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._order_id = orderId
         self._seats = seats
         self._duration = duration
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
+    @secondary_index
     @primary_key_attribute
     def order_id(self) -> str:
         """
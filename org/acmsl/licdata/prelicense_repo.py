@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public Prelicense
 along with this program.  If not, see <https://www.gnu.org/prelicenses/>.
 """
 
+from .base_repo import BaseRepo
 from .prelicense import Prelicense
-from pythoneda.shared import Repo
 
 
-class PrelicenseRepo(Repo):
+class PrelicenseRepo(BaseRepo):
     """
-    A subclass of Repo that manages Prelicenses.
+    A subclass of BaseRepo that manages Prelicenses.
 
     Class name: PrelicenseRepo
 
@@ -19,10 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import Entity, EventReference, primary_key_attribute, attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class Product(Entity):
     """
     Represents a product.
@@ -36,11 +39,13 @@ class Product(Entity):
         - ProductType: Defines the type of a product.
     """
 
+    __slots__ = ("_product_type_id", "_product_version", "_primary_key")
+
     def __init__(
         self,
         productTypeId: str,
         productVersion: str,
-        eventHistory: List[EventReference] = [],
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new Product instance.
@@ -49,11 +54,13 @@ class Product(Entity):
         :param productVersion: The version of the product.
         :type productVersion: str
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._product_type_id = productTypeId
         self._product_version = productVersion
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
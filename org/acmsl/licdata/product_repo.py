@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .product import Product
-from pythoneda.shared import Repo
 
 
-class ProductRepo(Repo):
+class ProductRepo(BaseRepo):
     """
-    A subclass of Repo that manages Products.
+    A subclass of BaseRepo that manages Products.
 
     Class name: ProductRepo
 
@@ -19,10 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import attribute, Entity, EventReference, primary_key_attribute
-from typing import List
+from .event_history import EventHistory
+from .field_table import attribute, primary_key_attribute, with_field_table
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class ProductType(Entity):
     """
     Represents a product type.
@@ -36,8 +39,13 @@ class ProductType(Entity):
         - None
     """
 
+    __slots__ = ("_name", "_version", "_primary_key")
+
     def __init__(
-        self, name: str, version: str, eventHistory: List[EventReference] = []
+        self,
+        name: str,
+        version: str,
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new ProductType instance.
@@ -46,11 +54,13 @@ class ProductType(Entity):
         :param version: The version.
         :type version: str
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._name = name
         self._version = version
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
     @primary_key_attribute
@@ -64,7 +74,7 @@ class ProductType(Entity):
 
     @property
     @primary_key_attribute
-    def version(self):
+    def version(self) -> str:
         """
         Retrieves the version.
         :return: Such information.
@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .product_type import ProductType
-from pythoneda.shared import Repo
 
 
-class ProductTypeRepo(Repo):
+class ProductTypeRepo(BaseRepo):
     """
-    A subclass of Repo that manages ProductTypes.
+    A subclass of BaseRepo that manages ProductTypes.
 
     Class name: ProductTypeRepo
 
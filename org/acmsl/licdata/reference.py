@@ -0,0 +1,146 @@
+"""
+org/acmsl/licdata/reference.py
+
+This file defines the Reference class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import importlib
+from typing import Tuple
+
+
+class Reference:
+    """
+    A field of an entity holding the id of another entity.
+
+    Class name: Reference
+
+    Responsibilities:
+        - Knows the referencing entity, the field, and the referenced entity.
+        - Lists all references among the Licdata entities.
+
+    Collaborators:
+        - pythoneda.shared.Entity: The entities involved.
+
+    Entities are named rather than imported, so that declaring the references
+    does not load every entity.
+    """
+
+    __slots__ = ("_source_name", "_attribute", "_target_name")
+
+    def __init__(self, sourceName: str, attribute: str, targetName: str):
+        """
+        Creates a new Reference instance.
+        :param sourceName: The name of the referencing entity class.
+        :type sourceName: str
+        :param attribute: The referencing field.
+        :type attribute: str
+        :param targetName: The name of the referenced entity class.
+        :type targetName: str
+        """
+        self._source_name = sourceName
+        self._attribute = attribute
+        self._target_name = targetName
+
+    @property
+    def source_name(self) -> str:
+        """
+        Retrieves the name of the referencing entity class.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._source_name
+
+    @property
+    def attribute(self) -> str:
+        """
+        Retrieves the referencing field.
+        :return: Its name.
+        :rtype: str
+        """
+        return self._attribute
+
+    @property
+    def target_name(self) -> str:
+        """
+        Retrieves the name of the referenced entity class.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._target_name
+
+    @property
+    def source_class(self) -> type:
+        """
+        Retrieves the referencing entity class.
+        :return: Such class.
+        :rtype: type
+        """
+        return getattr(importlib.import_module("org.acmsl.licdata"), self._source_name)
+
+    @property
+    def target_class(self) -> type:
+        """
+        Retrieves the referenced entity class.
+        :return: Such class.
+        :rtype: type
+        """
+        return getattr(importlib.import_module("org.acmsl.licdata"), self._target_name)
+
+    @classmethod
+    def all(cls) -> Tuple["Reference", ...]:
+        """
+        Retrieves the references among the Licdata entities.
+        :return: Such references.
+        :rtype: Tuple[org.acmsl.licdata.Reference, ...]
+        """
+        return _REFERENCES
+
+    @classmethod
+    def of(cls, sourceName: str) -> Tuple["Reference", ...]:
+        """
+        Retrieves the references of given entity.
+        :param sourceName: The name of the referencing entity class.
+        :type sourceName: str
+        :return: Such references.
+        :rtype: Tuple[org.acmsl.licdata.Reference, ...]
+        """
+        return tuple(
+            reference
+            for reference in _REFERENCES
+            if reference.source_name == sourceName
+        )
+
+    def __repr__(self) -> str:
+        """
+        Retrieves a representation of the reference.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"{self._source_name}.{self._attribute} -> {self._target_name}"
+
+
+_REFERENCES = (
+    Reference("Incident", "license_id", "License"),
+    Reference("Incident", "pc_id", "Pc"),
+    Reference("License", "client_id", "Client"),
+    Reference("License", "product_id", "Product"),
+    Reference("Order", "client_id", "Client"),
+    Reference("Order", "product_id", "Product"),
+    Reference("Prelicense", "order_id", "Order"),
+    Reference("Product", "product_type_id", "ProductType"),
+)
@@ -0,0 +1,69 @@
+"""
+org/acmsl/licdata/replay_error.py
+
+This file defines the ReplayError class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class ReplayError(ValueError):
+    """
+    An event stream that cannot rebuild an entity.
+
+    Class name: ReplayError
+
+    Responsibilities:
+        - Signals an event applied before the entity exists, i.e. because the
+          creation event and the snapshot are both missing.
+
+    Collaborators:
+        - Snapshotter: Replays the events.
+    """
+
+    def __init__(self, entityClass: type, event):
+        """
+        Creates a new ReplayError instance.
+        :param entityClass: The class of the entity being rebuilt.
+        :type entityClass: type
+        :param event: The event that cannot be applied.
+        :type event: pythoneda.shared.Event
+        """
+        super().__init__(
+            f"Cannot apply {event.__class__.__name__} {event.id}: "
+            f"there is no {entityClass.__name__} yet (missing creation event "
+            "or snapshot)"
+        )
+        self._entity_class = entityClass
+        self._event = event
+
+    @property
+    def entity_class(self) -> type:
+        """
+        Retrieves the class of the entity being rebuilt.
+        :return: Such class.
+        :rtype: type
+        """
+        return self._entity_class
+
+    @property
+    def event(self):
+        """
+        Retrieves the event that cannot be applied.
+        :return: Such event.
+        :rtype: pythoneda.shared.Event
+        """
+        return self._event
@@ -0,0 +1,125 @@
+"""
+org/acmsl/licdata/repo_handle.py
+
+This file defines the RepoHandle class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from pythoneda.shared import Port, Ports
+from typing import Dict, Optional
+
+
+class RepoHandle:
+    """
+    A cached binding of a repository port to its adapter.
+
+    Class name: RepoHandle
+
+    Responsibilities:
+        - Resolves the adapter of a port once, instead of on every event.
+        - Resolves it again once invalidated, or once the registry is
+          replaced.
+        - Allows binding an adapter explicitly, bypassing the registry.
+
+    Collaborators:
+        - pythoneda.shared.Ports: The port registry.
+
+    Ports offers no way to learn about new registrations, so whoever registers
+    adapters after the handles have been used must call
+    RepoHandle.invalidate_all() afterwards, or invalidate() on the affected
+    handle. Both bump a generation the handles compare against on lookup.
+    """
+
+    _generation = 0
+    _handles: Dict[type, "RepoHandle"] = {}
+
+    def __init__(self, portClass: type):
+        """
+        Creates a new RepoHandle instance.
+        :param portClass: The port.
+        :type portClass: type
+        """
+        self._port_class = portClass
+        self._adapter = None
+        self._bound = None
+        self._ports = None
+        self._resolved_generation = -1
+
+    @property
+    def port_class(self) -> type:
+        """
+        Retrieves the port.
+        :return: Such port.
+        :rtype: type
+        """
+        return self._port_class
+
+    @classmethod
+    def for_port(cls, portClass: type) -> "RepoHandle":
+        """
+        Retrieves the shared handle of given port.
+        :param portClass: The port.
+        :type portClass: type
+        :return: Such handle.
+        :rtype: org.acmsl.licdata.RepoHandle
+        """
+        result = cls._handles.get(portClass)
+        if result is None:
+            result = cls._handles.setdefault(portClass, cls(portClass))
+        return result
+
+    @classmethod
+    def invalidate_all(cls):
+        """
+        Forces all handles to resolve their adapters again, i.e. after
+        registering adapters in Ports.
+        """
+        cls._generation += 1
+
+    def get(self) -> Optional[Port]:
+        """
+        Retrieves the adapter of the port.
+        :return: Such adapter, or None if none is registered.
+        :rtype: Optional[pythoneda.shared.Port]
+        """
+        if self._bound is not None:
+            return self._bound
+        ports = Ports.instance()
+        if (
+            self._adapter is None
+            or self._ports is not ports
+            or self._resolved_generation != RepoHandle._generation
+        ):
+            self._adapter = ports.resolve_first(self._port_class)
+            self._ports = ports
+            self._resolved_generation = RepoHandle._generation
+        return self._adapter
+
+    def invalidate(self):
+        """
+        Forces this handle to resolve its adapter again, i.e. after registering
+        an adapter of its port in Ports.
+        """
+        self._resolved_generation = -1
+
+    def bind(self, adapter: Optional[Port]):
+        """
+        Binds given adapter to the port, regardless of the Ports registry.
+        :param adapter: The adapter, or None to use the registry again.
+        :type adapter: Optional[pythoneda.shared.Port]
+        """
+        self._bound = adapter
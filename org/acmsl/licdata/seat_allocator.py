@@ -0,0 +1,227 @@
+"""
+org/acmsl/licdata/seat_allocator.py
+
+This file defines the SeatAllocator class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .prelicense import Prelicense
+from .seat_lease import SeatLease
+import heapq
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import uuid
+
+
+class _SeatPool:
+    """
+    The leases of a single prelicense. Its lock must be held to use it.
+    """
+
+    __slots__ = ("lock", "leases", "lease_by_holder", "expiries")
+
+    def __init__(self):
+        """
+        Creates a new _SeatPool instance.
+        """
+        self.lock = threading.Lock()
+        self.leases: Dict[str, SeatLease] = {}
+        self.lease_by_holder: Dict[str, str] = {}
+        self.expiries: List[Tuple[float, str]] = []
+
+    def add(self, lease: SeatLease):
+        """
+        Adds given lease, replacing any previous one with the same id.
+        :param lease: The lease.
+        :type lease: org.acmsl.licdata.SeatLease
+        """
+        self.leases[lease.lease_id] = lease
+        self.lease_by_holder[lease.holder] = lease.lease_id
+        heapq.heappush(self.expiries, (lease.expires_at, lease.lease_id))
+
+    def remove(self, leaseId: str) -> bool:
+        """
+        Removes the lease with given id.
+        :param leaseId: The id of the lease.
+        :type leaseId: str
+        :return: True if it was active.
+        :rtype: bool
+        """
+        lease = self.leases.pop(leaseId, None)
+        if lease is None:
+            return False
+        del self.lease_by_holder[lease.holder]
+        return True
+
+    def reclaim(self, now: float) -> int:
+        """
+        Removes the leases expired at given time.
+        :param now: The time.
+        :type now: float
+        :return: The number of leases removed.
+        :rtype: int
+        """
+        result = 0
+        while self.expiries and self.expiries[0][0] <= now:
+            expires_at, lease_id = heapq.heappop(self.expiries)
+            lease = self.leases.get(lease_id)
+            # renewed leases leave their former expiry behind in the heap
+            if lease is not None and lease.expires_at == expires_at:
+                self.remove(lease_id)
+                result += 1
+        return result
+
+
+class SeatAllocator:
+    """
+    Checks out and releases the seats of floating licenses.
+
+    Class name: SeatAllocator
+
+    Responsibilities:
+        - Checks out a seat of a prelicense, if any is free, as a lease.
+        - Renews and releases leases.
+        - Reclaims the seats of expired leases, lazily and in bulk.
+
+    Collaborators:
+        - Prelicense: Defines the number of seats.
+        - SeatLease: The checked-out seats.
+
+    Each prelicense (by order id) has its own lock, so activations of
+    different prelicenses never wait for each other.
+    """
+
+    def __init__(
+        self, leaseDuration: float = 3600.0, clock: Callable[[], float] = time.time
+    ):
+        """
+        Creates a new SeatAllocator instance.
+        :param leaseDuration: How long leases last, in seconds, unless renewed.
+        :type leaseDuration: float
+        :param clock: Provides the current timestamp.
+        :type clock: Callable[[], float]
+        """
+        self._lease_duration = leaseDuration
+        self._clock = clock
+        self._pools: Dict[str, _SeatPool] = {}
+
+    @property
+    def lease_duration(self) -> float:
+        """
+        Retrieves how long leases last.
+        :return: Such duration, in seconds.
+        :rtype: float
+        """
+        return self._lease_duration
+
+    def _pool(self, orderId: str) -> _SeatPool:
+        """
+        Retrieves the pool of given prelicense.
+        :param orderId: The order id of the prelicense.
+        :type orderId: str
+        :return: Such pool.
+        :rtype: _SeatPool
+        """
+        result = self._pools.get(orderId)
+        if result is None:
+            result = self._pools.setdefault(orderId, _SeatPool())
+        return result
+
+    def checkout(self, prelicense: Prelicense, holder: str) -> Optional[SeatLease]:
+        """
+        Checks out a seat. If the holder already has one, it gets renewed.
+        :param prelicense: The prelicense.
+        :type prelicense: org.acmsl.licdata.Prelicense
+        :param holder: Who requests the seat, i.e. an installation code.
+        :type holder: str
+        :return: The lease, or None if all seats are in use.
+        :rtype: Optional[org.acmsl.licdata.SeatLease]
+        """
+        now = self._clock()
+        pool = self._pool(prelicense.order_id)
+        with pool.lock:
+            pool.reclaim(now)
+            lease_id = pool.lease_by_holder.get(holder)
+            if lease_id is None:
+                if len(pool.leases) >= prelicense.seats:
+                    return None
+                lease_id = uuid.uuid4().hex
+            result = SeatLease(
+                lease_id, prelicense.order_id, holder, now + self._lease_duration
+            )
+            pool.add(result)
+        return result
+
+    def renew(self, lease: SeatLease) -> Optional[SeatLease]:
+        """
+        Extends given lease.
+        :param lease: The lease.
+        :type lease: org.acmsl.licdata.SeatLease
+        :return: The renewed lease, or None if it had expired or been released.
+        :rtype: Optional[org.acmsl.licdata.SeatLease]
+        """
+        now = self._clock()
+        pool = self._pool(lease.order_id)
+        with pool.lock:
+            pool.reclaim(now)
+            if lease.lease_id not in pool.leases:
+                return None
+            result = SeatLease(
+                lease.lease_id, lease.order_id, lease.holder, now + self._lease_duration
+            )
+            pool.add(result)
+        return result
+
+    def release(self, lease: SeatLease) -> bool:
+        """
+        Releases given lease.
+        :param lease: The lease.
+        :type lease: org.acmsl.licdata.SeatLease
+        :return: True if it was active.
+        :rtype: bool
+        """
+        pool = self._pool(lease.order_id)
+        with pool.lock:
+            return pool.remove(lease.lease_id)
+
+    def in_use(self, orderId: str) -> int:
+        """
+        Retrieves the number of seats in use of given prelicense.
+        :param orderId: The order id of the prelicense.
+        :type orderId: str
+        :return: Such number.
+        :rtype: int
+        """
+        now = self._clock()
+        pool = self._pool(orderId)
+        with pool.lock:
+            pool.reclaim(now)
+            return len(pool.leases)
+
+    def expire(self) -> int:
+        """
+        Reclaims the seats of all expired leases.
+        :return: The number of leases reclaimed.
+        :rtype: int
+        """
+        now = self._clock()
+        result = 0
+        for pool in list(self._pools.values()):
+            with pool.lock:
+                result += pool.reclaim(now)
+        return result
@@ -0,0 +1,101 @@
+"""
+org/acmsl/licdata/seat_lease.py
+
+This file defines the SeatLease class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+class SeatLease:
+    """
+    A seat of a floating license, checked out until a given time.
+
+    Class name: SeatLease
+
+    Responsibilities:
+        - Identifies a checked-out seat, its prelicense and its holder.
+        - Knows when it expires.
+
+    Collaborators:
+        - Prelicense: The floating license the seat belongs to.
+    """
+
+    __slots__ = ("_lease_id", "_order_id", "_holder", "_expires_at")
+
+    def __init__(self, leaseId: str, orderId: str, holder: str, expiresAt: float):
+        """
+        Creates a new SeatLease instance.
+        :param leaseId: The id of the lease.
+        :type leaseId: str
+        :param orderId: The order id of the prelicense.
+        :type orderId: str
+        :param holder: Who holds the seat, i.e. an installation code.
+        :type holder: str
+        :param expiresAt: When the lease expires, as a timestamp.
+        :type expiresAt: float
+        """
+        self._lease_id = leaseId
+        self._order_id = orderId
+        self._holder = holder
+        self._expires_at = expiresAt
+
+    @property
+    def lease_id(self) -> str:
+        """
+        Retrieves the id of the lease.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._lease_id
+
+    @property
+    def order_id(self) -> str:
+        """
+        Retrieves the order id of the prelicense.
+        :return: Such id.
+        :rtype: str
+        """
+        return self._order_id
+
+    @property
+    def holder(self) -> str:
+        """
+        Retrieves who holds the seat.
+        :return: Such holder.
+        :rtype: str
+        """
+        return self._holder
+
+    @property
+    def expires_at(self) -> float:
+        """
+        Retrieves when the lease expires.
+        :return: Such timestamp.
+        :rtype: float
+        """
+        return self._expires_at
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of the lease.
+        :return: Such representation.
+        :rtype: str
+        """
+        return (
+            f"SeatLease(leaseId={self._lease_id!r}, orderId={self._order_id!r}, "
+            f"holder={self._holder!r}, expiresAt={self._expires_at!r})"
+        )
@@ -0,0 +1,153 @@
+"""
+org/acmsl/licdata/secondary_indexes.py
+
+This file defines the secondary_index decorator and the SecondaryIndexes class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .field_table import FieldTable
+from pythoneda.shared import Entity
+from typing import Any, Dict, FrozenSet, Set, Tuple
+
+
+def secondary_index(func):
+    """
+    Decorator to declare an attribute is indexed by the repositories.
+    It goes right below @property, i.e.
+        @property
+        @secondary_index
+        @attribute
+        def product_id(self) -> str:
+    :param func: The getter of the attribute.
+    :type func: Callable
+    :return: The same getter.
+    :rtype: Callable
+    """
+    func._secondary_index = True
+    return func
+
+
+class SecondaryIndexes:
+    """
+    The secondary indexes of a set of entities of the same class.
+
+    Class name: SecondaryIndexes
+
+    Responsibilities:
+        - Finds the attributes declared with @secondary_index.
+        - Maps each value of such attributes to the ids of the entities having it.
+        - Keeps the mapping up to date as entities are added, updated or removed.
+
+    Collaborators:
+        - FieldTable: Knows the attributes declared with @secondary_index.
+        - pythoneda.shared.Entity: The indexed entities.
+    """
+
+    def __init__(self, entityClass: type):
+        """
+        Creates a new SecondaryIndexes instance.
+        :param entityClass: The class of the indexed entities.
+        :type entityClass: type
+        """
+        self._entity_class = entityClass
+        self._attributes = self.indexed_attributes(entityClass)
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {
+            attribute: {} for attribute in self._attributes
+        }
+        self._indexed_values: Dict[str, Tuple[Any, ...]] = {}
+
+    @classmethod
+    def indexed_attributes(cls, entityClass: type) -> Tuple[str, ...]:
+        """
+        Retrieves the attributes of given class declared with @secondary_index.
+        :param entityClass: The entity class.
+        :type entityClass: type
+        :return: The names of such attributes.
+        :rtype: Tuple[str, ...]
+        """
+        return FieldTable.of(entityClass).indexed
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        """
+        Retrieves the indexed attributes.
+        :return: Their names.
+        :rtype: Tuple[str, ...]
+        """
+        return self._attributes
+
+    def add(self, entity: Entity):
+        """
+        Indexes given entity, replacing any previous entry for it.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        """
+        self.remove(entity.id)
+        values = tuple(getattr(entity, attribute) for attribute in self._attributes)
+        for attribute, value in zip(self._attributes, values):
+            self._indexes[attribute].setdefault(value, set()).add(entity.id)
+        self._indexed_values[entity.id] = values
+
+    def update(self, entity: Entity):
+        """
+        Reindexes given entity, after its attributes have changed.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        """
+        self.add(entity)
+
+    def remove(self, entityId: str):
+        """
+        Removes the entity with given id from the indexes.
+        :param entityId: The id of the entity.
+        :type entityId: str
+        """
+        values = self._indexed_values.pop(entityId, None)
+        if values is None:
+            return
+        for attribute, value in zip(self._attributes, values):
+            index = self._indexes[attribute]
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(entityId)
+                if not ids:
+                    del index[value]
+
+    def lookup(self, attribute: str, value: Any) -> FrozenSet[str]:
+        """
+        Retrieves the ids of the entities whose attribute has given value.
+        :param attribute: The name of the indexed attribute.
+        :type attribute: str
+        :param value: The value.
+        :type value: Any
+        :return: Such ids.
+        :rtype: FrozenSet[str]
+        """
+        index = self._indexes.get(attribute)
+        if index is None:
+            raise KeyError(
+                f"{self._entity_class.__name__}.{attribute} is not a secondary index"
+            )
+        return frozenset(index.get(value, ()))
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        for index in self._indexes.values():
+            index.clear()
+        self._indexed_values.clear()
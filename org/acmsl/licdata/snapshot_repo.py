@@ -0,0 +1,60 @@
+"""
+org/acmsl/licdata/snapshot_repo.py
+
+This file defines the SnapshotRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .entity_snapshot import EntitySnapshot
+import abc
+from pythoneda.shared import Port
+from typing import Optional
+
+
+class SnapshotRepo(Port, abc.ABC):
+    """
+    A port to persist entity snapshots.
+
+    Class name: SnapshotRepo
+
+    Responsibilities:
+        - Stores snapshots.
+        - Retrieves the latest snapshot of an entity.
+
+    Collaborators:
+        - EntitySnapshot: The persisted information.
+    """
+
+    @abc.abstractmethod
+    def find_latest(self, entityId: str) -> Optional[EntitySnapshot]:
+        """
+        Retrieves the latest snapshot of given entity.
+        :param entityId: The id of the entity.
+        :type entityId: str
+        :return: Such snapshot, or None if none has been taken.
+        :rtype: Optional[org.acmsl.licdata.EntitySnapshot]
+        """
+        pass
+
+    @abc.abstractmethod
+    def save(self, snapshot: EntitySnapshot):
+        """
+        Stores given snapshot.
+        :param snapshot: The snapshot.
+        :type snapshot: org.acmsl.licdata.EntitySnapshot
+        """
+        pass
@@ -0,0 +1,135 @@
+"""
+org/acmsl/licdata/snapshotter.py
+
+This file defines the Snapshotter class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .entity_snapshot import EntitySnapshot
+from .snapshot_repo import SnapshotRepo
+from pythoneda.shared import Entity, Event
+from typing import Callable, Iterable, Optional
+
+
+class Snapshotter:
+    """
+    Rebuilds event-sourced entities from their latest snapshot.
+
+    Class name: Snapshotter
+
+    Responsibilities:
+        - Starts from the latest snapshot of an entity, if any.
+        - Replays only the events after such snapshot.
+        - Takes a new snapshot once enough events have been replayed.
+
+    Collaborators:
+        - SnapshotRepo: Persists the snapshots.
+        - EntitySnapshot: The snapshots.
+        - pythoneda.shared.Entity: The entity class must provide a
+          `replay(event, entity, entityId)` classmethod, applying one event to
+          the entity built so far (None before its creation event), and
+          keeping the given id when replaying the creation event.
+    """
+
+    def __init__(
+        self, entityClass: type, snapshotRepo: SnapshotRepo, frequency: int = 100
+    ):
+        """
+        Creates a new Snapshotter instance.
+        :param entityClass: The class of the entities.
+        :type entityClass: type
+        :param snapshotRepo: The repository of snapshots.
+        :type snapshotRepo: org.acmsl.licdata.SnapshotRepo
+        :param frequency: The number of events to replay before taking a new
+        snapshot, or 0 to never take them.
+        :type frequency: int
+        """
+        if frequency < 0:
+            raise ValueError(f"Invalid snapshot frequency: {frequency}")
+        self._entity_class = entityClass
+        self._snapshot_repo = snapshotRepo
+        self._frequency = frequency
+
+    @property
+    def frequency(self) -> int:
+        """
+        Retrieves the number of events replayed before taking a new snapshot.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._frequency
+
+    def should_snapshot(self, eventsSinceSnapshot: int) -> bool:
+        """
+        Checks whether a snapshot is due.
+        :param eventsSinceSnapshot: The number of events applied after the latest one.
+        :type eventsSinceSnapshot: int
+        :return: True in such case.
+        :rtype: bool
+        """
+        return self._frequency > 0 and eventsSinceSnapshot >= self._frequency
+
+    def load(
+        self,
+        entityId: str,
+        eventsAfter: Callable[[Optional[str]], Iterable[Event]],
+    ) -> Optional[Entity]:
+        """
+        Rebuilds an entity. It raises ReplayError if an event comes before the
+        creation of the entity, and there's no snapshot.
+        :param entityId: The id of the entity.
+        :type entityId: str
+        :param eventsAfter: Provides the events of the entity, in order, after
+        the one with given id (or all of them, if None).
+        :type eventsAfter: Callable[[Optional[str]], Iterable[pythoneda.shared.Event]]
+        :return: The entity, or None if it has no events.
+        :rtype: Optional[pythoneda.shared.Entity]
+        """
+        snapshot = self._snapshot_repo.find_latest(entityId)
+        if snapshot is None:
+            result, last_event_id, version = None, None, 0
+        else:
+            result = snapshot.restore()
+            last_event_id = snapshot.last_event_id
+            version = snapshot.version
+
+        replayed = 0
+        for event in eventsAfter(last_event_id):
+            result = self._entity_class.replay(event, result, entityId)
+            last_event_id = event.id
+            replayed += 1
+
+        if result is not None and self.should_snapshot(replayed):
+            self.take(result, last_event_id, version + replayed)
+
+        return result
+
+    def take(self, entity: Entity, lastEventId: str, version: int) -> EntitySnapshot:
+        """
+        Takes a snapshot of given entity.
+        :param entity: The entity.
+        :type entity: pythoneda.shared.Entity
+        :param lastEventId: The id of the last event applied to it.
+        :type lastEventId: str
+        :param version: The number of events applied to it.
+        :type version: int
+        :return: The snapshot.
+        :rtype: org.acmsl.licdata.EntitySnapshot
+        """
+        result = EntitySnapshot(entity, lastEventId, version)
+        self._snapshot_repo.save(result)
+        return result
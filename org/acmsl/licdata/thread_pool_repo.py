@@ -0,0 +1,114 @@
+"""
+org/acmsl/licdata/thread_pool_repo.py
+
+This file defines the ThreadPoolRepo class.
+
+Copyright (C) 2024-today ACM S.L. Licdata-Domain
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from .inline_repo import InlineRepo
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+from typing import Any, Optional
+
+
+class ThreadPoolRepo(InlineRepo):
+    """
+    Runs the operations of a synchronous repository in a thread pool.
+
+    Class name: ThreadPoolRepo
+
+    Responsibilities:
+        - Adapts synchronous repositories whose operations block to the
+          AsyncRepo contract.
+        - Keeps many storage round trips in flight, one per pool thread,
+          without blocking the event loop.
+
+    Collaborators:
+        - AsyncRepo: The contract it implements.
+        - InlineRepo: Delegates the operations.
+        - BaseRepo: The synchronous repositories it adapts, once they declare
+          they block.
+    """
+
+    _max_workers = 256
+    _default_executor = None
+    _default_executor_lock = threading.Lock()
+
+    def __init__(self, delegate: Any, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Creates a new ThreadPoolRepo instance.
+        :param delegate: The synchronous repository.
+        :type delegate: org.acmsl.licdata.BaseRepo
+        :param executor: The pool to use. Defaults to one shared by all instances.
+        :type executor: Optional[concurrent.futures.ThreadPoolExecutor]
+        """
+        super().__init__(delegate)
+        self._executor = executor
+
+    @classmethod
+    def configure(cls, maxWorkers: int):
+        """
+        Sets the size of the shared pool. It must be called before its first use,
+        since the pool cannot be resized afterwards.
+        :param maxWorkers: The maximum number of concurrent storage calls.
+        :type maxWorkers: int
+        """
+        if maxWorkers < 1:
+            raise ValueError(f"Invalid number of workers: {maxWorkers}")
+        with ThreadPoolRepo._default_executor_lock:
+            if ThreadPoolRepo._default_executor is not None:
+                raise ValueError(
+                    "The shared pool is in use already, with "
+                    f"{ThreadPoolRepo._max_workers} workers"
+                )
+            ThreadPoolRepo._max_workers = maxWorkers
+
+    @classmethod
+    def default_executor(cls) -> ThreadPoolExecutor:
+        """
+        Retrieves the pool shared by all instances without one of their own.
+        :return: Such pool.
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+        result = ThreadPoolRepo._default_executor
+        if result is None:
+            with ThreadPoolRepo._default_executor_lock:
+                result = ThreadPoolRepo._default_executor
+                if result is None:
+                    result = ThreadPoolExecutor(
+                        max_workers=ThreadPoolRepo._max_workers,
+                        thread_name_prefix="licdata-repo",
+                    )
+                    ThreadPoolRepo._default_executor = result
+        return result
+
+    async def _call(self, operation: str, *args) -> Any:
+        """
+        Runs an operation of the synchronous repository in the pool.
+        :param operation: The name of the operation.
+        :type operation: str
+        :param args: Its arguments.
+        :type args: Tuple
+        :return: Its outcome.
+        :rtype: Any
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor or self.default_executor(),
+            functools.partial(getattr(self._delegate, operation), *args),
+        )
@@ -19,17 +19,20 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pythoneda.shared import (
+from .event_history import EventHistory
+from .field_table import (
     attribute,
-    Entity,
-    EventReference,
     filter_attribute,
     primary_key_attribute,
     sensitive,
+    with_field_table,
 )
-from typing import List
+from .secondary_indexes import secondary_index
+from pythoneda.shared import Entity, EventReference
+from typing import List, Optional
 
 
+@with_field_table
 class User(Entity):
     """
     Represents an user.
@@ -43,8 +46,13 @@ class User(Entity):
         - None
     """
 
+    __slots__ = ("_email", "_password", "_primary_key")
+
     def __init__(
-        self, email: str, password: str, eventHistory: List[EventReference] = []
+        self,
+        email: str,
+        password: str,
+        eventHistory: Optional[List[EventReference]] = None,
     ):
         """
         Creates a new User instance.
@@ -53,13 +61,16 @@ class User(Entity):
         :param password: The password
         :type password: str
         :param eventHistory: The event history.
-        :type eventHistory: List[pythoneda.shared.EventReference]
+        :type eventHistory: Optional[List[pythoneda.shared.EventReference]]
         """
         self._email = email
         self._password = password
-        super().__init__(eventHistory=eventHistory)
+        super().__init__(
+            eventHistory=EventHistory.for_entity(self.__class__, eventHistory)
+        )
 
     @property
+    @secondary_index
     @filter_attribute
     def email(self) -> str:
         """
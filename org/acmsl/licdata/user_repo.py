@@ -19,13 +19,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from .base_repo import BaseRepo
 from .user import User
-from pythoneda.shared import Repo
 
 
-class UserRepo(Repo):
+class UserRepo(BaseRepo):
     """
-    A subclass of Repo that manages Users.
+    A subclass of BaseRepo that manages Users.
 
     Class name: UserRepo
 